@@ -18,6 +18,8 @@ CUSTOM_PYTHONHASHSEED=$(curl --silent --fail http://metadata.google.internal/com
 
 ZONE=$(curl --silent http://metadata.google.internal/computeMetadata/v1/instance/attributes/zone -H "Metadata-Flavor: Google")
 BASE_PATH=$(curl --silent http://metadata.google.internal/computeMetadata/v1/instance/attributes/base_path -H "Metadata-Flavor: Google")
+# Directory of the job's config.pickle, empty to use the config baked into the docker image
+CONFIG_DIR=$(curl --silent --fail http://metadata.google.internal/computeMetadata/v1/instance/attributes/config_dir -H "Metadata-Flavor: Google" || echo "")
 
 echo '=========== Training: downloading docker image ============'
 gcloud auth configure-docker --quiet {{cookiecutter.gcp_docker_registry}}-docker.pkg.dev
@@ -27,6 +29,7 @@ echo '=========== TRAINING: start  ============'
 docker run --init --rm --gpus all --ipc host --user root --hostname "$(hostname)" --privileged \
   --log-driver=gcplogs -v /mnt:/mnt:ro \
   -e BASE_PATH="${BASE_PATH}" \
+  -e CONFIG_DIR="${CONFIG_DIR}" \
   -e PYTHONHASHSEED="${CUSTOM_PYTHONHASHSEED}" \
   ${GCP_DOCKER_REGISTRY_URL} \
   python -u -m {{cookiecutter.project_name}}.train ||
@@ -36,6 +39,7 @@ echo '=========== EVALUATION: start  ============'
 docker run --init --rm --gpus all --ipc host --user root --hostname "$(hostname)" --privileged \
   --log-driver=gcplogs -v /mnt:/mnt:ro \
   -e BASE_PATH="${BASE_PATH}" \
+  -e CONFIG_DIR="${CONFIG_DIR}" \
   -e PYTHONHASHSEED="${CUSTOM_PYTHONHASHSEED}" \
   ${GCP_DOCKER_REGISTRY_URL} \
   python -u -m {{cookiecutter.project_name}}.evaluate ||
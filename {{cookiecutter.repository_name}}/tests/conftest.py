@@ -1,7 +1,45 @@
-from typing import Literal
+import logging
+
+from pathlib import Path
+from typing import Iterator, Literal
+
 import pytest
 
+from {{cookiecutter.project_name}}.utils import config_utils
+
+# Like custom.yaml, without writing logs.log to the working directory
+CONSOLE_LOGGING_CONFIG = """
+version: 1
+handlers:
+  console:
+    class: logging.StreamHandler
+    stream: ext://sys.stdout
+root:
+  level: INFO
+  handlers: [console]
+disable_existing_loggers: false
+"""
+
 
 @pytest.fixture
 def two() -> Literal[2]:
     return 2
+
+
+@pytest.fixture
+def console_logging(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """
+    Makes `setup_logger` log to the console only and restores the root logger afterwards.
+    """
+    (tmp_path / "logging.yaml").write_text(CONSOLE_LOGGING_CONFIG)
+    monkeypatch.setattr(config_utils, "LOGGING_CONFIG_PATH", str(tmp_path / "logging.yaml"))
+    root_logger = logging.getLogger()
+    handlers, level = root_logger.handlers[:], root_logger.level
+    yield
+    config_utils.stop_logger()
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+        handler.close()
+    for handler in handlers:
+        root_logger.addHandler(handler)
+    root_logger.setLevel(level)
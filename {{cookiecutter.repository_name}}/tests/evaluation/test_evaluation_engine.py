@@ -0,0 +1,139 @@
+import base64
+import csv
+import hashlib
+
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Sequence
+
+import pytest
+
+from {{cookiecutter.project_name}}.config_schemas.evaluation_schema import EvaluationConfig
+from {{cookiecutter.project_name}}.evaluation import evaluation_engine
+from {{cookiecutter.project_name}}.evaluation.evaluation_engine import EvaluateFunction, EvaluationEngine, compute_file_hash
+
+METRIC_SCALES = {"accuracy": 1.0, "f1": 2.0}
+
+
+def evaluate_checkpoint(checkpoint_path: str, dataset_path: str, metric_names: Sequence[str]) -> dict[str, float]:
+    if "broken" in checkpoint_path:
+        raise ValueError("Can not load checkpoint")
+    size = len(Path(checkpoint_path).read_bytes())
+    if "partial" in checkpoint_path:
+        return {"accuracy": float(size)}
+    return {metric_name: size * METRIC_SCALES[metric_name] for metric_name in metric_names}
+
+
+def evaluate_checkpoint_v2(checkpoint_path: str, dataset_path: str, metric_names: Sequence[str]) -> dict[str, float]:
+    metric_values = evaluate_checkpoint(checkpoint_path, dataset_path, metric_names)
+    return {metric_name: -value for metric_name, value in metric_values.items()}
+
+
+def create_engine(
+    tmp_path: Path, metric_names: list[str], evaluate_function: EvaluateFunction = evaluate_checkpoint
+) -> EvaluationEngine:
+    return EvaluationEngine(
+        evaluate_function,
+        metric_names,
+        dataset_path=str(tmp_path / "dataset.csv"),
+        checkpoints_dir=str(tmp_path / "run"),
+        output_dir=str(tmp_path / "run" / "evaluation"),
+        max_workers=2,
+    )
+
+
+@pytest.fixture
+def run_dir(tmp_path: Path) -> Path:
+    (tmp_path / "dataset.csv").write_text("text,label\n")
+    (tmp_path / "run" / "epoch_1").mkdir(parents=True)
+    (tmp_path / "run" / "epoch_1" / "model.ckpt").write_bytes(b"a")
+    (tmp_path / "run" / "model.ckpt").write_bytes(b"bb")
+    (tmp_path / "run" / "notes.txt").write_text("not a checkpoint")
+    return tmp_path
+
+
+def test_only_missing_metrics_are_computed(run_dir: Path) -> None:
+    report = create_engine(run_dir, ["accuracy"]).run()
+    assert (report.computed_cells, report.cached_cells) == (2, 0)
+
+    report = create_engine(run_dir, ["accuracy", "f1"]).run()
+    assert (report.computed_cells, report.cached_cells) == (2, 2)
+
+    report = create_engine(run_dir, ["accuracy", "f1"]).run()
+    assert (report.computed_cells, report.cached_cells) == (0, 4)
+
+    with open(run_dir / "run" / "evaluation" / "results.csv") as f:
+        rows = list(csv.DictReader(f))
+    assert [(Path(row["checkpoint_path"]).parent.name, row["accuracy"], row["f1"]) for row in rows] == [
+        ("epoch_1", "1.0", "2.0"),
+        ("run", "2.0", "4.0"),
+    ]
+
+
+def test_results_are_keyed_by_content_not_path(run_dir: Path) -> None:
+    create_engine(run_dir, ["accuracy"]).run()
+    (run_dir / "run" / "model.ckpt").rename(run_dir / "run" / "renamed.ckpt")
+    (run_dir / "run" / "epoch_1" / "model.ckpt").write_bytes(b"c")
+
+    report = create_engine(run_dir, ["accuracy"]).run()
+    assert (report.computed_cells, report.cached_cells) == (1, 1)
+    assert compute_file_hash(str(run_dir / "run" / "renamed.ckpt")) == report.rows[1]["checkpoint_hash"]
+
+
+def test_checkpoint_hash_is_the_same_in_every_store(tmp_path: Path) -> None:
+    (tmp_path / "model.ckpt").write_bytes(b"weights")
+    md5_digest = hashlib.md5(b"weights").digest()
+    gcs_file_system = SimpleNamespace(info=lambda path: {"md5Hash": base64.b64encode(md5_digest).decode()})
+
+    assert compute_file_hash(str(tmp_path / "model.ckpt")) == f"md5:{md5_digest.hex()}"
+    gcs_hash = evaluation_engine._compute_file_system_hash(gcs_file_system, "gs://bucket/model.ckpt")
+    assert gcs_hash == f"md5:{md5_digest.hex()}"
+
+
+def test_results_are_recomputed_for_another_evaluate_function(run_dir: Path) -> None:
+    create_engine(run_dir, ["accuracy"]).run()
+
+    report = create_engine(run_dir, ["accuracy"], evaluate_checkpoint_v2).run()
+    assert (report.computed_cells, report.cached_cells) == (2, 0)
+    assert [row["accuracy"] for row in report.rows] == [-1.0, -2.0]
+
+
+def test_failed_checkpoints_are_retried_on_next_run(run_dir: Path) -> None:
+    (run_dir / "run" / "broken.ckpt").write_bytes(b"")
+
+    with pytest.raises(RuntimeError, match="broken.ckpt"):
+        create_engine(run_dir, ["accuracy"]).run()
+
+    (run_dir / "run" / "broken.ckpt").unlink()
+    report = create_engine(run_dir, ["accuracy"]).run()
+    assert (report.computed_cells, report.cached_cells) == (0, 2)
+
+
+def test_missing_metrics_fail_only_their_checkpoint(run_dir: Path) -> None:
+    (run_dir / "run" / "partial.ckpt").write_bytes(b"ccc")
+
+    with pytest.raises(RuntimeError, match="partial.ckpt"):
+        create_engine(run_dir, ["accuracy", "f1"]).run()
+
+    (run_dir / "run" / "partial.ckpt").unlink()
+    report = create_engine(run_dir, ["accuracy", "f1"]).run()
+    assert (report.computed_cells, report.cached_cells) == (0, 4)
+
+
+def test_engine_from_config(run_dir: Path) -> None:
+    evaluation_config = EvaluationConfig(
+        evaluate_function=f"{__name__}.evaluate_checkpoint",
+        dataset_path=str(run_dir / "dataset.csv"),
+        metric_names=["f1"],
+        max_workers=1,
+    )
+    config = SimpleNamespace(
+        infrastructure=SimpleNamespace(base_path=lambda: str(run_dir / "run")), evaluation=evaluation_config
+    )
+
+    report = EvaluationEngine.from_config(config).run()  # type: ignore
+
+    assert [row["f1"] for row in report.rows] == [2.0, 4.0]
+    assert (run_dir / "run" / "evaluation" / "results.csv").exists()
+    with pytest.raises(ValueError, match="evaluate_function"):
+        EvaluationEngine.from_config(SimpleNamespace(evaluation=EvaluationConfig()))  # type: ignore
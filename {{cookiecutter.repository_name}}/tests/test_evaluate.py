@@ -0,0 +1,28 @@
+from pathlib import Path
+
+import pytest
+
+from {{cookiecutter.project_name}}.evaluate import evaluate
+from {{cookiecutter.project_name}}.utils.config_utils import CONFIG_DIR_ENV_VARIABLE, compose_config, save_config_as_pickle
+
+
+def test_evaluation_is_skipped_with_the_default_config(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, console_logging: None
+) -> None:
+    config = compose_config(
+        "../configs/",
+        "config",
+        [
+            "job_info.task_id=evaluate",
+            "job_info.experiment_name=evaluate",
+            "infrastructure.vm_config.docker_image_tag=evaluate",
+            f"infrastructure.gcs_bucket={tmp_path / 'bucket'}",
+        ],
+        to_object=True,
+    )
+    save_config_as_pickle(config, str(tmp_path / "config.pickle"))
+    monkeypatch.setenv(CONFIG_DIR_ENV_VARIABLE, str(tmp_path))
+
+    evaluate()
+
+    assert not (tmp_path / "bucket").exists()
@@ -0,0 +1,49 @@
+from pathlib import Path
+
+from {{cookiecutter.project_name}}.utils.artifact_index import (
+    LATEST_FILE_NAME,
+    get_latest_artifact,
+    read_manifest,
+    register_artifact,
+)
+from {{cookiecutter.project_name}}.utils.utils import get_latest_filename
+
+
+def test_get_latest_filename_compares_all_numeric_groups() -> None:
+    file_names = ["epoch_10-step_1.ckpt", "epoch_2-step_30.ckpt", "epoch_9-step_100.ckpt"]
+
+    assert get_latest_filename(file_names) == "epoch_10-step_1.ckpt"
+    assert file_names == ["epoch_10-step_1.ckpt", "epoch_2-step_30.ckpt", "epoch_9-step_100.ckpt"]
+
+
+def test_latest_artifact_is_resolved_from_the_index(tmp_path: Path) -> None:
+    for step in [1, 3, 2]:
+        (tmp_path / f"step_{step}.ckpt").write_bytes(b"")
+        register_artifact(str(tmp_path / f"step_{step}.ckpt"), step=step, loss=1.0 / step)
+
+    assert get_latest_artifact(str(tmp_path)) == str(tmp_path / "step_3.ckpt")
+    assert [(entry["name"], entry["step"]) for entry in read_manifest(str(tmp_path))] == [
+        ("step_1.ckpt", 1),
+        ("step_3.ckpt", 3),
+        ("step_2.ckpt", 2),
+    ]
+
+
+def test_latest_artifact_falls_back_to_a_scan(tmp_path: Path) -> None:
+    assert get_latest_artifact(str(tmp_path)) is None
+
+    for step in [1, 3, 2]:
+        (tmp_path / f"step_{step}.ckpt").write_bytes(b"")
+
+    assert get_latest_artifact(str(tmp_path)) == str(tmp_path / "step_3.ckpt")
+
+
+def test_index_and_scan_resolve_the_same_artifact(tmp_path: Path) -> None:
+    for step in [1, 3, 2]:
+        (tmp_path / f"step_{step}.ckpt").write_bytes(b"")
+        register_artifact(str(tmp_path / f"step_{step}.ckpt"), step=step)
+    latest_from_index = get_latest_artifact(str(tmp_path))
+
+    (tmp_path / LATEST_FILE_NAME).unlink()
+
+    assert get_latest_artifact(str(tmp_path)) == latest_from_index == str(tmp_path / "step_3.ckpt")
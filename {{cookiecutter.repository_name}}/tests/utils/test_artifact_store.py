@@ -0,0 +1,51 @@
+import hashlib
+
+from pathlib import Path
+
+from {{cookiecutter.project_name}}.utils.artifact_store import ArtifactStore
+
+
+def create_run_outputs(run_dir: Path, weights: bytes) -> dict[str, str]:
+    run_dir.mkdir(parents=True)
+    (run_dir / "vocabulary.txt").write_text("a\nb\n")
+    (run_dir / "weights.bin").write_bytes(weights)
+    return {name: str(run_dir / name) for name in ["vocabulary.txt", "weights.bin"]}
+
+
+def test_identical_blobs_are_uploaded_once(tmp_path: Path) -> None:
+    store = ArtifactStore(str(tmp_path / "cas"))
+
+    first_entries = store.store_run_artifacts(
+        create_run_outputs(tmp_path / "run_1", b"1"), str(tmp_path / "run_1" / "manifest.json")
+    )
+    second_entries = store.store_run_artifacts(
+        create_run_outputs(tmp_path / "run_2", b"2"), str(tmp_path / "run_2" / "manifest.json")
+    )
+
+    assert [entry.uploaded for entry in first_entries.values()] == [True, True]
+    assert [entry.uploaded for entry in second_entries.values()] == [False, True]
+    assert first_entries["vocabulary.txt"].digest == hashlib.sha256(b"a\nb\n").hexdigest()
+    assert not list((tmp_path / "cas").rglob("*.tmp"))
+    assert len([path for path in (tmp_path / "cas").rglob("*") if path.is_file()]) == 3
+
+
+def test_run_artifacts_are_restored_from_the_manifest(tmp_path: Path) -> None:
+    store = ArtifactStore(str(tmp_path / "cas"))
+    manifest_path = str(tmp_path / "run" / "manifest.json")
+    store.store_run_artifacts(create_run_outputs(tmp_path / "run", b"weights"), manifest_path)
+
+    restored_paths = store.restore_run_artifacts(manifest_path, str(tmp_path / "restored"))
+
+    assert Path(restored_paths["weights.bin"]).read_bytes() == b"weights"
+    assert Path(restored_paths["vocabulary.txt"]).read_text() == "a\nb\n"
+
+
+def test_directories_are_stored_in_remote_file_systems(tmp_path: Path) -> None:
+    store = ArtifactStore("memory://cas")
+    create_run_outputs(tmp_path / "run", b"weights")
+
+    entries = store.put_dir(str(tmp_path / "run"))
+
+    assert sorted(entries) == ["vocabulary.txt", "weights.bin"]
+    assert all(store.has_blob(entry.digest) for entry in entries.values())
+    assert [entry.uploaded for entry in store.put_dir(str(tmp_path / "run")).values()] == [False, False]
@@ -0,0 +1,125 @@
+import logging
+import sys
+
+from dataclasses import dataclass, field
+from datetime import timedelta
+from functools import partial
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import pytest
+
+from {{cookiecutter.project_name}}.utils import config_utils
+from {{cookiecutter.project_name}}.utils.config_utils import custom_instantiate, get_config, resolve_target
+from {{cookiecutter.project_name}}.utils.utils import ForkSafeQueueHandler, get_logger
+
+HYDRA_CONFIG = """
+defaults:
+  - override hydra/job_logging: colorlog
+  - _self_
+
+hydra:
+  output_subdir: null
+  run:
+    dir: .
+
+seed: 1
+"""
+
+
+@dataclass
+class TimedeltaConfig:
+    _target_: str = "datetime.timedelta"
+    days: int = 1
+
+
+@dataclass
+class PartialTimedeltaConfig(TimedeltaConfig):
+    _partial_: bool = True
+
+
+@dataclass
+class ContainerConfig:
+    _target_: str = "builtins.dict"
+    single: TimedeltaConfig = field(default_factory=TimedeltaConfig)
+    many: list[TimedeltaConfig] = field(default_factory=lambda: [TimedeltaConfig(days=2), TimedeltaConfig(days=3)])
+    weights: list[float] = field(default_factory=lambda: [0.1, 0.2])
+
+
+@dataclass
+class NonRecursiveContainerConfig(ContainerConfig):
+    _recursive_: bool = False
+
+
+def test_custom_instantiate() -> None:
+    assert custom_instantiate(TimedeltaConfig(days=4)) == timedelta(days=4)
+
+
+def test_custom_instantiate_partial() -> None:
+    instantiated = custom_instantiate(PartialTimedeltaConfig())
+    assert isinstance(instantiated, partial)
+    assert instantiated(hours=1) == timedelta(days=1, hours=1)
+
+
+def test_custom_instantiate_recursive() -> None:
+    config = ContainerConfig()
+    instantiated = custom_instantiate(config)
+    assert instantiated["single"] == timedelta(days=1)
+    assert instantiated["many"] == [timedelta(days=2), timedelta(days=3)]
+    assert instantiated["weights"] is config.weights
+
+
+def test_custom_instantiate_non_recursive() -> None:
+    config = NonRecursiveContainerConfig()
+    instantiated = custom_instantiate(config)
+    assert instantiated["single"] is config.single
+
+
+def test_custom_instantiate_from_dict() -> None:
+    assert custom_instantiate({"_target_": "datetime.timedelta", "hours": 2}) == timedelta(hours=2)
+
+
+class Schedule(NamedTuple):
+    warmup: Any
+    decay: Any
+
+
+def test_custom_instantiate_rebuilds_named_tuples() -> None:
+    config = {"_target_": "builtins.dict", "schedule": Schedule(TimedeltaConfig(days=2), 0.5)}
+    instantiated = custom_instantiate(config)
+    assert instantiated["schedule"] == Schedule(timedelta(days=2), 0.5)
+    assert isinstance(instantiated["schedule"], Schedule)
+
+
+def test_custom_instantiate_without_target() -> None:
+    with pytest.raises(ValueError):
+        custom_instantiate({"days": 1})
+
+
+def test_resolve_target_is_cached() -> None:
+    resolve_target.cache_clear()
+    resolve_target("datetime.timedelta")
+    resolve_target("datetime.timedelta")
+    assert resolve_target.cache_info().hits == 1
+
+
+def test_log_queue_is_installed_after_hydra_configured_logging(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, console_logging: None
+) -> None:
+    (tmp_path / "configs").mkdir()
+    (tmp_path / "configs" / "logging_test.yaml").write_text(HYDRA_CONFIG)
+    monkeypatch.setattr(sys, "argv", ["task.py", "--config-dir", str(tmp_path / "configs")])
+    # Hydra's job logging writes <job name>.log to the working directory
+    monkeypatch.chdir(tmp_path)
+    root_handlers = []
+
+    @get_config(config_path="../configs", config_name="logging_test")
+    def task(config: Any) -> None:
+        root_handlers.extend(logging.getLogger().handlers)
+        get_logger(__name__).info(f"running with seed {config['seed']}")
+
+    task(None)
+    config_utils.stop_logger()
+
+    assert len(root_handlers) == 1 and isinstance(root_handlers[0], ForkSafeQueueHandler)
+    assert "running with seed 1" in next(tmp_path.glob("*.log")).read_text()
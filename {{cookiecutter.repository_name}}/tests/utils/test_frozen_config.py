@@ -0,0 +1,72 @@
+import pickle
+
+from dataclasses import field
+from enum import Enum
+
+import pytest
+
+from pydantic.dataclasses import dataclass
+
+from {{cookiecutter.project_name}}.utils.frozen_config import FrozenDict, freeze_config
+from {{cookiecutter.project_name}}.utils.mixins import DictExpansionMixin
+
+
+class Mode(Enum):
+    FAST = "FAST"
+
+
+@dataclass
+class InnerConfig(DictExpansionMixin):
+    name: str = "inner"
+    labels: dict[str, str] = field(default_factory=lambda: {"env": "dev"})
+
+
+@dataclass
+class OuterConfig(DictExpansionMixin):
+    inner: InnerConfig = field(default_factory=InnerConfig)
+    sizes: list[int] = field(default_factory=lambda: [1, 2])
+    mode: Mode = Mode.FAST
+
+    def describe(self) -> str:
+        return f"{self.inner.name}-{len(self.sizes)}"
+
+
+def test_frozen_config_keeps_fields_methods_and_expansion() -> None:
+    frozen_config = freeze_config(OuterConfig())
+
+    assert frozen_config.inner.name == "inner"
+    assert frozen_config.sizes == (1, 2)
+    assert frozen_config.mode is Mode.FAST
+    assert frozen_config.describe() == "inner-2"
+    assert dict(**frozen_config.inner) == {"name": "inner", "labels": {"env": "dev"}}
+    assert not hasattr(frozen_config, "__dict__")
+
+
+def test_frozen_config_is_read_only() -> None:
+    frozen_config = freeze_config(OuterConfig())
+
+    with pytest.raises(AttributeError):
+        frozen_config.inner = InnerConfig()
+    with pytest.raises(TypeError):
+        frozen_config.inner.labels["env"] = "prod"
+
+
+def test_frozen_config_is_a_hashable_mapping() -> None:
+    frozen_config = freeze_config(OuterConfig())
+
+    assert hash(frozen_config) == hash(freeze_config(OuterConfig()))
+    assert len({frozen_config, freeze_config(OuterConfig()), freeze_config(OuterConfig(sizes=[3]))}) == 2
+    assert frozen_config["sizes"] == (1, 2)
+    with pytest.raises(KeyError):
+        frozen_config["missing"]
+    with pytest.raises(KeyError):
+        frozen_config["describe"]
+
+
+def test_frozen_config_can_be_pickled() -> None:
+    frozen_config = freeze_config(OuterConfig())
+
+    unpickled_config = pickle.loads(pickle.dumps(frozen_config))
+    assert unpickled_config == frozen_config
+    assert type(unpickled_config) is type(frozen_config)
+    assert isinstance(unpickled_config.inner.labels, FrozenDict)
@@ -0,0 +1,113 @@
+import gzip
+import os
+
+from pathlib import Path
+
+import pytest
+
+from {{cookiecutter.project_name}}.utils.io_utils import (
+    COMPRESSION_PACKAGES,
+    LineIndex,
+    choose_file_system,
+    copy_file,
+    iter_jsonl,
+    iter_lines,
+    load_json,
+    open_file,
+    write_file,
+)
+from {{cookiecutter.project_name}}.utils.utils import read_lines
+
+TEXT = '{"loss": 0.5, "step": 10}\n' * 1000
+
+
+@pytest.mark.parametrize("suffix", [".gz", ".zst", ".lz4"])
+def test_compression_is_inferred_from_suffix(tmp_path: Path, suffix: str) -> None:
+    if suffix == ".lz4":
+        # lz4 is an optional dependency
+        pytest.importorskip("lz4")
+    path = str(tmp_path / f"metrics.jsonl{suffix}")
+
+    with open_file(path, "w") as f:
+        f.write(TEXT)
+
+    assert Path(path).stat().st_size < len(TEXT) / 10
+    with open_file(path, "r") as f:
+        assert f.read() == TEXT
+
+
+def test_codecs_with_missing_packages_fail_loudly(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(COMPRESSION_PACKAGES, "lz4", "missing_lz4_package")
+
+    with pytest.raises(ImportError, match="missing_lz4_package"):
+        write_file(str(tmp_path / "metrics.jsonl.lz4"), "w", lambda f: f.write(TEXT))  # type: ignore
+    assert not (tmp_path / "metrics.jsonl.lz4").exists()
+
+
+def test_compressed_writes_are_finalized_in_remote_file_systems() -> None:
+    write_file("memory://compression/config.json.gz", "w", lambda f: f.write('{"seed": 1}'))  # type: ignore
+
+    assert load_json("memory://compression/config.json.gz") == {"seed": 1}
+    with choose_file_system("memory://").open("memory://compression/config.json.gz", "rb") as f:
+        assert gzip.decompress(f.read()) == b'{"seed": 1}'
+
+
+def test_files_are_copied_without_recompression(tmp_path: Path) -> None:
+    (tmp_path / "data.csv.gz").write_bytes(gzip.compress(b"a,b\n", mtime=0))
+
+    copy_file(str(tmp_path / "data.csv.gz"), str(tmp_path / "copy.csv.gz"))
+
+    assert (tmp_path / "copy.csv.gz").read_bytes() == (tmp_path / "data.csv.gz").read_bytes()
+
+
+@pytest.mark.parametrize("path", ["local", "memory://lines/labels.txt", "local.gz"])
+def test_lines_are_streamed_across_chunks(tmp_path: Path, path: str) -> None:
+    path = str(tmp_path / "labels.txt.gz") if path == "local.gz" else path
+    path = str(tmp_path / "labels.txt") if path == "local" else path
+    write_file(path, "wb", lambda f: f.write("cat\r\n\ndog\nbïrd".encode()))  # type: ignore
+
+    assert list(iter_lines(path, chunk_size=3)) == ["cat", "", "dog", "bïrd"]
+    assert read_lines(path) == ["cat", "", "dog", "bïrd"]
+
+
+def test_jsonl_records_are_streamed(tmp_path: Path) -> None:
+    (tmp_path / "metrics.jsonl").write_text(TEXT + "\n")
+
+    records = iter_jsonl(str(tmp_path / "metrics.jsonl"), chunk_size=7)
+
+    assert next(records) == {"loss": 0.5, "step": 10}
+    assert len(list(records)) == 999
+
+
+@pytest.mark.parametrize("path", ["local", "memory://lines/manifest.txt"])
+def test_lines_are_read_by_offset(tmp_path: Path, path: str) -> None:
+    path = str(tmp_path / "manifest.txt") if path == "local" else path
+    lines = [f"sample-{i}" * (i % 3 + 1) for i in range(100)]
+    write_file(path, "w", lambda f: f.write("\n".join(lines)))  # type: ignore
+
+    line_index = LineIndex.build(path, chunk_size=16)
+    line_index.save(str(tmp_path / "manifest.index"))
+    loaded_index = LineIndex.load(path, str(tmp_path / "manifest.index"))
+
+    assert len(loaded_index) == 100
+    assert loaded_index[41] == "sample-41" * 3
+    assert loaded_index.read_lines(97, 100) == lines[97:]
+    with pytest.raises(IndexError):
+        loaded_index.read_lines(99, 101)
+    with pytest.raises(ValueError, match="compressed"):
+        LineIndex.build(str(tmp_path / "manifest.txt.gz"))
+
+
+def test_stale_line_index_is_rebuilt(tmp_path: Path) -> None:
+    path = tmp_path / "manifest.txt"
+    path.write_text("a\nb\n")
+    LineIndex.build(str(path)).save(str(tmp_path / "manifest.index"))
+
+    path.write_text("a\nb\nc\n")
+    assert LineIndex.load(str(path), str(tmp_path / "manifest.index")).read_lines(0, 3) == ["a", "b", "c"]
+
+    # Same size, rewritten later
+    LineIndex.build(str(path)).save(str(tmp_path / "manifest.index"))
+    path.write_text("cc\nd\n")
+    os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 1_000_000_000))
+    assert LineIndex.load(str(path), str(tmp_path / "manifest.index")).read_lines(0, 2) == ["cc", "d"]
@@ -0,0 +1,135 @@
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from {{cookiecutter.project_name}}.utils.job_launcher import JobLauncher
+from {{cookiecutter.project_name}}.utils.job_scheduler import JobScheduler, JobState
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeBackend(JobLauncher):
+    def __init__(self, clock: FakeClock, launch_duration_s: float = 5.0) -> None:
+        self.clock = clock
+        self.launch_duration_s = launch_duration_s
+        self.running_clusters: set[str] = set()
+        self.unreachable_clusters: set[str] = set()
+
+    def launch(self, config: Any) -> str:
+        if "broken" in config.job_info.job_id:
+            raise RuntimeError("Instance template creation failed")
+        self.clock.now += self.launch_duration_s
+        cluster_id = f"{config.job_info.job_id}-t"
+        self.running_clusters.add(cluster_id)
+        return cluster_id
+
+    def is_running(self, config: Any, job_id: str) -> bool:
+        if job_id in self.unreachable_clusters:
+            raise ConnectionError("Compute API unavailable")
+        return job_id in self.running_clusters
+
+    def terminate(self, config: Any, job_id: str) -> None:
+        self.running_clusters.discard(job_id)
+
+
+def create_config(name: str, accelerator_type: str = "a100", accelerator_count: int = 1, priority: int = 0) -> Any:
+    machine = SimpleNamespace(accelerator_type=accelerator_type, accelerator_count=accelerator_count)
+    return SimpleNamespace(
+        job_info=SimpleNamespace(job_id=name),
+        infrastructure=SimpleNamespace(
+            vm_config=SimpleNamespace(machine=machine, node_count=1), scheduler=SimpleNamespace(priority=priority)
+        ),
+    )
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def backend(clock: FakeClock) -> FakeBackend:
+    return FakeBackend(clock)
+
+
+def create_scheduler(tmp_path: Path, backend: FakeBackend, clock: FakeClock) -> JobScheduler:
+    return JobScheduler(str(tmp_path / "jobs.sqlite"), gpu_quotas={"a100": 4, "t4": 1}, backend=backend, clock=clock)
+
+
+def test_jobs_are_admitted_when_capacity_frees_up(tmp_path: Path, backend: FakeBackend, clock: FakeClock) -> None:
+    scheduler = create_scheduler(tmp_path, backend, clock)
+    for name in ["first", "second", "third"]:
+        scheduler.submit(create_config(name, accelerator_count=2))
+
+    clock.now = 10.0
+    assert [job.name for job in scheduler.step()] == ["first", "second"]
+    assert scheduler.get_usage() == {"a100": (4, 2)}
+    assert scheduler.step() == []
+
+    backend.running_clusters.remove("first-t")
+    clock.now = 100.0
+    (third_job,) = scheduler.step()
+    assert scheduler.get_job(1).state == JobState.FINISHED
+    assert (third_job.name, third_job.state, third_job.cluster_id) == ("third", JobState.RUNNING, "third-t")
+    assert (third_job.queue_wait_s, third_job.launch_latency_s) == (100.0, 5.0)
+
+
+def test_queued_jobs_are_launched_by_priority(tmp_path: Path, backend: FakeBackend, clock: FakeClock) -> None:
+    scheduler = create_scheduler(tmp_path, backend, clock)
+    scheduler.submit(create_config("running", accelerator_count=2))
+    scheduler.step()
+
+    scheduler.submit(create_config("small", accelerator_count=1))
+    scheduler.submit(create_config("large", accelerator_count=4, priority=1))
+    scheduler.submit(create_config("other_accelerator", accelerator_type="t4"))
+
+    # "large" does not fit yet and keeps "small" from taking the capacity it waits for
+    assert [job.name for job in scheduler.step()] == ["other_accelerator"]
+
+    backend.running_clusters.remove("running-t")
+    assert [job.name for job in scheduler.step()] == ["large"]
+
+
+def test_failed_status_checks_keep_jobs_running(tmp_path: Path, backend: FakeBackend, clock: FakeClock) -> None:
+    scheduler = create_scheduler(tmp_path, backend, clock)
+    for name in ["first", "second"]:
+        scheduler.submit(create_config(name))
+    scheduler.step()
+
+    backend.running_clusters.clear()
+    backend.unreachable_clusters.add("first-t")
+    scheduler.step()
+    assert [job.state for job in scheduler.list_jobs()] == [JobState.RUNNING, JobState.FINISHED]
+
+    backend.unreachable_clusters.clear()
+    scheduler.step()
+    assert scheduler.get_job(1).state == JobState.FINISHED
+
+
+def test_queue_is_persistent(tmp_path: Path, backend: FakeBackend, clock: FakeClock) -> None:
+    scheduler = create_scheduler(tmp_path, backend, clock)
+    scheduler.submit(create_config("queued"))
+    scheduler.submit(create_config("broken"))
+    scheduler.close()
+
+    scheduler = create_scheduler(tmp_path, backend, clock)
+    scheduler.step()
+
+    assert [job.state for job in scheduler.list_jobs()] == [JobState.RUNNING, JobState.FAILED]
+    assert scheduler.get_job(2).error == "RuntimeError('Instance template creation failed')"
+    assert scheduler.get_usage() == {"a100": (1, 1)}
+
+
+def test_jobs_exceeding_quotas_are_rejected(tmp_path: Path, backend: FakeBackend, clock: FakeClock) -> None:
+    scheduler = create_scheduler(tmp_path, backend, clock)
+
+    with pytest.raises(ValueError, match="exceeds the quotas"):
+        scheduler.submit(create_config("too_large", accelerator_count=8))
@@ -0,0 +1,82 @@
+import os
+import socket
+import time
+
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from {{cookiecutter.project_name}}.utils.local_launcher import LocalProcessLauncher, get_available_cpu_ids, split_cpu_ids
+from {{cookiecutter.project_name}}.utils.utils import get_logger
+
+
+def record_job(config: Any) -> None:
+    print(f"running {config.job_info.job_id}")
+    get_logger(__name__).info(f"logging from {config.job_info.job_id}")
+    Path(config.output_path).write_text(f"{sorted(os.sched_getaffinity(0))} {os.environ['OMP_NUM_THREADS']}")
+
+
+def fail_job(config: Any) -> None:
+    raise RuntimeError(f"{config.job_info.job_id} failed")
+
+
+def sleep_job(config: Any) -> None:
+    time.sleep(60.0)
+
+
+def create_config(name: str, output_path: str = "") -> Any:
+    return SimpleNamespace(
+        job_info=SimpleNamespace(job_id=name), profiling=SimpleNamespace(enabled=False), output_path=output_path
+    )
+
+
+def create_launcher(tmp_path: Path, task_function: Any, max_workers: int) -> LocalProcessLauncher:
+    task_function_path = f"{__name__}.{task_function.__name__}"
+    return LocalProcessLauncher(task_function_path, str(tmp_path / "jobs"), max_workers=max_workers)
+
+
+def test_jobs_run_pinned_in_their_working_dirs(tmp_path: Path) -> None:
+    launcher = create_launcher(tmp_path, record_job, max_workers=2)
+    for name in ["a", "b", "c"]:
+        launcher.launch(create_config(name, str(tmp_path / f"{name}.txt")))
+    assert len(launcher.processes) <= 2
+
+    job_infos = launcher.wait()
+
+    cpu_ids = get_available_cpu_ids()
+    for job_info in job_infos:
+        assert job_info.exit_code == 0
+        assert (tmp_path / f"{job_info.job_id}.txt").read_text() == f"{job_info.cpu_ids} {len(job_info.cpu_ids)}"
+        assert set(job_info.cpu_ids) <= set(cpu_ids)
+        assert sorted(os.listdir(job_info.working_dir)) == ["config.pickle", "job.log", "logs.log"]
+        assert Path(job_info.log_path).read_text().startswith(f"running {job_info.job_id}\n")
+        # Every job logs to logs.log in its own working dir
+        logs = (Path(job_info.working_dir) / "logs.log").read_text()
+        assert logs.splitlines() == [f"[INFO] [{socket.gethostname()}] {__name__}: logging from {job_info.job_id}"]
+
+
+def test_failed_job_has_nonzero_exit_code(tmp_path: Path) -> None:
+    launcher = create_launcher(tmp_path, fail_job, max_workers=1)
+    (job_info,) = launcher.wait([launcher.launch(create_config("broken"))])
+
+    assert job_info.exit_code == 1
+    assert "RuntimeError: broken failed" in Path(job_info.log_path).read_text()
+
+
+def test_terminate_running_and_pending_jobs(tmp_path: Path) -> None:
+    launcher = create_launcher(tmp_path, sleep_job, max_workers=1)
+    configs = [create_config("running"), create_config("pending")]
+    job_ids = [launcher.launch(config) for config in configs]
+    assert [launcher.is_running(config, job_id) for config, job_id in zip(configs, job_ids)] == [True, True]
+
+    launcher.terminate(configs[1], "pending")
+    launcher.terminate(configs[0], "running")
+
+    assert [launcher.is_running(config, job_id) for config, job_id in zip(configs, job_ids)] == [False, False]
+    assert launcher.jobs["running"].exit_code == -15
+    assert launcher.jobs["pending"].pid is None
+
+
+def test_split_cpu_ids() -> None:
+    assert split_cpu_ids([0, 1, 2, 3, 4], 2) == [[0, 1], [2, 3, 4]]
+    assert split_cpu_ids([0, 1], 3) == [[0], [1], [0]]
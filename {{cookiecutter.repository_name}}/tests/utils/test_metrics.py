@@ -0,0 +1,76 @@
+import json
+import os
+import time
+
+from pathlib import Path
+
+import pytest
+
+from {{cookiecutter.project_name}}.utils.metrics import MetricsLogger, summarize_histogram
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def read_records(output_dir: Path) -> list[dict]:
+    return [json.loads(line) for path in sorted(output_dir.glob("*.jsonl")) for line in path.read_text().splitlines()]
+
+
+def test_metrics_are_aggregated_per_interval_and_flushed_in_batches(tmp_path: Path) -> None:
+    clock = FakeClock()
+    metrics_logger = MetricsLogger(
+        str(tmp_path), tags={"job_id": "job"}, aggregation_interval_s=10.0, flush_every_n_intervals=2, clock=clock
+    )
+
+    for interval in range(2):
+        for _ in range(5):
+            metrics_logger.increment("samples", 2)
+            metrics_logger.observe("loss", 1.0)
+            metrics_logger.set_gauge("learning_rate", 0.1 * (interval + 1))
+            metrics_logger.step()
+        clock.now += 10.0
+        if interval == 0:
+            metrics_logger.step()
+            assert read_records(tmp_path) == []
+
+    metrics_logger.step()
+    records = read_records(tmp_path)
+    assert len(records) == 2
+    assert [record["counters"]["samples"] for record in records] == [10.0, 10.0]
+    assert [record["gauges"]["learning_rate"] for record in records] == [0.1, 0.2]
+    assert records[0]["histograms"]["loss"]["count"] == 5
+    assert all(record["job_id"] == "job" for record in records)
+
+
+def test_close_flushes_pending_records(tmp_path: Path) -> None:
+    with MetricsLogger(str(tmp_path), aggregation_interval_s=1000.0, writer_id="writer") as metrics_logger:
+        metrics_logger.increment("samples")
+
+    assert [path.name for path in tmp_path.iterdir()] == ["writer-000000.jsonl"]
+    assert read_records(tmp_path)[0]["counters"] == {"samples": 1.0}
+
+
+def test_summarize_histogram() -> None:
+    summary = summarize_histogram([float(value) for value in range(1, 101)])
+    assert summary["count"] == 100
+    assert summary["mean"] == 50.5
+    assert (summary["min"], summary["max"]) == (1.0, 100.0)
+    assert (summary["p50"], summary["p90"], summary["p99"]) == (50.0, 90.0, 99.0)
+    assert summarize_histogram([1.0, 2.0])["p50"] == 1.0
+    assert summarize_histogram([3.0])["p99"] == 3.0
+
+
+def test_writers_of_restarted_jobs_do_not_overwrite_parts(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # A restarted job in a container usually gets the same pid
+    monkeypatch.setattr(os, "getpid", lambda: 1)
+    for start_time in (1000.0, 2000.0):
+        monkeypatch.setattr(time, "time", lambda: start_time)
+        with MetricsLogger(str(tmp_path), aggregation_interval_s=1000.0) as metrics_logger:
+            metrics_logger.increment("samples")
+
+    assert len(list(tmp_path.glob("*-000000.jsonl"))) == 2
@@ -0,0 +1,74 @@
+import time
+
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from {{cookiecutter.project_name}}.config_schemas.profiling_schema import ProfilerMode, ProfilingConfig
+from {{cookiecutter.project_name}}.utils import profiling
+from {{cookiecutter.project_name}}.utils.profiling import ProfilingSession, profile_task
+
+
+def create_config(tmp_path: Path, **profiling_kwargs: Any) -> Any:
+    return SimpleNamespace(
+        infrastructure=SimpleNamespace(base_path=lambda: str(tmp_path / "run")),
+        profiling=ProfilingConfig(**profiling_kwargs),
+    )
+
+
+def busy_wait(duration_s: float) -> None:
+    deadline = time.perf_counter() + duration_s
+    while time.perf_counter() < deadline:
+        pass
+
+
+def test_disabled_profiling_is_a_no_op(tmp_path: Path) -> None:
+    with profile_task(create_config(tmp_path)) as session:
+        profiling.step()
+
+    assert session is None
+    assert not (tmp_path / "run").exists()
+
+
+@pytest.mark.parametrize(
+    "mode, output_file_name",
+    [
+        (ProfilerMode.CPROFILE, "profile.prof"),
+        (ProfilerMode.SAMPLING, "stacks.collapsed"),
+        (ProfilerMode.TRACEMALLOC, "tracemalloc.snapshot"),
+    ],
+)
+def test_results_are_saved_under_the_base_path(tmp_path: Path, mode: ProfilerMode, output_file_name: str) -> None:
+    config = create_config(tmp_path, enabled=True, mode=mode, sampling_interval_s=0.001, output_dir_name="profiles")
+
+    with profile_task(config) as session:
+        assert session is not None and session.is_running
+        busy_wait(0.05)
+
+    assert sorted(path.name for path in (tmp_path / "run" / "profiles").iterdir()) == sorted(
+        [output_file_name, "summary.txt"]
+    )
+    assert profiling._ACTIVE_SESSION is None
+
+
+def test_session_profiles_only_the_configured_steps(tmp_path: Path) -> None:
+    config = ProfilingConfig(enabled=True, start_step=2, num_steps=3)
+
+    with ProfilingSession(config, str(tmp_path)) as session:
+        running_per_step = []
+        for _ in range(6):
+            session.step()
+            running_per_step.append(session.is_running)
+
+    assert running_per_step == [False, True, True, True, False, False]
+    assert (tmp_path / "summary.txt").exists()
+
+
+def test_session_which_never_started_saves_nothing(tmp_path: Path) -> None:
+    with ProfilingSession(ProfilingConfig(enabled=True, start_step=10), str(tmp_path / "profiling")) as session:
+        session.step()
+
+    assert not session.has_run
+    assert not (tmp_path / "profiling").exists()
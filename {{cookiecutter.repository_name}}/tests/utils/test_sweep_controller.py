@@ -0,0 +1,230 @@
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from {{cookiecutter.project_name}}.benchmarking.fake_compute_api import FakeComputeApi, InstanceGroupManager
+from {{cookiecutter.project_name}}.utils.config_utils import CONFIG_DIR_ENV_VARIABLE, compose_config, get_pickle_config
+from {{cookiecutter.project_name}}.utils.gcp_training_launcher import DistributedJobLauncher
+from {{cookiecutter.project_name}}.utils.metrics import MetricsLogger
+from {{cookiecutter.project_name}}.utils.sweep_controller import SweepController, TrialState
+
+REPOSITORY_ROOT = Path(__file__).parents[2]
+
+
+class FakeComputeLauncher(DistributedJobLauncher):
+    """
+    Launches trials by creating bare instance groups in a fake compute API, so stopping and monitoring trials goes
+    through `DistributedJobLauncher` like in real sweeps.
+    """
+
+    def launch(self, config: Any) -> str:
+        cluster_id = f"{config.job_info.job_id}-t"
+        self.compute_api.InstanceGroupManagersClient().insert(
+            project=self.project_id,
+            instance_group_manager_resource=InstanceGroupManager(name=cluster_id, target_size=1),
+            zone=self.zone,
+        )
+        return cluster_id
+
+
+class MetricStreams:
+    def __init__(self, tmp_path: Path) -> None:
+        self.tmp_path = tmp_path
+        self.metrics_loggers: dict[str, MetricsLogger] = {}
+
+    def create_config(self, name: str) -> Any:
+        base_path = str(self.tmp_path / name)
+        return SimpleNamespace(
+            job_info=SimpleNamespace(job_id=name),
+            infrastructure=SimpleNamespace(base_path=lambda: base_path),
+            metrics=SimpleNamespace(output_dir_name="metrics"),
+        )
+
+    def report(self, name: str, step: int, loss: float) -> None:
+        # Every step is aggregated and flushed right away, like a training flushing its metrics at the end of an epoch
+        if name not in self.metrics_loggers:
+            output_dir = str(self.tmp_path / name / "metrics")
+            self.metrics_loggers[name] = MetricsLogger(
+                output_dir, aggregation_interval_s=0.0, flush_every_n_intervals=1
+            )
+        self.metrics_loggers[name].observe("val_loss", loss)
+        self.metrics_loggers[name].step(step)
+
+
+@pytest.fixture
+def compute_api() -> FakeComputeApi:
+    return FakeComputeApi()
+
+
+@pytest.fixture
+def streams(tmp_path: Path) -> MetricStreams:
+    return MetricStreams(tmp_path)
+
+
+def create_controller(
+    streams: MetricStreams,
+    compute_api: FakeComputeApi,
+    trial_names: list[str],
+    max_concurrent_trials: int = 4,
+    reduction_factor: int = 3,
+) -> SweepController:
+    return SweepController(
+        [streams.create_config(name) for name in trial_names],
+        FakeComputeLauncher("project", "zone", compute_api),
+        "val_loss",
+        min_resource=10,
+        max_resource=90,
+        reduction_factor=reduction_factor,
+        max_concurrent_trials=max_concurrent_trials,
+    )
+
+
+def test_losing_trials_are_stopped_at_rungs(streams: MetricStreams, compute_api: FakeComputeApi) -> None:
+    controller = create_controller(streams, compute_api, ["a", "b", "c", "d"])
+    assert controller.rung_milestones == [10, 30]
+
+    controller.step()
+    assert set(compute_api.instance_groups) == {"a-t", "b-t", "c-t", "d-t"}
+
+    for name, loss in [("a", 1.0), ("b", 2.0), ("c", 0.5), ("d", 0.8)]:
+        streams.report(name, 5, loss + 1.0)
+        streams.report(name, 10, loss)
+    controller.step()
+
+    # "a" and "b" continue because less than reduction_factor trials reached the rung before them, "d" is not in the
+    # top 1 / 3 of 4 trials
+    assert [trial.state for trial in controller.trials] == [
+        TrialState.RUNNING,
+        TrialState.RUNNING,
+        TrialState.RUNNING,
+        TrialState.STOPPED,
+    ]
+    assert set(compute_api.instance_groups) == {"a-t", "b-t", "c-t"}
+    assert controller.rung_values == [[1.0, 2.0, 0.5, 0.8], []]
+
+    # "a" reports its last metrics and finishes, "c" is worse than "a" at the second rung
+    streams.report("a", 90, 0.3)
+    del compute_api.instance_groups["a-t"]
+    streams.report("b", 30, 0.9)
+    streams.report("c", 30, 0.6)
+    controller.step()
+
+    assert [trial.state for trial in controller.trials[:3]] == [
+        TrialState.COMPLETED,
+        TrialState.RUNNING,
+        TrialState.STOPPED,
+    ]
+    assert set(compute_api.instance_groups) == {"b-t"}
+
+    streams.report("b", 90, 0.2)
+    del compute_api.instance_groups["b-t"]
+    controller.step()
+
+    assert controller.is_finished()
+    best_trial = controller.get_best_trial()
+    assert best_trial is not None and best_trial.name == "b"
+
+
+def test_trials_continue_until_a_rung_has_reduction_factor_values(
+    streams: MetricStreams, compute_api: FakeComputeApi
+) -> None:
+    controller = create_controller(streams, compute_api, ["a", "b"])
+    controller.step()
+
+    streams.report("a", 10, 1.0)
+    streams.report("b", 10, 2.0)
+    controller.step()
+
+    assert [trial.state for trial in controller.trials] == [TrialState.RUNNING, TrialState.RUNNING]
+    assert set(compute_api.instance_groups) == {"a-t", "b-t"}
+
+
+def test_stopped_trials_free_slots_for_pending_ones(streams: MetricStreams, compute_api: FakeComputeApi) -> None:
+    controller = create_controller(streams, compute_api, ["a", "b", "c"], max_concurrent_trials=2, reduction_factor=2)
+
+    controller.step()
+    assert set(compute_api.instance_groups) == {"a-t", "b-t"}
+
+    streams.report("a", 10, 1.0)
+    streams.report("b", 12, 3.0)
+    controller.step()
+
+    assert [trial.state for trial in controller.trials] == [TrialState.RUNNING, TrialState.STOPPED, TrialState.RUNNING]
+    assert set(compute_api.instance_groups) == {"a-t", "c-t"}
+
+
+def test_trials_ending_before_max_resource_fail(streams: MetricStreams, compute_api: FakeComputeApi) -> None:
+    controller = create_controller(streams, compute_api, ["a", "b"])
+    controller.step()
+
+    # "a" crashes with a low loss, its instance group is deleted by the startup script all the same
+    streams.report("a", 20, 0.1)
+    del compute_api.instance_groups["a-t"]
+    streams.report("b", 90, 0.5)
+    del compute_api.instance_groups["b-t"]
+    controller.step()
+
+    assert [trial.state for trial in controller.trials] == [TrialState.FAILED, TrialState.COMPLETED]
+    best_trial = controller.get_best_trial()
+    assert best_trial is not None and best_trial.name == "b"
+
+
+def test_trials_need_unique_job_ids(streams: MetricStreams, compute_api: FakeComputeApi) -> None:
+    with pytest.raises(ValueError, match="unique job ids"):
+        create_controller(streams, compute_api, ["a", "a"])
+
+
+def test_remote_trials_load_their_own_configs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, compute_api: FakeComputeApi, console_logging: None
+) -> None:
+    # The startup script path in the VM config is relative to the repository root
+    monkeypatch.chdir(REPOSITORY_ROOT)
+    trial_configs = [
+        compose_config(
+            "../configs/",
+            "config",
+            [
+                "job_info.task_id=sweep",
+                "job_info.experiment_name=sweep",
+                f"job_info.run_tag=trial{seed}",
+                "infrastructure.vm_config.docker_image_tag=sweep",
+                f"infrastructure.gcs_bucket=memory://{tmp_path.name}",
+                f"seed={seed}",
+            ],
+            to_object=True,
+        )
+        for seed in [1, 2]
+    ]
+    controller = SweepController(
+        trial_configs,
+        DistributedJobLauncher("project", "zone", compute_api),
+        "val_loss",
+        min_resource=10,
+        max_resource=90,
+        reduction_factor=3,
+        max_concurrent_trials=2,
+    )
+
+    controller.step()
+
+    loaded_configs = []
+
+    @get_pickle_config(config_path="{{cookiecutter.project_name}}/configs/automatically_generated/", config_name="config")
+    def vm_task(config: Any) -> None:
+        loaded_configs.append(config)
+
+    for trial_config in trial_configs:
+        cluster_id = f"{trial_config.job_info.job_id}-t".lower()
+        template: Any = compute_api.instance_templates[cluster_id]
+        metadata = {item.key: item.value for item in template.properties.metadata.items}
+        assert metadata["config_dir"] == trial_config.infrastructure.base_path()
+
+        # What the startup script passes to the docker containers
+        monkeypatch.setenv(CONFIG_DIR_ENV_VARIABLE, metadata["config_dir"])
+        vm_task()
+
+    assert [(config.job_info.job_id, config.seed) for config in loaded_configs] == [
+        (trial_config.job_info.job_id, trial_config.seed) for trial_config in trial_configs
+    ]
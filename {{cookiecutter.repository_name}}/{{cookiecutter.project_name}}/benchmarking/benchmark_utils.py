@@ -0,0 +1,52 @@
+import json
+import os
+import platform
+import statistics
+import time
+import timeit
+
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator, Union
+
+REPOSITORY_ROOT = Path(__file__).resolve().parents[2]
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    min_s: float
+    median_s: float
+    repeat: int
+
+
+def measure(name: str, function: Callable[[], Any], repeat: int, number: int = 1) -> BenchmarkResult:
+    times = [elapsed / number for elapsed in timeit.repeat(function, number=number, repeat=repeat)]
+    return BenchmarkResult(name, min(times), statistics.median(times), repeat)
+
+
+@contextmanager
+def working_directory(path: Union[str, Path]) -> Iterator[None]:
+    previous_working_directory = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous_working_directory)
+
+
+def save_results(results: list[BenchmarkResult], path: str) -> None:
+    data = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python_version": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {result.name: asdict(result) for result in results},
+    }
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    Path(path).write_text(json.dumps(data, indent=2, sort_keys=True) + "\n")
+
+
+def load_results(path: str) -> dict[str, BenchmarkResult]:
+    data = json.loads(Path(path).read_text())
+    return {name: BenchmarkResult(**result) for name, result in data["results"].items()}
@@ -0,0 +1,43 @@
+import argparse
+import sys
+
+from {{cookiecutter.project_name}}.benchmarking.benchmark_utils import BenchmarkResult, load_results
+
+
+def compare(baseline: dict[str, BenchmarkResult], current: dict[str, BenchmarkResult], threshold: float) -> list[str]:
+    regressions = []
+    print(f"{'benchmark':<60}{'baseline ms':>14}{'current ms':>14}{'change':>10}")
+    for name, current_result in sorted(current.items()):
+        baseline_result = baseline.get(name)
+        if baseline_result is None:
+            print(f"{name:<60}{'-':>14}{current_result.median_s * 1000:>14.3f}{'new':>10}")
+            continue
+
+        change = current_result.median_s / baseline_result.median_s - 1 if baseline_result.median_s else 0.0
+        print(
+            f"{name:<60}{baseline_result.median_s * 1000:>14.3f}{current_result.median_s * 1000:>14.3f}{change:>10.1%}"
+        )
+        if change > threshold:
+            regressions.append(f"{name}: {change:+.1%}")
+    return regressions
+
+
+def compare_benchmarks_args_parser() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare benchmark results against a baseline")
+
+    parser.add_argument("baseline", type=str, help="Baseline results (JSON)")
+    parser.add_argument("current", type=str, help="Current results (JSON)")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed relative slowdown of the median time")
+    return parser.parse_args()
+
+
+def main(args: argparse.Namespace) -> int:
+    regressions = compare(load_results(args.baseline), load_results(args.current), args.threshold)
+    if regressions:
+        print(f"Regressions beyond {args.threshold:.0%}:\n" + "\n".join(regressions), file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(compare_benchmarks_args_parser()))
@@ -0,0 +1,96 @@
+import argparse
+import json
+import os
+import random
+import time
+
+from typing import Callable
+
+from {{cookiecutter.project_name}}.utils.io_utils import choose_file_system, is_compression_available, open_file
+
+# Codec name in fsspec -> path suffix selecting it
+CODEC_SUFFIXES = {"none": "", "gzip": ".gz", "zstd": ".zst", "lz4": ".lz4"}
+WORDS = ["the", "model", "loss", "train", "eval", "token", "batch", "gradient", "step", "epoch", "label", "score"]
+
+
+def create_csv_payload(row_count: int) -> str:
+    rng = random.Random(0)
+    lines = ["id,text,label,score\n"]
+    for row_index in range(row_count):
+        text = " ".join(rng.choices(WORDS, k=12))
+        lines.append(f"{row_index},{text},{rng.randint(0, 9)},{rng.random():.6f}\n")
+    return "".join(lines)
+
+
+def create_jsonl_payload(record_count: int) -> str:
+    # Records shaped like the ones written by MetricsLogger
+    rng = random.Random(0)
+    records = []
+    for step in range(record_count):
+        loss = {"count": 100, "mean": rng.random(), "p50": rng.random(), "p90": rng.random(), "p99": rng.random()}
+        record = {
+            "job_id": "experiment-run-20240101000000",
+            "step": step,
+            "timestamp": 1700000000.0 + step,
+            "counters": {"samples": 3200.0, "tokens": 409600.0},
+            "gauges": {"learning_rate": rng.random() * 1e-3},
+            "histograms": {"loss": loss},
+        }
+        records.append(json.dumps(record) + "\n")
+    return "".join(records)
+
+
+def time_call(function: Callable[[], None], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start_time)
+    return min(times)
+
+
+def write_text(path: str, text: str) -> None:
+    with open_file(path, "w") as f:
+        f.write(text)
+
+
+def read_text(path: str) -> None:
+    with open_file(path, "r") as f:
+        f.read()
+
+
+def compression_benchmark_args_parser() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare compression codecs of io_utils on CSV and JSONL payloads")
+
+    parser.add_argument("--rows", type=int, default=200_000, help="Number of CSV rows and JSONL records")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of measurements, the fastest one is reported")
+    parser.add_argument(
+        "--output-dir",
+        type=str,
+        default="memory://compression-benchmark",
+        help="Where payloads are written, e.g. a gs:// path to include network transfer",
+    )
+    return parser.parse_args()
+
+
+def main(args: argparse.Namespace) -> None:
+    codecs = [codec for codec in CODEC_SUFFIXES if codec == "none" or is_compression_available(codec)]
+    payloads = {"csv": create_csv_payload(args.rows), "jsonl": create_jsonl_payload(args.rows)}
+
+    print(f"{'payload':<8}{'codec':<8}{'stored MiB':>12}{'ratio':>8}{'write MiB/s':>14}{'read MiB/s':>14}")
+    for payload_name, payload in payloads.items():
+        payload_mib = len(payload.encode()) / 2**20
+        for codec in codecs:
+            path = os.path.join(args.output_dir, f"payload.{payload_name}{CODEC_SUFFIXES[codec]}")
+            write_time = time_call(lambda: write_text(path, payload), args.repeat)
+            read_time = time_call(lambda: read_text(path), args.repeat)
+            stored_mib = choose_file_system(path).size(path) / 2**20
+            print(
+                f"{payload_name:<8}{codec:<8}{stored_mib:>12.2f}{payload_mib / stored_mib:>8.1f}"
+                f"{payload_mib / write_time:>14.1f}{payload_mib / read_time:>14.1f}"
+            )
+            choose_file_system(path).rm(path)
+
+
+if __name__ == "__main__":
+    main(compression_benchmark_args_parser())
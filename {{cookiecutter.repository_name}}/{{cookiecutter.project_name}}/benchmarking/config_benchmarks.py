@@ -0,0 +1,72 @@
+from functools import partial
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING, Any
+
+from {{cookiecutter.project_name}}.benchmarking.benchmark_utils import BenchmarkResult, measure, working_directory
+from {{cookiecutter.project_name}}.utils.config_utils import compose_config, create_final_config, load_pickle_config
+from {{cookiecutter.project_name}}.utils.frozen_config import freeze_config
+
+if TYPE_CHECKING:
+    from {{cookiecutter.project_name}}.config_schemas.config_schema import Config
+
+# Relative to {{cookiecutter.project_name}}/utils/config_utils.py, as for generate_final_config.py
+CONFIG_PATH = "../configs/"
+CONFIG_NAME = "config"
+GENERATED_CONFIG_DIR = "./{{cookiecutter.project_name}}/configs/automatically_generated/"
+# Values which are MISSING in the config schemas
+OVERRIDES = [
+    "job_info.task_id=benchmark",
+    "job_info.experiment_name=benchmark",
+    "infrastructure.vm_config.docker_image_tag=benchmark",
+]
+# Config reads are sub-microsecond, so they are timed in batches
+HOT_PATH_NUMBER = 10_000
+
+
+def compose_benchmark_config() -> "Config":
+    config: "Config" = compose_config(CONFIG_PATH, CONFIG_NAME, OVERRIDES, to_object=True)
+    return config
+
+
+def read_fields(config: "Config") -> Any:
+    return (config.infrastructure.vm_config.machine.accelerator_count, config.job_info.run_name, config.seed)
+
+
+def expand(config: "Config") -> Any:
+    return dict(**config.job_info)
+
+
+def run(repeat: int) -> list[BenchmarkResult]:
+    results = [
+        measure("config/compose_config", partial(compose_config, CONFIG_PATH, CONFIG_NAME, OVERRIDES, False), repeat),
+        measure("config/compose_config_to_object", compose_benchmark_config, repeat),
+    ]
+
+    config = compose_benchmark_config()
+    frozen_config = freeze_config(config)
+    results.append(measure("config/freeze_config", partial(freeze_config, config), repeat))
+    for name, view in [("config", config), ("frozen_config", frozen_config)]:
+        results.extend(
+            [
+                measure(f"config/read_fields/{name}", partial(read_fields, view), repeat, HOT_PATH_NUMBER),
+                measure(f"config/expand/{name}", partial(expand, view), repeat, HOT_PATH_NUMBER),
+            ]
+        )
+
+    dict_config = compose_config(CONFIG_PATH, CONFIG_NAME, OVERRIDES, to_object=False)
+    # create_final_config writes relative to the working directory, so it is redirected to a temporary one
+    with TemporaryDirectory() as working_dir, working_directory(working_dir):
+        generated_config_dir = Path(GENERATED_CONFIG_DIR)
+        generated_config_dir.mkdir(parents=True)
+        (generated_config_dir / "full_config_header.yaml").write_text("# benchmark\n")
+
+        results.extend(
+            [
+                measure("config/create_final_config", partial(create_final_config, dict_config), repeat),
+                measure(
+                    "config/load_pickle_config", partial(load_pickle_config, GENERATED_CONFIG_DIR, CONFIG_NAME), repeat
+                ),
+            ]
+        )
+    return results
@@ -0,0 +1,212 @@
+import itertools
+import time
+
+from enum import Enum
+from typing import Any, Optional
+
+
+class FakeMessage:
+    def __init__(self, **kwargs: Any) -> None:
+        self.__dict__.update(kwargs)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.__dict__})"
+
+
+class Items(FakeMessage):
+    pass
+
+
+class Metadata(FakeMessage):
+    def __init__(self, **kwargs: Any) -> None:
+        self.items: list[Items] = []
+        super().__init__(**kwargs)
+
+
+class InstanceProperties(FakeMessage):
+    def __init__(self, **kwargs: Any) -> None:
+        self.disks: list[Any] = []
+        self.network_interfaces: list[Any] = []
+        self.guest_accelerators: list[Any] = []
+        self.service_accounts: list[Any] = []
+        self.metadata = Metadata()
+        self.labels: dict[str, str] = {}
+        self.machine_type = ""
+        self.scheduling: Optional[Any] = None
+        super().__init__(**kwargs)
+
+
+class InstanceTemplate(FakeMessage):
+    def __init__(self, **kwargs: Any) -> None:
+        self.name = ""
+        self.self_link = ""
+        self.properties = InstanceProperties()
+        super().__init__(**kwargs)
+
+
+class AttachedDisk(FakeMessage):
+    pass
+
+
+class AttachedDiskInitializeParams(FakeMessage):
+    pass
+
+
+class NetworkInterface(FakeMessage):
+    pass
+
+
+class AcceleratorConfig(FakeMessage):
+    pass
+
+
+class ServiceAccount(FakeMessage):
+    pass
+
+
+class Scheduling(FakeMessage):
+    class ProvisioningModel(Enum):
+        STANDARD = "STANDARD"
+        SPOT = "SPOT"
+
+
+class InstanceGroupManager(FakeMessage):
+    def __init__(self, **kwargs: Any) -> None:
+        self.name = ""
+        self.target_size = 0
+        # Set when the instance group is inserted
+        self.instance_ids: list[int] = []
+        super().__init__(**kwargs)
+
+
+class ManagedInstance(FakeMessage):
+    pass
+
+
+class NotFound(Exception):
+    code = 404
+
+
+class FakeOperation:
+    def __init__(self, latency_s: float) -> None:
+        self.latency_s = latency_s
+        self.name = "fake-operation"
+        self.error_code = None
+        self.error_message = None
+        self.warnings: list[Any] = []
+
+    def result(self, timeout: Optional[float] = None) -> None:
+        time.sleep(self.latency_s)
+
+    def exception(self) -> None:
+        return None
+
+
+class FakeComputeApi:
+    """
+    Stand-in for `google.cloud.compute_v1` that keeps resources in memory and sleeps `latency_s` on every API call
+    (and `operation_latency_s` while waiting for long running operations). Instances of an instance group become
+    visible after `instances_ready_after_polls` calls to `list_managed_instances`.
+    """
+
+    InstanceTemplate = InstanceTemplate
+    AttachedDisk = AttachedDisk
+    AttachedDiskInitializeParams = AttachedDiskInitializeParams
+    NetworkInterface = NetworkInterface
+    AcceleratorConfig = AcceleratorConfig
+    ServiceAccount = ServiceAccount
+    Scheduling = Scheduling
+    Items = Items
+    InstanceGroupManager = InstanceGroupManager
+
+    def __init__(
+        self, latency_s: float = 0.0, operation_latency_s: float = 0.0, instances_ready_after_polls: int = 1
+    ) -> None:
+        self.latency_s = latency_s
+        self.operation_latency_s = operation_latency_s
+        self.instances_ready_after_polls = instances_ready_after_polls
+        self.instance_templates: dict[str, InstanceTemplate] = {}
+        self.instance_groups: dict[str, InstanceGroupManager] = {}
+        self.instance_group_polls: dict[str, int] = {}
+        self.call_count = 0
+        self._instance_ids = itertools.count(1)
+
+    def call(self) -> None:
+        self.call_count += 1
+        time.sleep(self.latency_s)
+
+    def operation(self) -> FakeOperation:
+        return FakeOperation(self.operation_latency_s)
+
+    def InstanceTemplatesClient(self) -> "FakeInstanceTemplatesClient":
+        return FakeInstanceTemplatesClient(self)
+
+    def InstanceGroupManagersClient(self) -> "FakeInstanceGroupManagersClient":
+        return FakeInstanceGroupManagersClient(self)
+
+    def ImagesClient(self) -> "FakeImagesClient":
+        return FakeImagesClient(self)
+
+
+class FakeInstanceTemplatesClient:
+    def __init__(self, api: FakeComputeApi) -> None:
+        self.api = api
+
+    def insert(self, project: str, instance_template_resource: InstanceTemplate) -> FakeOperation:
+        self.api.call()
+        instance_template_resource.self_link = (
+            f"projects/{project}/global/instanceTemplates/{instance_template_resource.name}"
+        )
+        self.api.instance_templates[instance_template_resource.name] = instance_template_resource
+        return self.api.operation()
+
+    def get(self, project: str, instance_template: str) -> InstanceTemplate:
+        self.api.call()
+        return self.api.instance_templates[instance_template]
+
+
+class FakeInstanceGroupManagersClient:
+    def __init__(self, api: FakeComputeApi) -> None:
+        self.api = api
+
+    def insert(self, project: str, instance_group_manager_resource: InstanceGroupManager, zone: str) -> FakeOperation:
+        self.api.call()
+        instance_group_manager_resource.instance_ids = [
+            next(self.api._instance_ids) for _ in range(instance_group_manager_resource.target_size)
+        ]
+        self.api.instance_groups[instance_group_manager_resource.name] = instance_group_manager_resource
+        self.api.instance_group_polls[instance_group_manager_resource.name] = 0
+        return self.api.operation()
+
+    def get(self, project: str, instance_group_manager: str, zone: str) -> InstanceGroupManager:
+        self.api.call()
+        if instance_group_manager not in self.api.instance_groups:
+            raise NotFound(f"Instance group {instance_group_manager} not found")
+        return self.api.instance_groups[instance_group_manager]
+
+    def delete(self, project: str, instance_group_manager: str, zone: str) -> FakeOperation:
+        self.api.call()
+        if instance_group_manager not in self.api.instance_groups:
+            raise NotFound(f"Instance group {instance_group_manager} not found")
+        del self.api.instance_groups[instance_group_manager]
+        del self.api.instance_group_polls[instance_group_manager]
+        return self.api.operation()
+
+    def list_managed_instances(self, project: str, instance_group_manager: str, zone: str) -> list[ManagedInstance]:
+        self.api.call()
+        instance_group = self.api.instance_groups.get(instance_group_manager)
+        if instance_group is None:
+            return []
+        self.api.instance_group_polls[instance_group_manager] += 1
+        if self.api.instance_group_polls[instance_group_manager] < self.api.instances_ready_after_polls:
+            return []
+        return [ManagedInstance(id=instance_id) for instance_id in instance_group.instance_ids]
+
+
+class FakeImagesClient:
+    def __init__(self, api: FakeComputeApi) -> None:
+        self.api = api
+
+    def get(self, project: str, image: str) -> FakeMessage:
+        self.api.call()
+        return FakeMessage(name=image, self_link=f"projects/{project}/global/images/{image}")
@@ -0,0 +1,131 @@
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Optional
+
+from {{cookiecutter.project_name}}.benchmarking.benchmark_utils import REPOSITORY_ROOT
+
+ENTRY_POINTS = [
+    "{{cookiecutter.project_name}}.train",
+    "{{cookiecutter.project_name}}.evaluate",
+    "{{cookiecutter.project_name}}.train_remote",
+    "{{cookiecutter.project_name}}.submit_remote",
+    "{{cookiecutter.project_name}}.run_scheduler",
+    "{{cookiecutter.project_name}}.sweep_remote",
+    "{{cookiecutter.project_name}}.run_local_jobs",
+    "{{cookiecutter.project_name}}.generate_final_config",
+]
+
+# Startup budgets (cumulative import time of the entry point module) in milliseconds
+DEFAULT_STARTUP_BUDGETS_MS = {
+    "{{cookiecutter.project_name}}.train": 150.0,
+    "{{cookiecutter.project_name}}.evaluate": 150.0,
+    "{{cookiecutter.project_name}}.train_remote": 150.0,
+    "{{cookiecutter.project_name}}.submit_remote": 150.0,
+    "{{cookiecutter.project_name}}.run_scheduler": 150.0,
+    "{{cookiecutter.project_name}}.sweep_remote": 150.0,
+    "{{cookiecutter.project_name}}.run_local_jobs": 150.0,
+    "{{cookiecutter.project_name}}.generate_final_config": 150.0,
+}
+
+IMPORT_TIME_LINE_REGEX = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+@dataclass
+class ImportTimeReport:
+    entry_point: str
+    total_us: int
+    self_us_per_package: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def total_ms(self) -> float:
+        return self.total_us / 1000
+
+    def top_packages(self, top_k: int) -> list[tuple[str, int]]:
+        return sorted(self.self_us_per_package.items(), key=lambda item: item[1], reverse=True)[:top_k]
+
+
+def parse_import_time_output(entry_point: str, output: str) -> ImportTimeReport:
+    total_us = 0
+    self_us_per_package: dict[str, int] = defaultdict(int)
+    for line in output.splitlines():
+        match = IMPORT_TIME_LINE_REGEX.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indentation, module_name = match.groups()
+        self_us_per_package[module_name.split(".")[0]] += int(self_us)
+        if len(indentation) <= 1:
+            total_us += int(cumulative_us)
+    return ImportTimeReport(entry_point, total_us, dict(self_us_per_package))
+
+
+def measure_import_time(entry_point: str) -> ImportTimeReport:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPOSITORY_ROOT), env.get("PYTHONPATH")]))
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {entry_point}"],
+        cwd=REPOSITORY_ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    if process.returncode != 0:
+        raise RuntimeError(f"Importing '{entry_point}' failed:\n{process.stderr[-2000:]}")
+    return parse_import_time_output(entry_point, process.stderr)
+
+
+def best_of(entry_point: str, repeats: int) -> ImportTimeReport:
+    return min((measure_import_time(entry_point) for _ in range(repeats)), key=lambda report: report.total_us)
+
+
+def print_report(report: ImportTimeReport, budget_ms: Optional[float], top_k: int) -> None:
+    budget_message = f" (budget: {budget_ms:.1f} ms)" if budget_ms is not None else ""
+    print(f"============ {report.entry_point}: {report.total_ms:.1f} ms{budget_message} ============")
+    for package_name, self_us in report.top_packages(top_k):
+        print(f"{self_us / 1000:10.1f} ms  {package_name}")
+
+
+def parse_budgets(budgets: list[str]) -> dict[str, float]:
+    parsed_budgets = dict(DEFAULT_STARTUP_BUDGETS_MS)
+    for budget in budgets:
+        entry_point, _, budget_ms = budget.partition("=")
+        if not budget_ms:
+            raise ValueError(f"Budgets have to be given as <entry_point>=<milliseconds>, got: '{budget}'")
+        parsed_budgets[entry_point] = float(budget_ms)
+    return parsed_budgets
+
+
+def import_time_args_parser() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Break down `python -X importtime` per entry point")
+
+    parser.add_argument("--entry-points", nargs="*", default=ENTRY_POINTS, help="Modules to import")
+    parser.add_argument("--budget", action="append", default=[], help="Startup budget: <entry_point>=<milliseconds>")
+    parser.add_argument("--repeats", type=int, default=3, help="Number of measurements, the fastest one is reported")
+    parser.add_argument("--top-k", type=int, default=10, help="Number of most expensive packages to display")
+    return parser.parse_args()
+
+
+def main(args: argparse.Namespace) -> int:
+    budgets = parse_budgets(args.budget)
+    exceeded_budgets = []
+    for entry_point in args.entry_points:
+        report = best_of(entry_point, args.repeats)
+        budget_ms = budgets.get(entry_point)
+        print_report(report, budget_ms, args.top_k)
+        if budget_ms is not None and report.total_ms > budget_ms:
+            exceeded_budgets.append(f"{entry_point}: {report.total_ms:.1f} ms > {budget_ms:.1f} ms")
+
+    if exceeded_budgets:
+        print("Startup budget exceeded for:\n" + "\n".join(exceeded_budgets), file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(import_time_args_parser()))
@@ -0,0 +1,87 @@
+import argparse
+import importlib
+import timeit
+
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from typing import Any, Callable
+
+from {{cookiecutter.project_name}}.utils.config_utils import custom_instantiate
+
+
+@dataclass
+class SmallConfig:
+    _target_: str = "datetime.timedelta"
+    days: int = 1
+    seconds: int = 2
+
+
+@dataclass
+class LargeConfig:
+    _target_: str = "builtins.dict"
+    weights: list[float] = field(default_factory=lambda: [0.5] * 1_000)
+    vocabulary: dict[str, int] = field(default_factory=lambda: {f"token_{i}": i for i in range(1_000)})
+
+
+@dataclass
+class NestedConfig:
+    _target_: str = "builtins.dict"
+    first: SmallConfig = field(default_factory=SmallConfig)
+    second: SmallConfig = field(default_factory=SmallConfig)
+    learning_rate: float = 1e-3
+
+
+def legacy_custom_instantiate(config: Any) -> Any:
+    # custom_instantiate as it was before target resolution caching and shallow field extraction
+    config_as_dict = asdict(config)
+    _target_ = config_as_dict.pop("_target_")
+    _partial_ = config_as_dict.pop("_partial_", False)
+
+    splitted_target = _target_.split(".")
+    module_name, class_name = ".".join(splitted_target[:-1]), splitted_target[-1]
+
+    module = importlib.import_module(module_name)
+    _class = getattr(module, class_name)
+    if _partial_:
+        return partial(_class, **config_as_dict)
+    return _class(**config_as_dict)
+
+
+def hydra_instantiate(config: Any) -> Any:
+    from hydra.utils import instantiate
+
+    return instantiate(config)
+
+
+def time_per_call_us(function: Callable[[Any], Any], config: Any, number: int, repeat: int) -> float:
+    best_time = min(timeit.repeat(lambda: function(config), number=number, repeat=repeat))
+    return best_time / number * 1e6
+
+
+def instantiate_benchmark_args_parser() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare custom_instantiate against its predecessor and hydra")
+
+    parser.add_argument("--number", type=int, default=200, help="Number of calls per measurement")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of measurements, the fastest one is reported")
+    parser.add_argument("--skip-hydra", action="store_true", help="Do not benchmark hydra.utils.instantiate")
+    return parser.parse_args()
+
+
+def main(args: argparse.Namespace) -> None:
+    implementations: dict[str, Callable[[Any], Any]] = {
+        "custom_instantiate": custom_instantiate,
+        "legacy_custom_instantiate": legacy_custom_instantiate,
+    }
+    if not args.skip_hydra:
+        implementations["hydra.utils.instantiate"] = hydra_instantiate
+
+    configs = {"small": SmallConfig(), "large": LargeConfig(), "nested": NestedConfig()}
+    print(f"{'config':<10}{'implementation':<30}{'us/call':>12}")
+    for config_name, config in configs.items():
+        for implementation_name, implementation in implementations.items():
+            us_per_call = time_per_call_us(implementation, config, args.number, args.repeat)
+            print(f"{config_name:<10}{implementation_name:<30}{us_per_call:>12.2f}")
+
+
+if __name__ == "__main__":
+    main(instantiate_benchmark_args_parser())
@@ -0,0 +1,79 @@
+import os
+
+from functools import partial
+from tempfile import TemporaryDirectory
+from typing import Any
+
+from {{cookiecutter.project_name}}.benchmarking.benchmark_utils import BenchmarkResult, measure
+from {{cookiecutter.project_name}}.utils.io_utils import (
+    choose_file_system,
+    copy_dir,
+    copy_file,
+    iter_lines,
+    list_paths,
+    make_dirs,
+    read_file,
+    write_file,
+)
+
+FILE_SIZES = {"1KiB": 1024, "1MiB": 1024**2, "16MiB": 16 * 1024**2}
+FILE_COUNTS = (10, 100)
+MEMORY_ROOT = "memory://io-benchmarks"
+
+
+def write_payload(payload: bytes, io: Any) -> None:
+    io.write(payload)
+
+
+def count_lines(path: str) -> int:
+    return sum(1 for _ in iter_lines(path))
+
+
+def benchmark_file_system(file_system_name: str, root: str, repeat: int) -> list[BenchmarkResult]:
+    results = []
+    make_dirs(root)
+    for size_name, size in FILE_SIZES.items():
+        payload = os.urandom(size)
+        path = os.path.join(root, f"payload-{size_name}.bin")
+        prefix = f"io/{file_system_name}"
+        write_callback = partial(write_payload, payload)
+        results.extend(
+            [
+                measure(f"{prefix}/write_file/{size_name}", partial(write_file, path, "wb", write_callback), repeat),
+                measure(f"{prefix}/read_file/{size_name}", partial(read_file, path, "rb"), repeat),
+                measure(f"{prefix}/copy_file/{size_name}", partial(copy_file, path, f"{path}.copy"), repeat),
+            ]
+        )
+
+        text_path = os.path.join(root, f"lines-{size_name}.txt")
+        write_file(text_path, "wb", partial(write_payload, b"label\n" * (size // 6)))
+        results.append(measure(f"{prefix}/iter_lines/{size_name}", partial(count_lines, text_path), repeat))
+
+    for file_count in FILE_COUNTS:
+        source_dir = os.path.join(root, f"source-{file_count}")
+        target_dir = os.path.join(root, f"target-{file_count}")
+        make_dirs(source_dir)
+        write_callback = partial(write_payload, os.urandom(FILE_SIZES["1KiB"]))
+        for file_index in range(file_count):
+            write_file(os.path.join(source_dir, f"{file_index}.bin"), "wb", write_callback)
+        results.extend(
+            [
+                measure(
+                    f"io/{file_system_name}/list_paths/{file_count}_files", partial(list_paths, source_dir), repeat
+                ),
+                measure(
+                    f"io/{file_system_name}/copy_dir/{file_count}_files",
+                    partial(copy_dir, source_dir, target_dir),
+                    repeat,
+                ),
+            ]
+        )
+    return results
+
+
+def run(repeat: int) -> list[BenchmarkResult]:
+    results = benchmark_file_system("memory", MEMORY_ROOT, repeat)
+    choose_file_system(MEMORY_ROOT).rm(MEMORY_ROOT, recursive=True)
+    with TemporaryDirectory() as local_root:
+        results.extend(benchmark_file_system("local", local_root, repeat))
+    return results
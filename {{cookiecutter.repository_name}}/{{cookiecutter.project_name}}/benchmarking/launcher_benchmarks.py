@@ -0,0 +1,25 @@
+from functools import partial
+
+from {{cookiecutter.project_name}}.benchmarking.benchmark_utils import BenchmarkResult, measure
+from {{cookiecutter.project_name}}.benchmarking.config_benchmarks import compose_benchmark_config
+from {{cookiecutter.project_name}}.benchmarking.fake_compute_api import FakeComputeApi
+from {{cookiecutter.project_name}}.utils.gcp_training_launcher import DistributedJobLauncher
+
+# Injected latency of every compute API call, in milliseconds
+API_LATENCIES_MS = (0.0, 20.0)
+
+
+def run(repeat: int) -> list[BenchmarkResult]:
+    infrastructure_config = compose_benchmark_config().infrastructure
+    results = []
+    for api_latency_ms in API_LATENCIES_MS:
+        compute_api = FakeComputeApi(latency_s=api_latency_ms / 1000, operation_latency_s=api_latency_ms / 1000)
+        launcher = DistributedJobLauncher(infrastructure_config.project_id, infrastructure_config.zone, compute_api)
+        results.append(
+            measure(
+                f"launcher/run_remote_training/{api_latency_ms:g}ms_api_latency",
+                partial(launcher.run_remote_training, infrastructure_config),
+                repeat,
+            )
+        )
+    return results
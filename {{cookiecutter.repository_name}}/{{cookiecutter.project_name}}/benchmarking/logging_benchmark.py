@@ -0,0 +1,94 @@
+import argparse
+import logging
+import os
+import time
+
+from logging.handlers import RotatingFileHandler
+from tempfile import TemporaryDirectory
+from typing import Any
+
+from {{cookiecutter.project_name}}.utils.utils import start_log_queue_listener
+
+LOG_FORMAT = "[%(levelname)s] %(name)s: %(message)s"
+
+
+class SlowStream:
+    # Simulates a slow sink (e.g. a busy pipe or a network mounted disk)
+    def __init__(self, stream: Any, latency_s: float) -> None:
+        self.stream = stream
+        self.latency_s = latency_s
+
+    def write(self, text: str) -> int:
+        time.sleep(self.latency_s)
+        written: int = self.stream.write(text)
+        return written
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+
+def create_logger(name: str, log_dir: str, max_bytes: int, sink_latency_s: float) -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+
+    file_handler = RotatingFileHandler(
+        os.path.join(log_dir, f"{name}.log"), maxBytes=max_bytes, backupCount=5, encoding="utf8"
+    )
+    stream_handler = logging.StreamHandler(SlowStream(open(os.devnull, "w"), sink_latency_s))
+    handlers: list[logging.Handler] = [file_handler, stream_handler]
+    for handler in handlers:
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        logger.addHandler(handler)
+    return logger
+
+
+def log_records(logger: logging.Logger, record_count: int) -> float:
+    start_time = time.perf_counter()
+    for step in range(record_count):
+        logger.info("step: %d, loss: %.4f", step, 0.1234)
+    return time.perf_counter() - start_time
+
+
+def close_handlers(logger: logging.Logger) -> None:
+    for handler in logger.handlers[:]:
+        handler.close()
+        logger.removeHandler(handler)
+
+
+def logging_benchmark_args_parser() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure logging overhead per record")
+
+    parser.add_argument("--record-count", type=int, default=100_000, help="Number of records to log")
+    parser.add_argument("--max-bytes", type=int, default=10 * 1024 * 1024, help="maxBytes of the RotatingFileHandler")
+    parser.add_argument("--sink-latency-us", type=float, default=0.0, help="Latency added to each console write")
+    return parser.parse_args()
+
+
+def main(args: argparse.Namespace) -> None:
+    sink_latency_s = args.sink_latency_us / 1e6
+    print(f"{'pipeline':<12}{'caller us/record':>20}{'total us/record':>20}")
+    with TemporaryDirectory() as log_dir:
+        logger = create_logger("synchronous", log_dir, args.max_bytes, sink_latency_s)
+        elapsed = log_records(logger, args.record_count)
+        close_handlers(logger)
+        us_per_record = elapsed / args.record_count * 1e6
+        print(f"{'synchronous':<12}{us_per_record:>20.2f}{us_per_record:>20.2f}")
+
+        logger = create_logger("queued", log_dir, args.max_bytes, sink_latency_s)
+        listener = start_log_queue_listener(logger)
+        start_time = time.perf_counter()
+        caller_elapsed = log_records(logger, args.record_count)
+        listener.stop()
+        total_elapsed = time.perf_counter() - start_time
+        close_handlers(logger)
+        for handler in listener.handlers:
+            handler.close()
+        print(
+            f"{'queued':<12}{caller_elapsed / args.record_count * 1e6:>20.2f}"
+            f"{total_elapsed / args.record_count * 1e6:>20.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main(logging_benchmark_args_parser())
@@ -0,0 +1,36 @@
+import argparse
+import timeit
+
+from tempfile import TemporaryDirectory
+from typing import Callable
+
+from {{cookiecutter.project_name}}.utils.metrics import MetricsLogger
+
+
+def metrics_benchmark_args_parser() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure per-call overhead of MetricsLogger")
+
+    parser.add_argument("--number", type=int, default=1_000_000, help="Number of calls per measurement")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of measurements, the fastest one is reported")
+    return parser.parse_args()
+
+
+def main(args: argparse.Namespace) -> None:
+    with TemporaryDirectory() as output_dir:
+        metrics_logger = MetricsLogger(output_dir, tags={"job_id": "benchmark"}, aggregation_interval_s=1.0)
+        operations: dict[str, Callable[[], object]] = {
+            "empty call": lambda: None,
+            "increment": lambda: metrics_logger.increment("samples", 32),
+            "set_gauge": lambda: metrics_logger.set_gauge("learning_rate", 1e-3),
+            "observe": lambda: metrics_logger.observe("loss", 0.1234),
+            "step": metrics_logger.step,
+        }
+        print(f"{'operation':<12}{'ns/call':>10}")
+        for operation_name, operation in operations.items():
+            best_time = min(timeit.repeat(operation, number=args.number, repeat=args.repeat))
+            print(f"{operation_name:<12}{best_time / args.number * 1e9:>10.1f}")
+        metrics_logger.close()
+
+
+if __name__ == "__main__":
+    main(metrics_benchmark_args_parser())
@@ -0,0 +1,39 @@
+import argparse
+
+from types import ModuleType
+
+from {{cookiecutter.project_name}}.benchmarking import config_benchmarks, io_benchmarks, launcher_benchmarks
+from {{cookiecutter.project_name}}.benchmarking.benchmark_utils import REPOSITORY_ROOT, save_results, working_directory
+
+SUITES: dict[str, ModuleType] = {
+    "io": io_benchmarks,
+    "config": config_benchmarks,
+    "launcher": launcher_benchmarks,
+}
+DEFAULT_RESULTS_PATH = "./{{cookiecutter.project_name}}/benchmarking/baselines/baseline.json"
+
+
+def run_benchmarks_args_parser() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run offline benchmarks and store the results as JSON")
+
+    parser.add_argument("--suites", nargs="*", choices=list(SUITES), default=list(SUITES), help="Suites to run")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of measurements per benchmark")
+    parser.add_argument("--output", type=str, default=DEFAULT_RESULTS_PATH, help="Where to save the results")
+    return parser.parse_args()
+
+
+def main(args: argparse.Namespace) -> None:
+    results = []
+    # Config files and startup scripts are resolved relative to the repository root
+    with working_directory(REPOSITORY_ROOT):
+        for suite_name in args.suites:
+            suite_results = SUITES[suite_name].run(args.repeat)
+            for result in suite_results:
+                print(f"{result.name:<60}{result.median_s * 1000:>12.3f} ms")
+            results.extend(suite_results)
+        save_results(results, args.output)
+    print(f"Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main(run_benchmarks_args_parser())
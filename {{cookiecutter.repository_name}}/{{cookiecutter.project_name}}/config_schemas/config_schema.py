@@ -1,9 +1,9 @@
 from typing import Optional
 
-from hydra.core.config_store import ConfigStore
 from omegaconf import OmegaConf
 from pydantic.dataclasses import dataclass
 
+from {{cookiecutter.project_name}}.config_schemas import evaluation_schema, metrics_schema, profiling_schema, sweep_schema
 from {{cookiecutter.project_name}}.config_schemas.infrastructure import infrastructure_schema, job_info_schema
 from {{cookiecutter.project_name}}.utils.mixins import DictExpansionMixin
 
@@ -12,11 +12,21 @@
 class Config(DictExpansionMixin):
     infrastructure: infrastructure_schema.InfrastructureConfig
     job_info: job_info_schema.JobInfo
+    metrics: metrics_schema.MetricsConfig
+    evaluation: evaluation_schema.EvaluationConfig
+    profiling: profiling_schema.ProfilingConfig
+    sweep: sweep_schema.SweepConfig
     seed: int = 1234
 
 def setup_config() -> None:
+    from hydra.core.config_store import ConfigStore
+
     cs = ConfigStore.instance()
     cs.store(name="config_schema", node=Config)
 
     job_info_schema.setup_config()
     infrastructure_schema.setup_config()
+    metrics_schema.setup_config()
+    evaluation_schema.setup_config()
+    profiling_schema.setup_config()
+    sweep_schema.setup_config()
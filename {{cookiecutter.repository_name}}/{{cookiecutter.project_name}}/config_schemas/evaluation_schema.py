@@ -0,0 +1,23 @@
+from dataclasses import field
+from typing import Optional
+
+from pydantic.dataclasses import dataclass
+
+
+@dataclass
+class EvaluationConfig:
+    # Fully qualified name of a module level function (checkpoint_path, dataset_path, metric_names) -> {metric: value}
+    evaluate_function: Optional[str] = None
+    dataset_path: Optional[str] = None
+    metric_names: list[str] = field(default_factory=list)
+    checkpoint_suffixes: list[str] = field(default_factory=lambda: [".ckpt"])
+    # None means: one worker process per CPU
+    max_workers: Optional[int] = None
+    output_dir_name: str = "evaluation"
+
+
+def setup_config() -> None:
+    from hydra.core.config_store import ConfigStore
+
+    cs = ConfigStore.instance()
+    cs.store(group="evaluation", name="evaluation_schema", node=EvaluationConfig)
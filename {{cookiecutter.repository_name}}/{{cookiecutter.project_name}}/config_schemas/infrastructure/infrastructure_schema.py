@@ -3,22 +3,23 @@
 
 from dataclasses import field
 
-from hydra.core.config_store import ConfigStore
 from omegaconf import MISSING, SI
 from pydantic.dataclasses import dataclass
 
-from {{cookiecutter.project_name}}.config_schemas.infrastructure import vm_config_schema
+from {{cookiecutter.project_name}}.config_schemas.infrastructure import scheduler_schema, vm_config_schema
 from {{cookiecutter.project_name}}.config_schemas.infrastructure.job_info_schema import JobInfo
+from {{cookiecutter.project_name}}.config_schemas.infrastructure.scheduler_schema import SchedulerConfig
 from {{cookiecutter.project_name}}.config_schemas.infrastructure.vm_config_schema import VMTemplateConfig
 
 
 @dataclass
 class InfrastructureConfig:
-    defaults: list[t.Any] = field(default_factory=lambda: [{"vm_config": "default"}])
+    defaults: list[t.Any] = field(default_factory=lambda: [{"vm_config": "default"}, {"scheduler": "default"}])
 
     project_id: str = "{{cookiecutter.gcp_project_id}}"
     zone: str = "{{cookiecutter.gcp_zone}}"
     vm_config: VMTemplateConfig = MISSING
+    scheduler: SchedulerConfig = MISSING
     job_info: JobInfo = SI("${job_info}")
     gcs_bucket: str = "gs://{{cookiecutter.project_name}}"
     python_hash_seed: int = 42
@@ -30,7 +31,10 @@ def base_path(self) -> str:
 
 
 def setup_config() -> None:
+    from hydra.core.config_store import ConfigStore
+
     cs = ConfigStore.instance()
     cs.store(group="infrastructure", name="infrastructure_schema", node=InfrastructureConfig)
 
     vm_config_schema.setup_config()
+    scheduler_schema.setup_config()
@@ -3,7 +3,6 @@
 
 from dataclasses import field
 
-from hydra.core.config_store import ConfigStore
 from omegaconf import SI
 from pydantic.dataclasses import dataclass
 
@@ -33,5 +32,7 @@ def _get_label_for_launching_user() -> dict[str, str]:
 
 
 def setup_config() -> None:
+    from hydra.core.config_store import ConfigStore
+
     cs = ConfigStore.instance()
     cs.store(group="job_info", name="job_info_schema", node=JobInfo)
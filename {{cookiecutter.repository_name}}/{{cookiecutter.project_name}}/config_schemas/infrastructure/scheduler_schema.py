@@ -0,0 +1,21 @@
+from dataclasses import field
+
+from pydantic.dataclasses import dataclass
+
+
+@dataclass
+class SchedulerConfig:
+    database_path: str = "./.scheduler/jobs.sqlite"
+    # Queued jobs with higher priority are launched first, jobs with equal priority in submission order
+    priority: int = 0
+    # accelerator_type -> maximum number of GPUs (nodes) in flight, accelerator types without a quota are not limited
+    gpu_quotas: dict[str, int] = field(default_factory=dict)
+    node_quotas: dict[str, int] = field(default_factory=dict)
+    poll_interval_s: float = 60.0
+
+
+def setup_config() -> None:
+    from hydra.core.config_store import ConfigStore
+
+    cs = ConfigStore.instance()
+    cs.store(group="infrastructure/scheduler", name="scheduler_schema", node=SchedulerConfig)
@@ -4,7 +4,6 @@
 from dataclasses import field
 from enum import Enum
 
-from hydra.core.config_store import ConfigStore
 from omegaconf import MISSING, SI
 from pydantic.dataclasses import dataclass
 
@@ -50,6 +49,8 @@ class VMTemplateConfig:
 
 
 def setup_config() -> None:
+    from hydra.core.config_store import ConfigStore
+
     cs = ConfigStore.instance()
     cs.store(group="infrastructure/vm_config", name="vm_template_schema", node=VMTemplateConfig)
     cs.store(group="infrastructure/vm_config/machine", name="machine_schema", node=MachineConfig)
@@ -0,0 +1,15 @@
+from pydantic.dataclasses import dataclass
+
+
+@dataclass
+class MetricsConfig:
+    aggregation_interval_s: float = 30.0
+    flush_every_n_intervals: int = 10
+    output_dir_name: str = "metrics"
+
+
+def setup_config() -> None:
+    from hydra.core.config_store import ConfigStore
+
+    cs = ConfigStore.instance()
+    cs.store(group="metrics", name="metrics_schema", node=MetricsConfig)
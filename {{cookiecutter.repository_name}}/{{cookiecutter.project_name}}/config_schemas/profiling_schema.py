@@ -0,0 +1,30 @@
+from enum import Enum
+from typing import Optional
+
+from pydantic.dataclasses import dataclass
+
+
+class ProfilerMode(Enum):
+    CPROFILE = "CPROFILE"
+    SAMPLING = "SAMPLING"
+    TRACEMALLOC = "TRACEMALLOC"
+
+
+@dataclass
+class ProfilingConfig:
+    enabled: bool = False
+    mode: ProfilerMode = ProfilerMode.CPROFILE
+    start_step: int = 0
+    # None means: profile until the task function returns
+    num_steps: Optional[int] = None
+    sampling_interval_s: float = 0.005
+    tracemalloc_frames: int = 10
+    top_k: int = 20
+    output_dir_name: str = "profiling"
+
+
+def setup_config() -> None:
+    from hydra.core.config_store import ConfigStore
+
+    cs = ConfigStore.instance()
+    cs.store(group="profiling", name="profiling_schema", node=ProfilingConfig)
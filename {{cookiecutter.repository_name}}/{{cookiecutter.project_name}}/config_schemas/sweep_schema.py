@@ -0,0 +1,31 @@
+from dataclasses import field
+from enum import Enum
+
+from pydantic.dataclasses import dataclass
+
+
+class SweepMode(Enum):
+    MIN = "MIN"
+    MAX = "MAX"
+
+
+@dataclass
+class SweepConfig:
+    # Gauge or histogram (its mean is used) logged by MetricsLogger, compared between trials at every rung
+    metric_name: str = "val_loss"
+    mode: SweepMode = SweepMode.MIN
+    # Rungs are at min_resource * reduction_factor^k steps, trials which reach max_resource steps run to completion
+    min_resource: int = 1000
+    max_resource: int = 81000
+    reduction_factor: int = 3
+    max_concurrent_trials: int = 4
+    poll_interval_s: float = 60.0
+    # One entry per trial, each a space separated list of Hydra overrides, e.g. ["+experiment=small_lr", "seed=7"]
+    trial_overrides: list[str] = field(default_factory=list)
+
+
+def setup_config() -> None:
+    from hydra.core.config_store import ConfigStore
+
+    cs = ConfigStore.instance()
+    cs.store(group="sweep", name="sweep_schema", node=SweepConfig)
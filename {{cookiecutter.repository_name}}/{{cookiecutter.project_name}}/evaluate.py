@@ -2,9 +2,7 @@
 
 from typing import TYPE_CHECKING
 
-from hydra.utils import instantiate
-
-from {{cookiecutter.project_name}}.utils.config_utils import get_pickle_config, instantiate_trainer, setup_logger
+from {{cookiecutter.project_name}}.utils.config_utils import get_pickle_config, setup_logger
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +13,14 @@
 @get_pickle_config(config_path="{{cookiecutter.project_name}}/configs/automatically_generated/", config_name="config")
 def evaluate(config: "Config") -> None:
     setup_logger()
+    # The evaluation engine is opt-in, as the remote startup script runs this task after every training
+    if config.evaluation.evaluate_function is None or config.evaluation.dataset_path is None:
+        logger.info("Skipping evaluation: evaluation.evaluate_function and evaluation.dataset_path are not set")
+        return
+
+    from {{cookiecutter.project_name}}.evaluation.evaluation_engine import EvaluationEngine
+
+    EvaluationEngine.from_config(config).run()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,264 @@
+import base64
+import csv
+import hashlib
+import json
+import os
+
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from io import StringIO
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence
+
+from {{cookiecutter.project_name}}.utils.config_utils import resolve_target
+from {{cookiecutter.project_name}}.utils.io_utils import (
+    GCS_FILE_SYSTEM_NAME,
+    GCS_PREFIX,
+    LOCAL_FILE_SYSTEM_NAME,
+    PROTOCOL_SEPARATOR,
+    choose_file_system,
+    is_path_exist,
+    load_json,
+    make_dirs,
+    open_file,
+)
+from {{cookiecutter.project_name}}.utils.utils import get_logger
+
+if TYPE_CHECKING:
+    from fsspec import AbstractFileSystem
+
+    from {{cookiecutter.project_name}}.config_schemas.config_schema import Config
+
+EVALUATION_LOGGER = get_logger(__name__)
+
+# (checkpoint_path, dataset_path, metric_names) -> {metric_name: value}. Runs in a worker process, so it has to be
+# a picklable (module level) function.
+EvaluateFunction = Callable[[str, str, Sequence[str]], dict[str, float]]
+
+HASH_CHUNK_SIZE = 8 * 1024 * 1024
+# Base64 encoded MD5 digest which GCS keeps in the metadata of (non-composite) objects, so hashing a remote
+# checkpoint needs no download
+GCS_MD5_HASH_KEY = "md5Hash"
+
+
+@dataclass
+class EvaluationTask:
+    checkpoint_path: str
+    checkpoint_hash: str
+    metric_names: list[str]
+
+
+@dataclass
+class EvaluationReport:
+    dataset_hash: str
+    rows: list[dict[str, Any]]
+    computed_cells: int = 0
+    cached_cells: int = 0
+    failed_checkpoints: list[str] = field(default_factory=list)
+
+
+def compute_file_hash(path: str) -> str:
+    file_system = choose_file_system(path)
+    if not file_system.isdir(path):
+        return _compute_file_system_hash(file_system, path)
+
+    # A directory checkpoint (e.g. sharded weights) is hashed from the relative paths and hashes of its files
+    root = file_system._strip_protocol(path)
+    digest = hashlib.sha256()
+    for file_path in sorted(file_system.find(path)):
+        digest.update(
+            f"{os.path.relpath(file_path, root)}:{_compute_file_system_hash(file_system, file_path)}\n".encode()
+        )
+    return f"sha256:{digest.hexdigest()}"
+
+
+def _compute_file_system_hash(file_system: "AbstractFileSystem", path: str) -> str:
+    # Always an MD5 of the content, so the same checkpoint gets the same hash in every store
+    md5_hash = file_system.info(path).get(GCS_MD5_HASH_KEY)
+    if md5_hash:
+        return f"md5:{base64.b64decode(md5_hash).hex()}"
+
+    digest = hashlib.md5()
+    with file_system.open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return f"md5:{digest.hexdigest()}"
+
+
+class EvaluationCache:
+    """
+    Persistent store of already computed metric values of an evaluate function, keyed by (evaluate function name,
+    checkpoint hash, dataset hash, metric name). Checkpoints are identified by their content, so moving a checkpoint
+    or uploading it to another store does not invalidate its results.
+    """
+
+    def __init__(self, path: str, evaluate_function_name: str) -> None:
+        self.path = path
+        self.evaluate_function_name = evaluate_function_name
+        self.values: dict[str, float] = load_json(path) if is_path_exist(path) else {}
+
+    @staticmethod
+    def key(evaluate_function_name: str, checkpoint_hash: str, dataset_hash: str, metric_name: str) -> str:
+        return f"{evaluate_function_name}|{checkpoint_hash}|{dataset_hash}|{metric_name}"
+
+    def get(self, checkpoint_hash: str, dataset_hash: str, metric_name: str) -> Optional[float]:
+        return self.values.get(self.key(self.evaluate_function_name, checkpoint_hash, dataset_hash, metric_name))
+
+    def set(self, checkpoint_hash: str, dataset_hash: str, metric_name: str, value: float) -> None:
+        self.values[self.key(self.evaluate_function_name, checkpoint_hash, dataset_hash, metric_name)] = value
+
+    def save(self) -> None:
+        with open_file(self.path, "w") as f:
+            f.write(json.dumps(self.values, indent=2, sort_keys=True))
+
+
+class EvaluationEngine:
+    """
+    Evaluates every checkpoint found under `checkpoints_dir` on `dataset_path` in a pool of `max_workers` processes.
+    Only (checkpoint, dataset, metric) cells missing from the cache are computed; the cache is saved after every
+    finished checkpoint and all values end up in `<output_dir>/results.csv`.
+    """
+
+    def __init__(
+        self,
+        evaluate_function: EvaluateFunction,
+        metric_names: Sequence[str],
+        dataset_path: str,
+        checkpoints_dir: str,
+        output_dir: str,
+        checkpoint_suffixes: Sequence[str] = (".ckpt",),
+        max_workers: Optional[int] = None,
+    ) -> None:
+        self.evaluate_function = evaluate_function
+        self.metric_names = list(metric_names)
+        self.dataset_path = dataset_path
+        self.checkpoints_dir = checkpoints_dir
+        self.output_dir = output_dir
+        self.checkpoint_suffixes = tuple(checkpoint_suffixes)
+        self.max_workers = max_workers
+
+    @classmethod
+    def from_config(cls, config: "Config") -> "EvaluationEngine":
+        evaluation_config = config.evaluation
+        if evaluation_config.evaluate_function is None or evaluation_config.dataset_path is None:
+            raise ValueError("Set evaluation.evaluate_function and evaluation.dataset_path to evaluate checkpoints")
+
+        base_path = config.infrastructure.base_path()
+        return cls(
+            resolve_target(evaluation_config.evaluate_function),
+            evaluation_config.metric_names,
+            evaluation_config.dataset_path,
+            checkpoints_dir=base_path,
+            output_dir=os.path.join(base_path, evaluation_config.output_dir_name),
+            checkpoint_suffixes=evaluation_config.checkpoint_suffixes,
+            max_workers=evaluation_config.max_workers,
+        )
+
+    @property
+    def evaluate_function_name(self) -> str:
+        return f"{self.evaluate_function.__module__}.{self.evaluate_function.__qualname__}"
+
+    @property
+    def cache_path(self) -> str:
+        return os.path.join(self.output_dir, "cache.json")
+
+    @property
+    def results_path(self) -> str:
+        return os.path.join(self.output_dir, "results.csv")
+
+    def discover_checkpoints(self) -> list[str]:
+        file_system = choose_file_system(self.checkpoints_dir)
+        if not file_system.isdir(self.checkpoints_dir):
+            return []
+
+        paths = [path for path in file_system.find(self.checkpoints_dir) if path.endswith(self.checkpoint_suffixes)]
+        if GCS_FILE_SYSTEM_NAME in file_system.protocol:
+            paths = [GCS_PREFIX + path for path in paths]
+        elif LOCAL_FILE_SYSTEM_NAME not in file_system.protocol:
+            protocol = file_system.protocol if isinstance(file_system.protocol, str) else file_system.protocol[0]
+            paths = [protocol + PROTOCOL_SEPARATOR + path for path in paths]
+        return sorted(paths)
+
+    def run(self) -> EvaluationReport:
+        if not self.output_dir.startswith(GCS_PREFIX):
+            make_dirs(self.output_dir)
+
+        checkpoint_paths = self.discover_checkpoints()
+        EVALUATION_LOGGER.info(f"Found {len(checkpoint_paths)} checkpoints under {self.checkpoints_dir}")
+
+        # Hashing is I/O bound (metadata lookups or streamed reads), so it runs in threads rather than processes
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            dataset_hash_future = executor.submit(compute_file_hash, self.dataset_path)
+            checkpoint_hashes = list(executor.map(compute_file_hash, checkpoint_paths))
+            dataset_hash = dataset_hash_future.result()
+
+        cache = EvaluationCache(self.cache_path, self.evaluate_function_name)
+        report = EvaluationReport(dataset_hash=dataset_hash, rows=[])
+        tasks = []
+        for checkpoint_path, checkpoint_hash in zip(checkpoint_paths, checkpoint_hashes):
+            missing_metric_names = [
+                metric_name
+                for metric_name in self.metric_names
+                if cache.get(checkpoint_hash, dataset_hash, metric_name) is None
+            ]
+            report.cached_cells += len(self.metric_names) - len(missing_metric_names)
+            if missing_metric_names:
+                tasks.append(EvaluationTask(checkpoint_path, checkpoint_hash, missing_metric_names))
+
+        if tasks:
+            EVALUATION_LOGGER.info(
+                f"Evaluating {len(tasks)} checkpoints ({report.cached_cells} cached metric values reused)"
+            )
+            self._evaluate_tasks(tasks, dataset_hash, cache, report)
+
+        for checkpoint_path, checkpoint_hash in zip(checkpoint_paths, checkpoint_hashes):
+            row: dict[str, Any] = {
+                "checkpoint_path": checkpoint_path,
+                "checkpoint_hash": checkpoint_hash,
+                "dataset_hash": dataset_hash,
+            }
+            for metric_name in self.metric_names:
+                row[metric_name] = cache.get(checkpoint_hash, dataset_hash, metric_name)
+            report.rows.append(row)
+        self.write_results_table(report.rows)
+
+        if report.failed_checkpoints:
+            raise RuntimeError(f"Evaluation failed for checkpoints: {report.failed_checkpoints}")
+        return report
+
+    def write_results_table(self, rows: list[dict[str, Any]]) -> None:
+        stream = StringIO()
+        writer = csv.DictWriter(
+            stream, fieldnames=["checkpoint_path", "checkpoint_hash", "dataset_hash"] + self.metric_names
+        )
+        writer.writeheader()
+        writer.writerows(rows)
+        with open_file(self.results_path, "w") as f:
+            f.write(stream.getvalue())
+        EVALUATION_LOGGER.info(f"Evaluation results of {len(rows)} checkpoints saved to {self.results_path}")
+
+    def _evaluate_tasks(
+        self, tasks: list[EvaluationTask], dataset_hash: str, cache: EvaluationCache, report: EvaluationReport
+    ) -> None:
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            futures: dict[Future[dict[str, float]], EvaluationTask] = {
+                executor.submit(
+                    self.evaluate_function, task.checkpoint_path, self.dataset_path, task.metric_names
+                ): task
+                for task in tasks
+            }
+            for future in as_completed(futures):
+                task = futures[future]
+                try:
+                    metric_values = future.result()
+                    # A missing or non-numeric metric fails the checkpoint like any other error of the evaluate function
+                    values = {metric_name: float(metric_values[metric_name]) for metric_name in task.metric_names}
+                except Exception:
+                    EVALUATION_LOGGER.exception(f"Failed to evaluate {task.checkpoint_path}")
+                    report.failed_checkpoints.append(task.checkpoint_path)
+                    continue
+
+                for metric_name, value in values.items():
+                    cache.set(task.checkpoint_hash, dataset_hash, metric_name, value)
+                report.computed_cells += len(task.metric_names)
+                cache.save()
+                EVALUATION_LOGGER.info(f"Evaluated {task.checkpoint_path}: {metric_values}")
@@ -0,0 +1,46 @@
+import argparse
+import os
+
+from {{cookiecutter.project_name}}.utils.config_utils import load_pickle_config, setup_logger
+from {{cookiecutter.project_name}}.utils.local_launcher import DEFAULT_WORKING_DIR_ROOT, TASK_FUNCTIONS, LocalProcessLauncher
+
+DEFAULT_CONFIG_PATH = "./{{cookiecutter.project_name}}/configs/automatically_generated/config.pickle"
+
+
+def run_local_jobs(args: argparse.Namespace) -> None:
+    setup_logger()
+    launcher = LocalProcessLauncher(TASK_FUNCTIONS[args.task], args.working_dir, max_workers=args.max_workers)
+    try:
+        for config_path in args.config_paths or [DEFAULT_CONFIG_PATH]:
+            config_dir, config_file_name = os.path.split(config_path)
+            launcher.launch(load_pickle_config(config_dir, os.path.splitext(config_file_name)[0]))
+        job_infos = launcher.wait()
+    finally:
+        launcher.close()
+
+    for job_info in job_infos:
+        job_info.print_job_info()
+    failed_job_ids = [job_info.job_id for job_info in job_infos if job_info.exit_code != 0]
+    if failed_job_ids:
+        raise RuntimeError(f"Jobs failed: {failed_job_ids}, see their job.log")
+
+
+def run_local_jobs_args_parser() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run jobs of compiled configs in local processes pinned to CPU cores")
+
+    parser.add_argument("--task", type=str, choices=list(TASK_FUNCTIONS), default="train", help="Task of every job")
+    parser.add_argument(
+        "--config-paths",
+        nargs="*",
+        default=[],
+        help=f"Pickled configs, one job per config (default: {DEFAULT_CONFIG_PATH})",
+    )
+    parser.add_argument("--max-workers", type=int, default=None, help="Number of concurrent jobs (default: CPU count)")
+    parser.add_argument(
+        "--working-dir", type=str, default=DEFAULT_WORKING_DIR_ROOT, help="Root of the job working dirs"
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    run_local_jobs(run_local_jobs_args_parser())
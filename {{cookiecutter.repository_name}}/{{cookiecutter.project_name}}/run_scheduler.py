@@ -0,0 +1,25 @@
+from typing import TYPE_CHECKING
+
+from {{cookiecutter.project_name}}.utils.config_utils import get_pickle_config, setup_logger
+
+if TYPE_CHECKING:
+    from {{cookiecutter.project_name}}.config_schemas.config_schema import Config
+
+
+@get_pickle_config(config_path="{{cookiecutter.project_name}}/configs/automatically_generated/", config_name="config")
+def run(config: "Config") -> None:
+    from {{cookiecutter.project_name}}.utils.gcp_training_launcher import DistributedJobLauncher
+    from {{cookiecutter.project_name}}.utils.job_scheduler import JobScheduler
+
+    setup_logger()
+    launcher = DistributedJobLauncher(config.infrastructure.project_id, config.infrastructure.zone)
+    # Quotas and the queue location are read from the scheduler section of the generated config
+    scheduler = JobScheduler.from_config(config, backend=launcher)
+    try:
+        scheduler.run(config.infrastructure.scheduler.poll_interval_s)
+    finally:
+        scheduler.close()
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,21 @@
+from typing import TYPE_CHECKING
+
+from {{cookiecutter.project_name}}.utils.config_utils import get_pickle_config, setup_logger
+
+if TYPE_CHECKING:
+    from {{cookiecutter.project_name}}.config_schemas.config_schema import Config
+
+
+@get_pickle_config(config_path="{{cookiecutter.project_name}}/configs/automatically_generated/", config_name="config")
+def submit(config: "Config") -> None:
+    from {{cookiecutter.project_name}}.utils.job_scheduler import JobScheduler
+
+    setup_logger()
+    scheduler = JobScheduler.from_config(config)
+    job = scheduler.submit(config)
+    scheduler.close()
+    print(f"Job {job.job_id} ({job.name}) queued with priority {job.priority}, start it with `make run-scheduler`")
+
+
+if __name__ == "__main__":
+    submit()
@@ -0,0 +1,42 @@
+import argparse
+import shlex
+
+from typing import TYPE_CHECKING
+
+from {{cookiecutter.project_name}}.utils.config_utils import compose_config, config_args_parser
+
+if TYPE_CHECKING:
+    from {{cookiecutter.project_name}}.config_schemas.config_schema import Config
+
+
+def sweep(args: argparse.Namespace) -> None:
+    from omegaconf import OmegaConf
+
+    from {{cookiecutter.project_name}}.utils.gcp_training_launcher import DistributedJobLauncher
+    from {{cookiecutter.project_name}}.utils.sweep_controller import SweepController
+
+    config = compose_config(config_path=args.config_path, config_name=args.config_name, overrides=args.overrides)
+
+    trial_configs: list["Config"] = []
+    for trial_index, trial_overrides in enumerate(config.sweep.trial_overrides):
+        trial_config = compose_config(
+            config_path=args.config_path,
+            config_name=args.config_name,
+            overrides=[*args.overrides, *shlex.split(trial_overrides)],
+            to_object=False,
+        )
+        # Trials are composed within the same second, the run tag keeps their job ids (and base paths) apart
+        trial_config.job_info.run_tag = f"{trial_config.job_info.run_tag}-trial{trial_index}"
+        trial_configs.append(OmegaConf.to_object(trial_config))  # type: ignore
+
+    launcher = DistributedJobLauncher(config.infrastructure.project_id, config.infrastructure.zone)
+    controller = SweepController.from_config(config, trial_configs, launcher)
+    best_trial = controller.run(config.sweep.poll_interval_s)
+    if best_trial is None:
+        print("No trial completed")
+    else:
+        print(f"Best trial: {best_trial.name} ({config.sweep.metric_name} {best_trial.last_value})")
+
+
+if __name__ == "__main__":
+    sweep(config_args_parser())
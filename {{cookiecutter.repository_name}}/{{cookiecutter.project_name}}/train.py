@@ -2,11 +2,7 @@
 
 from typing import TYPE_CHECKING
 
-from hydra.utils import instantiate
-
-from {{cookiecutter.project_name}}.training.data_modules import DataModule
-from {{cookiecutter.project_name}}.utils.config_utils import get_pickle_config, instantiate_trainer, setup_logger
-from {{cookiecutter.project_name}}.utils.io_utils import is_file
+from {{cookiecutter.project_name}}.utils.config_utils import get_pickle_config, setup_logger
 
 logger = logging.getLogger(__name__)
 
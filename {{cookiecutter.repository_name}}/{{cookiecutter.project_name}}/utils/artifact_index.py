@@ -0,0 +1,116 @@
+import json
+import os
+import time
+
+from typing import Any, Optional
+
+from {{cookiecutter.project_name}}.utils.io_utils import (
+    PROTOCOL_SEPARATOR,
+    choose_file_system,
+    is_path_exist,
+    list_paths,
+    make_dirs,
+    open_file,
+)
+from {{cookiecutter.project_name}}.utils.utils import get_latest_filename, get_logger
+
+ARTIFACT_INDEX_LOGGER = get_logger(__name__)
+
+LATEST_FILE_NAME = "LATEST"
+MANIFEST_FILE_NAME = "MANIFEST.jsonl"
+INDEX_FILE_NAMES = {LATEST_FILE_NAME, MANIFEST_FILE_NAME}
+
+# Artifact directories are indexed with two small files written next to the artifacts:
+#   - MANIFEST.jsonl: one JSON entry per registered artifact, in registration order
+#   - LATEST: the entry of the registered artifact with the highest step (the most recent one when steps are not
+#     given), which is the artifact a scan of the directory resolves to
+# Entries store artifact names relative to the directory, so an index stays valid when the directory is copied
+# (e.g. by translate_gcs_dir_to_local). Each directory is expected to have a single writer.
+
+
+def register_artifact(artifact_path: str, step: Optional[int] = None, **metadata: Any) -> dict[str, Any]:
+    """
+    Has to be called after the artifact is completely written, so readers never resolve a partial artifact.
+    """
+    artifact_dir, artifact_name = os.path.split(artifact_path.rstrip("/"))
+    entry = {"name": artifact_name, "step": step, "created_at": time.time(), **metadata}
+    if PROTOCOL_SEPARATOR not in artifact_dir:
+        make_dirs(artifact_dir)
+
+    # The manifest is updated first, so LATEST never points to an artifact missing from the manifest
+    _append_line(os.path.join(artifact_dir, MANIFEST_FILE_NAME), json.dumps(entry))
+    latest_path = os.path.join(artifact_dir, LATEST_FILE_NAME)
+    if _is_after_latest(latest_path, step):
+        _write_text_atomically(latest_path, json.dumps(entry))
+        ARTIFACT_INDEX_LOGGER.debug(f"Registered {artifact_name} as the latest artifact in {artifact_dir}")
+    else:
+        ARTIFACT_INDEX_LOGGER.debug(f"Registered {artifact_name} in {artifact_dir}")
+    return entry
+
+
+def get_latest_artifact(artifact_dir: str) -> Optional[str]:
+    try:
+        entry = json.loads(_read_text(os.path.join(artifact_dir, LATEST_FILE_NAME)))
+    except FileNotFoundError:
+        return _scan_latest_artifact(artifact_dir)
+    latest_artifact: str = os.path.join(artifact_dir, entry["name"])
+    return latest_artifact
+
+
+def read_manifest(artifact_dir: str) -> list[dict[str, Any]]:
+    manifest_path = os.path.join(artifact_dir, MANIFEST_FILE_NAME)
+    if not is_path_exist(manifest_path):
+        return []
+    return [json.loads(line) for line in _read_text(manifest_path).splitlines() if line]
+
+
+def _is_after_latest(latest_path: str, step: Optional[int]) -> bool:
+    try:
+        latest_step = json.loads(_read_text(latest_path))["step"]
+    except FileNotFoundError:
+        return True
+    return step is None or latest_step is None or step >= latest_step
+
+
+def _scan_latest_artifact(artifact_dir: str) -> Optional[str]:
+    artifact_paths = {os.path.basename(path.rstrip("/")): path for path in list_paths(artifact_dir)}
+    artifact_paths = {name: path for name, path in artifact_paths.items() if not _is_index_file(name)}
+    if not artifact_paths:
+        return None
+
+    ARTIFACT_INDEX_LOGGER.info(f"No {LATEST_FILE_NAME} pointer in {artifact_dir}, scanned {len(artifact_paths)} paths")
+    return artifact_paths[get_latest_filename(list(artifact_paths))]
+
+
+def _is_index_file(name: str) -> bool:
+    return name in INDEX_FILE_NAMES or name.startswith(f"{LATEST_FILE_NAME}.")
+
+
+def _read_text(path: str) -> str:
+    with open_file(path, "r") as f:
+        text: str = f.read()
+    return text
+
+
+def _append_line(path: str, line: str) -> None:
+    if PROTOCOL_SEPARATOR in path:
+        # Objects in remote file systems (e.g. GCS) can not be appended to, so the manifest is rewritten
+        manifest = _read_text(path) if is_path_exist(path) else ""
+        with open_file(path, "w") as f:
+            f.write(f"{manifest}{line}\n")
+    else:
+        with open_file(path, "a") as f:
+            f.write(f"{line}\n")
+
+
+def _write_text_atomically(path: str, text: str) -> None:
+    if PROTOCOL_SEPARATOR in path:
+        # Object uploads are atomic already
+        with open_file(path, "w") as f:
+            f.write(text)
+        return
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open_file(tmp_path, "w") as f:
+        f.write(text)
+    choose_file_system(path).mv(tmp_path, path)
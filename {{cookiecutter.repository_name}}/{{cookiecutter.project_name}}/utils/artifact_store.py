@@ -0,0 +1,163 @@
+import hashlib
+import json
+import os
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, BinaryIO
+
+from {{cookiecutter.project_name}}.utils.io_utils import (
+    PROTOCOL_SEPARATOR,
+    choose_file_system,
+    is_path_exist,
+    make_dirs,
+    open_file,
+)
+from {{cookiecutter.project_name}}.utils.utils import get_logger
+
+if TYPE_CHECKING:
+    from {{cookiecutter.project_name}}.config_schemas.infrastructure.infrastructure_schema import InfrastructureConfig
+
+ARTIFACT_STORE_LOGGER = get_logger(__name__)
+
+CAS_DIR_NAME = "cas"
+HASH_ALGORITHM = "sha256"
+CHUNK_SIZE = 8 * 1024 * 1024
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class ArtifactEntry:
+    digest: str
+    size: int
+    uploaded: bool = False
+
+
+class ArtifactStore:
+    """
+    Content addressed store for artifacts shared between runs (preprocessed data, vocabularies, frozen weights...).
+    Blobs are stored once under `<root>/sha256/<first two hex digits>/<digest>`, and runs only write small manifests
+    mapping artifact names to digests. Blobs which already exist in the store are not uploaded again.
+    """
+
+    def __init__(self, root: str, max_workers: int = 8) -> None:
+        self.root = root.rstrip("/")
+        self.max_workers = max_workers
+
+    @classmethod
+    def from_infrastructure_config(cls, config: "InfrastructureConfig", **kwargs: int) -> "ArtifactStore":
+        return cls(os.path.join(config.gcs_bucket, CAS_DIR_NAME), **kwargs)
+
+    def blob_path(self, digest: str) -> str:
+        return os.path.join(self.root, HASH_ALGORITHM, digest[:2], digest)
+
+    def has_blob(self, digest: str) -> bool:
+        return is_path_exist(self.blob_path(digest))
+
+    def put_file(self, path: str) -> ArtifactEntry:
+        digest, size = compute_digest(path)
+        blob_path = self.blob_path(digest)
+        if is_path_exist(blob_path):
+            ARTIFACT_STORE_LOGGER.debug(f"Skipping upload of {path}, blob {digest} already exists")
+            return ArtifactEntry(digest, size)
+
+        with open_file(path, "rb", compression=None) as source:
+            self._write_blob(blob_path, source)
+        ARTIFACT_STORE_LOGGER.info(f"Uploaded {path} ({size} bytes) as blob {digest}")
+        return ArtifactEntry(digest, size, uploaded=True)
+
+    def put_files(self, paths: dict[str, str]) -> dict[str, ArtifactEntry]:
+        """
+        Uploads {artifact name: path} in parallel, returns {artifact name: entry}.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            entries = dict(zip(paths, executor.map(self.put_file, paths.values())))
+
+        uploaded_bytes = sum(entry.size for entry in entries.values() if entry.uploaded)
+        skipped_bytes = sum(entry.size for entry in entries.values() if not entry.uploaded)
+        ARTIFACT_STORE_LOGGER.info(
+            f"Stored {len(entries)} artifacts: {uploaded_bytes} bytes uploaded, {skipped_bytes} bytes deduplicated"
+        )
+        return entries
+
+    def put_dir(self, dir_path: str) -> dict[str, ArtifactEntry]:
+        file_system = choose_file_system(dir_path)
+        root = file_system._strip_protocol(dir_path)
+        paths = {
+            os.path.relpath(path, root): _with_protocol(path, dir_path) for path in sorted(file_system.find(dir_path))
+        }
+        return self.put_files(paths)
+
+    def get_file(self, digest: str, target_path: str) -> None:
+        target_dir = os.path.dirname(target_path)
+        if target_dir and PROTOCOL_SEPARATOR not in target_dir:
+            make_dirs(target_dir)
+        with open_file(self.blob_path(digest), "rb") as source:
+            with open_file(target_path, "wb", compression=None) as target:
+                _copy_stream(source, target)
+
+    def write_manifest(self, manifest_path: str, entries: dict[str, ArtifactEntry]) -> None:
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "algorithm": HASH_ALGORITHM,
+            "root": self.root,
+            "artifacts": {name: {"digest": entry.digest, "size": entry.size} for name, entry in entries.items()},
+        }
+        with open_file(manifest_path, "w") as f:
+            f.write(json.dumps(manifest, indent=2, sort_keys=True))
+
+    def read_manifest(self, manifest_path: str) -> dict[str, ArtifactEntry]:
+        with open_file(manifest_path, "r") as f:
+            manifest = json.load(f)
+        return {name: ArtifactEntry(**artifact) for name, artifact in manifest["artifacts"].items()}
+
+    def store_run_artifacts(self, paths: dict[str, str], manifest_path: str) -> dict[str, ArtifactEntry]:
+        entries = self.put_files(paths)
+        self.write_manifest(manifest_path, entries)
+        return entries
+
+    def restore_run_artifacts(self, manifest_path: str, target_dir: str) -> dict[str, str]:
+        """
+        Downloads every artifact of a manifest to `target_dir`, returns {artifact name: downloaded path}.
+        """
+        entries = self.read_manifest(manifest_path)
+        target_paths = {name: os.path.join(target_dir, name) for name in entries}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            list(executor.map(self.get_file, [entry.digest for entry in entries.values()], target_paths.values()))
+        return target_paths
+
+    def _write_blob(self, blob_path: str, source: BinaryIO) -> None:
+        if PROTOCOL_SEPARATOR in blob_path:
+            # Object uploads are atomic, so concurrent runs uploading the same blob can not corrupt it
+            with open_file(blob_path, "wb") as target:
+                _copy_stream(source, target)
+            return
+
+        make_dirs(os.path.dirname(blob_path))
+        tmp_path = f"{blob_path}.{os.getpid()}-{threading.get_ident()}.tmp"
+        with open_file(tmp_path, "wb") as target:
+            _copy_stream(source, target)
+        choose_file_system(blob_path).mv(tmp_path, blob_path)
+
+
+def compute_digest(path: str) -> tuple[str, int]:
+    digest = hashlib.new(HASH_ALGORITHM)
+    size = 0
+    # Blobs are stored byte for byte, so compressed artifacts (e.g. data.csv.gz) are hashed and copied as they are
+    with open_file(path, "rb", compression=None) as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+            size += len(chunk)
+    return digest.hexdigest(), size
+
+
+def _copy_stream(source: BinaryIO, target: BinaryIO) -> None:
+    for chunk in iter(lambda: source.read(CHUNK_SIZE), b""):
+        target.write(chunk)
+
+
+def _with_protocol(path: str, reference_path: str) -> str:
+    if PROTOCOL_SEPARATOR in reference_path and PROTOCOL_SEPARATOR not in path:
+        return reference_path.split(PROTOCOL_SEPARATOR, 1)[0] + PROTOCOL_SEPARATOR + path
+    return path
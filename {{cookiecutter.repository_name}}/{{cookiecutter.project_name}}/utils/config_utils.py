@@ -1,68 +1,92 @@
 import argparse
+import atexit
 import importlib
 import logging.config
 import os
 import pickle
 import sys
 
-from dataclasses import asdict
-from functools import partial
+from dataclasses import asdict, fields, is_dataclass
+from functools import lru_cache, partial, wraps
 from io import BytesIO, StringIO
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Mapping, Optional, cast
 
-import hydra
-import yaml
-
-from hydra import compose, initialize
-from hydra.types import TaskFunction
-from hydra.utils import instantiate
-from omegaconf import DictConfig, OmegaConf
-
-from {{cookiecutter.project_name}}.config_schemas import config_schema
-from {{cookiecutter.project_name}}.config_schemas.trainer.trainer_schema import TrainerConfig
+from {{cookiecutter.project_name}}.utils.frozen_config import freeze_config
 from {{cookiecutter.project_name}}.utils.io_utils import open_file
-from {{cookiecutter.project_name}}.utils.utils import get_logger
+from {{cookiecutter.project_name}}.utils.utils import get_logger, start_log_queue_listener
 
 CONFIG_UTILS_LOGGER = get_logger(Path(__file__).name)
 
+LOGGING_CONFIG_PATH = "./{{cookiecutter.project_name}}/configs/hydra/job_logging/custom.yaml"
+_LOG_QUEUE_LISTENER: Optional[QueueListener] = None
+# Set on remote VMs to load the job's config uploaded by DistributedJobLauncher instead of the one baked into the image
+CONFIG_DIR_ENV_VARIABLE = "CONFIG_DIR"
 
+
+# hydra, omegaconf, yaml and the config schemas are imported inside the functions that use them,
+# so that importing an entry point stays cheap
 if TYPE_CHECKING:
+    from hydra.types import TaskFunction
+    from omegaconf import DictConfig
+
     from {{cookiecutter.project_name}}.config_schemas.config_schema import Config
 
 
 def get_config(
-    config_path: str, config_name: str
-) -> Callable[[TaskFunction], Callable[[Optional[dict[Any, Any]]], None]]:
-    setup_config()
-    setup_logger()
-
-    def main_decorator(task_function: TaskFunction) -> Callable[[Optional[dict[Any, Any]]], None]:
-        @hydra.main(config_path=config_path, config_name=config_name, version_base=None)
+    config_path: str, config_name: str, freeze: bool = False
+) -> Callable[["TaskFunction"], Callable[[Optional[dict[Any, Any]]], None]]:
+    def main_decorator(task_function: "TaskFunction") -> Callable[[Optional[dict[Any, Any]]], None]:
+        @wraps(task_function)
         def decorated_main(dict_config: Optional[dict[Any, Any]] = None) -> None:
-            config = OmegaConf.to_object(dict_config)
-            task_function(config)
+            import hydra
 
-        return decorated_main  # type: ignore
+            from omegaconf import OmegaConf
 
-    return main_decorator
+            setup_config()
+            setup_logger()
 
+            @hydra.main(config_path=config_path, config_name=config_name, version_base=None)
+            def hydra_main(dict_config: Optional[dict[Any, Any]] = None) -> None:
+                # Hydra replaced the handlers with the ones of its `hydra/job_logging` config
+                queue_log_handlers()
+                config = OmegaConf.to_object(dict_config)
+                if freeze:
+                    config = freeze_config(config)
+                task_function(config)
 
-def get_pickle_config(config_path: str, config_name: str) -> Callable[[TaskFunction], Callable[[], None]]:
-    setup_config()
-    setup_logger()
+            hydra_main(dict_config)
+
+        return decorated_main
+
+    return main_decorator
 
-    def main_decorator(task_function: TaskFunction) -> Callable[[], None]:
+
+def get_pickle_config(
+    config_path: str, config_name: str, freeze: bool = False
+) -> Callable[["TaskFunction"], Callable[[], None]]:
+    def main_decorator(task_function: "TaskFunction") -> Callable[[], None]:
+        # `__wrapped__` gives access to the task function, e.g. to run it with a given config in LocalProcessLauncher
+        @wraps(task_function)
         def decorated_main() -> None:
-            config = load_pickle_config(config_path, config_name)
-            task_function(config)
+            from {{cookiecutter.project_name}}.utils.profiling import profile_task
+
+            setup_logger()
+            config = load_pickle_config(os.environ.get(CONFIG_DIR_ENV_VARIABLE) or config_path, config_name)
+            if freeze:
+                config = freeze_config(config)
+            with profile_task(config):
+                task_function(config)
 
         return decorated_main
 
     return main_decorator
 
 
-def create_final_config(config: DictConfig) -> None:
+def create_final_config(config: "DictConfig") -> None:
+    from omegaconf import OmegaConf
+
     config_save_dir = Path("./{{cookiecutter.project_name}}/configs/automatically_generated/")
     prepare_config_dir(config_save_dir)
 
@@ -108,6 +132,9 @@ def config_args_parser() -> argparse.Namespace:
 def compose_config(
     config_path: str, config_name: str, overrides: Optional[list[str]] = None, to_object: bool = True
 ) -> Any:
+    from hydra import compose, initialize
+    from omegaconf import OmegaConf
+
     setup_config()
     setup_logger()
     if overrides is None:
@@ -120,16 +147,60 @@ def compose_config(
 
 
 def setup_config() -> None:
+    from {{cookiecutter.project_name}}.config_schemas import config_schema
+
     config_schema.setup_config()
 
 
-def setup_logger() -> None:
-    with open_file("./{{cookiecutter.project_name}}/configs/hydra/job_logging/custom.yaml", "r") as stream:
+def setup_logger(logging_config_path: Optional[str] = None, force: bool = False) -> None:
+    """
+    Applies the logging config (LOGGING_CONFIG_PATH by default) once per process, unless `force`d.
+    """
+    if _LOG_QUEUE_LISTENER is not None and not force:
+        return
+
+    import yaml
+
+    with open_file(logging_config_path or LOGGING_CONFIG_PATH, "r") as stream:
         config = yaml.load(stream, Loader=yaml.FullLoader)
     logging.config.dictConfig(config)
+    queue_log_handlers()
+
+
+def queue_log_handlers() -> None:
+    """
+    Moves the current handlers of the root logger behind a log queue. Has to be called again whenever logging is
+    reconfigured (e.g. by Hydra), because dictConfig replaces the QueueHandler.
+    """
+    global _LOG_QUEUE_LISTENER
+    stop_logger()
+    _LOG_QUEUE_LISTENER = start_log_queue_listener(logging.getLogger())
+    atexit.unregister(stop_logger)
+    atexit.register(stop_logger)
+
+
+def stop_logger() -> None:
+    """
+    Stops the log queue after handling the queued records, and puts its handlers back on the root logger unless
+    logging was reconfigured in the meantime.
+    """
+    global _LOG_QUEUE_LISTENER
+    if _LOG_QUEUE_LISTENER is None:
+        return
+
+    listener, _LOG_QUEUE_LISTENER = _LOG_QUEUE_LISTENER, None
+    listener.stop()
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        if isinstance(handler, QueueHandler) and handler.queue is listener.queue:
+            root_logger.removeHandler(handler)
+            for listener_handler in listener.handlers:
+                root_logger.addHandler(listener_handler)
 
 
 def save_config_as_yaml(config: "Config", save_path: str) -> None:
+    from omegaconf import OmegaConf
+
     text_io = StringIO()
     text_io.writelines(
         [
@@ -168,21 +239,66 @@ def remove_attribute_return_as_dict(config: Any, *parameters_to_remove: str) ->
 
 
 def custom_instantiate(config: Any) -> Any:
-    config_as_dict = asdict(config)
-    if "_target_" not in config_as_dict:
+    if isinstance(config, Mapping):
+        parameters = dict(config)
+    else:
+        field_names = get_field_names(cast(Hashable, type(config)))
+        parameters = {field_name: getattr(config, field_name) for field_name in field_names}
+
+    if "_target_" not in parameters:
         raise ValueError("'config' has to have '_target_' key in order to be instantiated...")
 
-    _target_ = config_as_dict["_target_"]
-    _partial_ = config_as_dict.get("_partial_", False)
+    _target_ = parameters.pop("_target_")
+    _partial_ = parameters.pop("_partial_", False)
+    _recursive_ = parameters.pop("_recursive_", True)
 
-    config_as_dict.pop("_target_", None)
-    config_as_dict.pop("_partial_", None)
+    if _recursive_:
+        parameters = {key: _instantiate_node(value) for key, value in parameters.items()}
 
-    splitted_target = _target_.split(".")
-    module_name, class_name = ".".join(splitted_target[:-1]), splitted_target[-1]
+    _class = resolve_target(_target_)
+    if _partial_:
+        return partial(_class, **parameters)
+    return _class(**parameters)
+
+
+@lru_cache(maxsize=None)
+def resolve_target(_target_: str) -> Any:
+    module_name, _, attribute_name = _target_.rpartition(".")
+    if not module_name:
+        raise ValueError(f"'_target_' has to be a fully qualified name, got: '{_target_}'")
 
     module = importlib.import_module(module_name)
-    _class = getattr(module, class_name)
-    if _partial_:
-        return partial(_class, **config_as_dict)
-    return _class(**config_as_dict)
+    return getattr(module, attribute_name)
+
+
+@lru_cache(maxsize=None)
+def get_field_names(config_class: Hashable) -> tuple[str, ...]:
+    return tuple(config_field.name for config_field in fields(cast(type, config_class)))
+
+
+def _is_target_node(node: Any) -> bool:
+    if isinstance(node, Mapping):
+        return "_target_" in node
+    return is_dataclass(node) and not isinstance(node, type) and "_target_" in get_field_names(type(node))
+
+
+def _instantiate_node(node: Any) -> Any:
+    # Only nodes with '_target_' and the lists/dicts leading to them are rebuilt, everything else is passed as it is
+    if isinstance(node, (str, int, float, bool)) or node is None:
+        return node
+    if _is_target_node(node):
+        return custom_instantiate(node)
+    if isinstance(node, (list, tuple)):
+        instantiated_items = [_instantiate_node(item) for item in node]
+        if all(instantiated is item for instantiated, item in zip(instantiated_items, node)):
+            return node
+        if hasattr(node, "_fields"):
+            # Named tuples take their fields as positional arguments
+            return type(node)(*instantiated_items)
+        return type(node)(instantiated_items)
+    if isinstance(node, dict):
+        instantiated_values = {key: _instantiate_node(value) for key, value in node.items()}
+        if all(instantiated_values[key] is value for key, value in node.items()):
+            return node
+        return instantiated_values
+    return node
@@ -0,0 +1,125 @@
+import inspect
+
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from typing import Any, NoReturn, TypeVar
+
+T = TypeVar("T")
+
+_FROZEN_CLASSES: dict[type, type["FrozenConfig"]] = {}
+
+
+class FrozenDict(dict):
+    def _readonly(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(f"{type(self).__name__} is read-only")
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = __ior__ = _readonly
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        return hash(frozenset(self.items()))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return type(self), (dict(self),)
+
+
+class FrozenConfig:
+    """
+    Base class of the read-only config views created by `freeze_config`. Every config class gets its own subclass
+    with `__slots__` for its fields, and `**config` expansion returns a precomputed tuple of field names.
+    """
+
+    __slots__ = ()
+    _source_class: type = object
+    _field_names: tuple[str, ...] = ()
+
+    def keys(self) -> tuple[str, ...]:
+        return self._field_names
+
+    def __getitem__(self, key: str) -> Any:
+        # Only fields are keys, so methods and properties of the config are not reachable as items
+        if key not in self._field_names:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setattr__(self, name: str, value: Any) -> NoReturn:
+        raise AttributeError(f"{type(self).__name__} is read-only, can not set '{name}'")
+
+    def __delattr__(self, name: str) -> NoReturn:
+        raise AttributeError(f"{type(self).__name__} is read-only, can not delete '{name}'")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FrozenConfig) or self._source_class is not other._source_class:
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __hash__(self) -> int:
+        return hash((self._source_class, self._values()))
+
+    def __repr__(self) -> str:
+        parameters = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._field_names)
+        return f"{type(self).__name__}({parameters})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Frozen classes are created at runtime, so they are pickled through the class they were created from
+        return _create_frozen_config, (self._source_class, self._values())
+
+    def _values(self) -> tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self._field_names)
+
+
+def freeze_config(config: T) -> T:
+    """
+    Converts a validated config tree (e.g. `Config`) into read-only `FrozenConfig` views: dataclasses become slotted
+    objects with the same fields and methods, lists become tuples and dicts become `FrozenDict`s. Meant to be called
+    once at startup, for code which reads the config in hot loops.
+    """
+    frozen_config: T = _freeze_value(config)
+    return frozen_config
+
+
+def get_frozen_class(config_class: type) -> type[FrozenConfig]:
+    frozen_class = _FROZEN_CLASSES.get(config_class)
+    if frozen_class is None:
+        frozen_class = _create_frozen_class(config_class)
+        _FROZEN_CLASSES[config_class] = frozen_class
+    return frozen_class
+
+
+def _create_frozen_class(config_class: type) -> type[FrozenConfig]:
+    field_names = tuple(config_field.name for config_field in fields(config_class))
+    namespace: dict[str, Any] = {
+        "__slots__": field_names,
+        "__module__": config_class.__module__,
+        "__qualname__": f"Frozen{config_class.__qualname__}",
+        "_source_class": config_class,
+        "_field_names": field_names,
+    }
+    # Methods and properties (e.g. InfrastructureConfig.base_path) work on the frozen view as they only read fields
+    for base_class in reversed(config_class.__mro__[:-1]):
+        for name, attribute in vars(base_class).items():
+            if name.startswith("__") or name in namespace or hasattr(FrozenConfig, name):
+                continue
+            if inspect.isfunction(attribute) or isinstance(attribute, (property, staticmethod, classmethod)):
+                namespace[name] = attribute
+    return type(f"Frozen{config_class.__name__}", (FrozenConfig,), namespace)
+
+
+def _create_frozen_config(config_class: type, values: tuple[Any, ...]) -> FrozenConfig:
+    frozen_class = get_frozen_class(config_class)
+    frozen_config = object.__new__(frozen_class)
+    for name, value in zip(frozen_class._field_names, values):
+        object.__setattr__(frozen_config, name, value)
+    return frozen_config
+
+
+def _freeze_value(value: Any) -> Any:
+    if isinstance(value, (str, int, float, bool, Enum, FrozenConfig)) or value is None:
+        return value
+    if is_dataclass(value) and not isinstance(value, type):
+        field_names = get_frozen_class(type(value))._field_names
+        return _create_frozen_config(type(value), tuple(_freeze_value(getattr(value, name)) for name in field_names))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_value(item) for item in value)
+    if isinstance(value, dict):
+        return FrozenDict({key: _freeze_value(item) for key, item in value.items()})
+    return value
@@ -1,19 +1,24 @@
 import dataclasses
 import inspect
 import logging
+import os
 import time
 import typing as t
 
 from dataclasses import dataclass
 
-from google.cloud import compute_v1
-
 from {{cookiecutter.project_name}}.config_schemas.infrastructure.infrastructure_schema import InfrastructureConfig
 from {{cookiecutter.project_name}}.config_schemas.infrastructure.job_info_schema import JobInfo
 from {{cookiecutter.project_name}}.config_schemas.infrastructure.vm_config_schema import VMMode, VMTemplateConfig
-from {{cookiecutter.project_name}}.utils.gcp_utils import get_disk_image, wait_for_extended_operation
+from {{cookiecutter.project_name}}.utils.gcp_utils import get_disk_image, is_not_found_error, wait_for_extended_operation
+from {{cookiecutter.project_name}}.utils.job_launcher import JobLauncher
 from {{cookiecutter.project_name}}.utils.utils import get_logger
 
+if t.TYPE_CHECKING:
+    from google.cloud import compute_v1
+
+    from {{cookiecutter.project_name}}.config_schemas.config_schema import Config
+
 GCP_TRAINING_LAUNCHER_LOGGER = get_logger(__name__)
 
 
@@ -27,6 +32,7 @@ class VMMetadata:
     zone: str
     python_hash_seed: int
     node_count: int = 1
+    config_dir: str = ""
     additional_metadata: t.Mapping[str, str] = dataclasses.field(default_factory=dict)
 
     def to_dict(self) -> dict[str, t.Any]:
@@ -94,13 +100,37 @@ def _get_job_tracking_links(self) -> tuple[str, str, str, str]:
         return instance_ids_regex, log_viewer_url, monitoring_group_create_url, train_cluster_url
 
 
-class DistributedJobLauncher:
-    def __init__(self, project_id: str, zone: str):
+class DistributedJobLauncher(JobLauncher):
+    def __init__(self, project_id: str, zone: str, compute_api: t.Any = None):
         super().__init__()
         self.project_id = project_id
         self.zone = zone
+        if compute_api is None:
+            from google.cloud import compute_v1
+
+            compute_api = compute_v1
+        # `google.cloud.compute_v1` unless a fake one is injected (e.g. in benchmarks)
+        self.compute_api = compute_api
+
+    def launch(self, config: "Config") -> str:
+        from {{cookiecutter.project_name}}.utils.config_utils import save_config_as_pickle
+
+        # VMs load the job's config from its base path rather than the one baked into the docker image,
+        # so that sweep trials and scheduled jobs keep their overrides
+        config_dir = config.infrastructure.base_path()
+        save_config_as_pickle(config, os.path.join(config_dir, "config.pickle"))
+        training_info = self.run_remote_training(config.infrastructure, config_dir)
+        training_info.print_job_info()
+        return training_info.cluster_id
+
+    def is_running(self, config: "Config", job_id: str) -> bool:
+        # Training instance groups delete themselves when the training finishes (see training_startup_script.sh)
+        return self.instance_group_exists(job_id)
 
-    def run_remote_training(self, infra_cfg: InfrastructureConfig) -> TrainingInfo:
+    def terminate(self, config: "Config", job_id: str) -> None:
+        self.delete_instance_group(job_id)
+
+    def run_remote_training(self, infra_cfg: InfrastructureConfig, config_dir: str = "") -> TrainingInfo:
         gcp_docker_registry_url = f"{{cookiecutter.gcp_docker_registry}}-docker.pkg.dev/{infra_cfg.project_id}/{{cookiecutter.project_name}}/{{cookiecutter.project_name}}-model:{infra_cfg.vm_config.docker_image_tag}"
         cluster_id = f"{infra_cfg.job_info.job_id}-t".lower()
         base_path = infra_cfg.base_path()
@@ -114,6 +144,7 @@ def run_remote_training(self, infra_cfg: InfrastructureConfig) -> TrainingInfo:
             zone=infra_cfg.zone,
             python_hash_seed=infra_cfg.python_hash_seed,
             node_count=infra_cfg.vm_config.node_count,
+            config_dir=config_dir,
         )
         logging.debug(f"{vm_metadata=}")
 
@@ -149,19 +180,45 @@ def run_remote_training(self, infra_cfg: InfrastructureConfig) -> TrainingInfo:
 
     def list_instances_in_group(
         self, cluster_id: str
-    ) -> compute_v1.services.instance_group_managers.pagers.ListManagedInstancesPager:
+    ) -> "compute_v1.services.instance_group_managers.pagers.ListManagedInstancesPager":
 
-        instance_group_managers_client = compute_v1.InstanceGroupManagersClient()
+        instance_group_managers_client = self.compute_api.InstanceGroupManagersClient()
         pager = instance_group_managers_client.list_managed_instances(
             project=self.project_id, instance_group_manager=cluster_id, zone=self.zone
         )
 
         return pager
 
+    def instance_group_exists(self, cluster_id: str) -> bool:
+        instance_group_managers_client = self.compute_api.InstanceGroupManagersClient()
+        try:
+            instance_group_managers_client.get(
+                project=self.project_id, instance_group_manager=cluster_id, zone=self.zone
+            )
+        except Exception as exception:
+            if is_not_found_error(exception):
+                return False
+            raise
+        return True
+
+    def delete_instance_group(self, cluster_id: str) -> None:
+        instance_group_managers_client = self.compute_api.InstanceGroupManagersClient()
+        try:
+            operation = instance_group_managers_client.delete(
+                project=self.project_id, instance_group_manager=cluster_id, zone=self.zone
+            )
+        except Exception as exception:
+            if is_not_found_error(exception):
+                # The training finished (and deleted its instance group) in the meantime
+                return
+            raise
+
+        wait_for_extended_operation(operation, "managed instance group deletion")
+
     def _create_template(
         self, name: str, config: VMTemplateConfig, vm_metadata: VMMetadata
-    ) -> compute_v1.InstanceTemplate:
-        template = compute_v1.InstanceTemplate()
+    ) -> "compute_v1.InstanceTemplate":
+        template = self.compute_api.InstanceTemplate()
         template.name = name
 
         boot_disk = self._create_boot_disk(config)
@@ -169,7 +226,7 @@ def _create_template(
             template.properties.disks = [boot_disk]
 
         for disk_name in config.disks:
-            disk = compute_v1.AttachedDisk(
+            disk = self.compute_api.AttachedDisk(
                 auto_delete=False, boot=False, mode="READ_ONLY", device_name=disk_name, source=disk_name
             )
             template.properties.disks.append(disk)
@@ -179,19 +236,19 @@ def _create_template(
 
         template.properties.machine_type = config.machine.machine_type
         template.properties.guest_accelerators = [
-            compute_v1.AcceleratorConfig(
+            self.compute_api.AcceleratorConfig(
                 accelerator_type=config.machine.accelerator_type, accelerator_count=config.machine.accelerator_count
             )
         ]
-        template.properties.service_accounts = [compute_v1.ServiceAccount(email="default", scopes=config.scopes)]
+        template.properties.service_accounts = [self.compute_api.ServiceAccount(email="default", scopes=config.scopes)]
         template.properties.labels = config.labels
 
         if config.machine.train_machine_mode == VMMode.PREEMPTIBLE:
             logging.info("Using PREEMPTIBLE mode")
-            template.properties.scheduling = compute_v1.Scheduling(preemptible=True)
+            template.properties.scheduling = self.compute_api.Scheduling(preemptible=True)
         elif config.machine.train_machine_mode == VMMode.SPOT:
             logging.info("Using SPOT mode")
-            template.properties.scheduling = compute_v1.Scheduling(provisioning_model=compute_v1.Scheduling.ProvisioningModel.SPOT.name)  # type: ignore
+            template.properties.scheduling = self.compute_api.Scheduling(provisioning_model=self.compute_api.Scheduling.ProvisioningModel.SPOT.name)  # type: ignore
         elif config.machine.train_machine_mode == VMMode.STANDARD:
             logging.info("Using STANDARD mode")
             # No special configuration needed
@@ -200,15 +257,17 @@ def _create_template(
             raise RuntimeError(f"Unsupported train_machine_mode={config.machine.train_machine_mode}")
 
         startup_script = self._load_startup_script(config.startup_script_path)
-        template.properties.metadata.items.append(compute_v1.Items(key="startup-script", value=startup_script))
+        template.properties.metadata.items.append(self.compute_api.Items(key="startup-script", value=startup_script))
 
         if config.disks:
-            template.properties.metadata.items.append(compute_v1.Items(key="disks", value="\n".join(config.disks)))
+            template.properties.metadata.items.append(
+                self.compute_api.Items(key="disks", value="\n".join(config.disks))
+            )
 
         for k, v in vm_metadata.to_dict().items():
-            template.properties.metadata.items.append(compute_v1.Items(key=k, value=str(v)))
+            template.properties.metadata.items.append(self.compute_api.Items(key=k, value=str(v)))
 
-        template_client = compute_v1.InstanceTemplatesClient()
+        template_client = self.compute_api.InstanceTemplatesClient()
         operation = template_client.insert(project=config.project_id, instance_template_resource=template)
 
         wait_for_extended_operation(operation, "instance template creation")
@@ -220,16 +279,16 @@ def _load_startup_script(self, startup_script_path: str) -> str:
             startup_script = f.read()
         return startup_script
 
-    def _create_instance_group(self, config: VMInstanceGroupConfig) -> compute_v1.InstanceGroupManager:
+    def _create_instance_group(self, config: VMInstanceGroupConfig) -> "compute_v1.InstanceGroupManager":
 
-        instance_group_manager_resource = compute_v1.InstanceGroupManager(
+        instance_group_manager_resource = self.compute_api.InstanceGroupManager(
             name=config.cluster_id,
             base_instance_name=config.cluster_id,
             instance_template=config.instance_template_url,
             target_size=config.size,
         )
 
-        instance_group_managers_client = compute_v1.InstanceGroupManagersClient()
+        instance_group_managers_client = self.compute_api.InstanceGroupManagersClient()
         operation = instance_group_managers_client.insert(
             project=config.project_id, instance_group_manager_resource=instance_group_manager_resource, zone=config.zone
         )
@@ -240,17 +299,17 @@ def _create_instance_group(self, config: VMInstanceGroupConfig) -> compute_v1.In
             project=config.project_id, instance_group_manager=config.cluster_id, zone=config.zone
         )
 
-    def _create_network_interface(self, network: str, subnetwork: str) -> compute_v1.NetworkInterface:
-        network_interface = compute_v1.NetworkInterface()
+    def _create_network_interface(self, network: str, subnetwork: str) -> "compute_v1.NetworkInterface":
+        network_interface = self.compute_api.NetworkInterface()
         network_interface.name = "nic0"
         network_interface.network = network
         network_interface.subnetwork = subnetwork
         return network_interface
 
-    def _create_boot_disk(self, config: VMTemplateConfig) -> compute_v1.AttachedDisk:
-        boot_disk = compute_v1.AttachedDisk()
-        boot_disk_initialize_params = compute_v1.AttachedDiskInitializeParams()
-        boot_disk_image = get_disk_image(config.disk_image_project_id, config.disk_image_name)
+    def _create_boot_disk(self, config: VMTemplateConfig) -> "compute_v1.AttachedDisk":
+        boot_disk = self.compute_api.AttachedDisk()
+        boot_disk_initialize_params = self.compute_api.AttachedDiskInitializeParams()
+        boot_disk_image = get_disk_image(config.disk_image_project_id, config.disk_image_name, self.compute_api)
         boot_disk_initialize_params.source_image = boot_disk_image.self_link
         boot_disk_initialize_params.disk_size_gb = config.disk_size_gb
         boot_disk_initialize_params.labels = config.labels
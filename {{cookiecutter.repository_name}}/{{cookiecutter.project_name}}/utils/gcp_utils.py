@@ -1,11 +1,11 @@
 import typing as t
 
-from google.api_core.exceptions import GoogleAPICallError
-from google.api_core.extended_operation import ExtendedOperation
-from google.cloud import compute_v1, secretmanager
-
 from {{cookiecutter.project_name}}.utils.utils import get_logger
 
+if t.TYPE_CHECKING:
+    from google.api_core.extended_operation import ExtendedOperation
+    from google.cloud import compute_v1
+
 GCP_UTILS_LOGGER = get_logger(__name__)
 
 
@@ -14,6 +14,8 @@ def access_secret_version(project_id: str, secret_id: str, version_id: str = "1"
     Access the payload for the given secret version if one exists. The version
     can be a version number as a string (e.g. "5") or an alias (e.g. "latest").
     """
+    from google.cloud import secretmanager
+
     client = secretmanager.SecretManagerServiceClient()
     name = f"projects/{project_id}/secrets/{secret_id}/versions/{version_id}"
     response = client.access_secret_version(request={"name": name})
@@ -23,7 +25,7 @@ def access_secret_version(project_id: str, secret_id: str, version_id: str = "1"
 
 
 def wait_for_extended_operation(
-    operation: ExtendedOperation, verbose_name: str = "operation", timeout: int = 300
+    operation: "ExtendedOperation", verbose_name: str = "operation", timeout: int = 300
 ) -> t.Any:
     """
     This method will wait for the extended (long-running) operation to
@@ -52,12 +54,18 @@ def wait_for_extended_operation(
     """
     try:
         result = operation.result(timeout=timeout)
-    except GoogleAPICallError as ex:
+    except Exception as ex:
+        from google.api_core.exceptions import GoogleAPICallError
+
+        if not isinstance(ex, GoogleAPICallError):
+            raise
         GCP_UTILS_LOGGER.exception("Exception occurred")
         for attr in ["details", "domain", "errors", "metadata", "reason", "response"]:
             value = getattr(ex, attr, None)
             if value:
                 GCP_UTILS_LOGGER.error(f"ex.{attr}:\n{value}")
+        from google.cloud import compute_v1
+
         if isinstance(ex.response, compute_v1.Operation):
             for error in ex.response.error.errors:
                 GCP_UTILS_LOGGER.error(f"Error message: {error.message}")
@@ -79,20 +87,31 @@ def wait_for_extended_operation(
     return result
 
 
-def get_disk_image(project_id: str, image_name: str) -> compute_v1.Image:
+def is_not_found_error(exception: Exception) -> bool:
+    # google.api_core.exceptions.NotFound has code 404, checked without importing google.api_core
+    return getattr(exception, "code", None) == 404
+
+
+def get_disk_image(project_id: str, image_name: str, compute_api: t.Any = None) -> "compute_v1.Image":
     """
     Retrieve detailed information about a single image from a project.
     Args:
         project_id: project ID or project number of the Cloud project you want to list images from.
         image_name: name of the image you want to get details of.
+        compute_api: (optional) module providing the compute API clients, `google.cloud.compute_v1` by default.
     Returns:
         An instance of compute_v1.Image object with information about specified image.
     """
-    image_client = compute_v1.ImagesClient()
+    if compute_api is None:
+        from google.cloud import compute_v1
+
+        compute_api = compute_v1
+
+    image_client = compute_api.ImagesClient()
     return image_client.get(project=project_id, image=image_name)
 
 
-def get_disk(project_id: str, zone: str, disk_name: str) -> compute_v1.Disk:
+def get_disk(project_id: str, zone: str, disk_name: str) -> "compute_v1.Disk":
     """
     Gets a disk from a project.
     Args:
@@ -100,5 +119,7 @@ def get_disk(project_id: str, zone: str, disk_name: str) -> compute_v1.Disk:
         zone: name of the zone where the disk exists.
         disk_name: name of the disk you want to retrieve.
     """
+    from google.cloud import compute_v1
+
     disk_client = compute_v1.DisksClient()
     return disk_client.get(project=project_id, zone=zone, disk=disk_name)
@@ -1,32 +1,126 @@
+import importlib.util
 import json
+import mmap
 import os
 
+from array import array
+from gzip import GzipFile
 from io import BytesIO, StringIO
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Any, Callable, Union
-
-from fsspec import AbstractFileSystem, filesystem
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, Union
 
 from {{cookiecutter.project_name}}.utils.utils import get_logger
 
+if TYPE_CHECKING:
+    from fsspec import AbstractFileSystem
+
 GCS_PREFIX = "gs://"
 GCS_FILE_SYSTEM_NAME = "gcs"
 LOCAL_FILE_SYSTEM_NAME = "file"
+PROTOCOL_SEPARATOR = "://"
 TMP_FILE_PATH = "/tmp/translated"
 
+# By default the compression codec is inferred from the path suffix (.gz, .zst, .lz4, .bz2, .xz),
+# paths without a known suffix are read and written as they are
+INFER_COMPRESSION = "infer"
+# Python's default level 9 is ~4x slower than 6 for a few percent smaller output
+GZIP_COMPRESSION_LEVEL = 6
+ZSTD_COMPRESSION_LEVEL = 3
+# 0 disables multi-threading, -1 uses all logical CPUs. zstd only splits inputs larger than its job size
+# (a few MiB at low levels) across threads, so small payloads are not slowed down
+ZSTD_COMPRESSION_THREADS = -1
+_COMPRESSIONS_REGISTERED = False
+# Codecs which need optional packages
+COMPRESSION_PACKAGES = {"lz4": "lz4", "zstd": "zstandard"}
+
+# Size of the reads of the streaming readers (iter_lines, iter_jsonl, LineIndex)
+READ_CHUNK_SIZE = 1024 * 1024
+# File info fields which change whenever a file is rewritten: the object generation on GCS, mtime on local disks
+FILE_VERSION_KEYS = ("generation", "mtime")
+
+
+def choose_file_system(path: str) -> "AbstractFileSystem":
+    from fsspec import filesystem
 
-def choose_file_system(path: str) -> AbstractFileSystem:
     path = str(path)
-    return filesystem(GCS_FILE_SYSTEM_NAME) if path.startswith(GCS_PREFIX) else filesystem(LOCAL_FILE_SYSTEM_NAME)
+    if path.startswith(GCS_PREFIX):
+        return filesystem(GCS_FILE_SYSTEM_NAME)
+    if PROTOCOL_SEPARATOR in path:
+        return filesystem(path.split(PROTOCOL_SEPARATOR, 1)[0])
+    return filesystem(LOCAL_FILE_SYSTEM_NAME)
+
+
+def register_compressions() -> None:
+    global _COMPRESSIONS_REGISTERED
+    if _COMPRESSIONS_REGISTERED:
+        return
+
+    from fsspec.compression import register_compression
+
+    # fsspec's gzip and lz4 codecs do not close the wrapped file, so remote uploads would never be finalized
+    register_compression("gzip", open_gzip_file, "gz", force=True)
+    # Registered even if their packages are missing, so that e.g. a .lz4 path fails to open instead of being read and
+    # written uncompressed
+    register_compression("lz4", open_lz4_file, "lz4", force=True)
+    # fsspec's zstd codec compresses at level 10 on a single thread
+    register_compression("zstd", open_zstd_file, "zst", force=True)
+    _COMPRESSIONS_REGISTERED = True
+
+
+def is_compression_available(compression: Optional[str]) -> bool:
+    package = COMPRESSION_PACKAGES.get(compression or "")
+    return package is None or importlib.util.find_spec(package) is not None
+
 
+def open_gzip_file(file: Any, mode: str = "rb") -> Any:
+    gzip_file = GzipFile(fileobj=file, mode=mode, compresslevel=GZIP_COMPRESSION_LEVEL)
+    return _close_wrapped_file_on_close(gzip_file, file)
 
-def open_file(path: str, mode: str = "r") -> Any:
+
+def open_lz4_file(file: Any, mode: str = "rb") -> Any:
+    import lz4.frame
+
+    return _close_wrapped_file_on_close(lz4.frame.LZ4FrameFile(file, mode=mode), file)
+
+
+def open_zstd_file(file: Any, mode: str = "rb") -> Any:
+    import zstandard
+
+    if "r" in mode:
+        return zstandard.ZstdDecompressor().stream_reader(file, read_across_frames=True)
+    compressor = zstandard.ZstdCompressor(level=ZSTD_COMPRESSION_LEVEL, threads=ZSTD_COMPRESSION_THREADS)
+    return compressor.stream_writer(file)
+
+
+def _close_wrapped_file_on_close(compressed_file: Any, file: Any) -> Any:
+    close = compressed_file.close
+
+    def close_both() -> None:
+        try:
+            close()
+        finally:
+            file.close()
+
+    compressed_file.close = close_both
+    return compressed_file
+
+
+def open_file(path: str, mode: str = "r", compression: Optional[str] = INFER_COMPRESSION) -> Any:
+    compression = _resolve_compression(path, compression)
+    if not is_compression_available(compression):
+        package = COMPRESSION_PACKAGES[str(compression)]
+        raise ImportError(f"Compression '{compression}' of {path} requires the '{package}' package")
     file_system = choose_file_system(path)
-    return file_system.open(path, mode)
+    return file_system.open(path, mode, compression=compression)
 
 
-def write_file(path: str, mode: str, callback: Callable[[Union[str, StringIO, BytesIO]], None]) -> None:
+def write_file(
+    path: str,
+    mode: str,
+    callback: Callable[[Union[str, StringIO, BytesIO]], None],
+    compression: Optional[str] = INFER_COMPRESSION,
+) -> None:
     if mode == "w":
         io = StringIO()
     elif mode == "wb":
@@ -44,16 +138,16 @@ def write_file(path: str, mode: str, callback: Callable[[Union[str, StringIO, By
             with open(tmp_file_name, mode.replace("w", "r")) as temp_f:
                 io.write(temp_f.read())
 
-    with open_file(path, mode) as f:
+    with open_file(path, mode, compression) as f:
         f.write(io.getvalue())
 
 
-def read_file(path: str, mode: str) -> Union[str, bytes]:
+def read_file(path: str, mode: str, compression: Optional[str] = INFER_COMPRESSION) -> Union[str, bytes]:
     allowed_modes = {"r", "rb"}
     if mode not in allowed_modes:
         raise RuntimeError(f"'mode' parameter can be one of: {allowed_modes}")
 
-    with open_file(path, mode) as f:
+    with open_file(path, mode, compression) as f:
         data = f.read()
 
     return data  # type: ignore
@@ -92,6 +186,9 @@ def list_paths(data_path: str, check_path_suffix: bool = False, path_suffix: str
     if GCS_FILE_SYSTEM_NAME in file_system.protocol:
         gs_paths: list[str] = [GCS_PREFIX + file_path for file_path in paths]
         return gs_paths
+    elif LOCAL_FILE_SYSTEM_NAME not in file_system.protocol:
+        protocol = file_system.protocol if isinstance(file_system.protocol, str) else file_system.protocol[0]
+        return [protocol + PROTOCOL_SEPARATOR + file_path for file_path in paths]
     else:
         return paths
 
@@ -105,7 +202,7 @@ def copy_dir(source_dir: str, target_dir: str) -> None:
     for source_file in source_files:
         target_file = os.path.join(target_dir, os.path.basename(source_file))
         if is_file(source_file):
-            with open_file(source_file, mode="rb") as source, open_file(target_file, mode="wb") as target:
+            with open_file(source_file, "rb", None) as source, open_file(target_file, "wb", None) as target:
                 content = source.read()
                 target.write(content)
         else:
@@ -115,7 +212,7 @@ def copy_dir(source_dir: str, target_dir: str) -> None:
 def copy_file(source_file: str, target_path: str) -> None:
     logger = get_logger(Path(__file__).name)
     logger.info(f"Copying file from {source_file} to {target_path}")
-    with open_file(source_file, mode="rb") as source, open_file(target_path, mode="wb") as target:
+    with open_file(source_file, "rb", None) as source, open_file(target_path, "wb", None) as target:
         content = source.read()
         target.write(content)
 
@@ -146,6 +243,168 @@ def translate_gcs_file_to_local(path: str) -> str:
     return path
 
 
-def load_json(path: str) -> dict[str, Any]:
-    data = read_file(path, "r")
-    return json.loads(data)
+def load_json(path: str, compression: Optional[str] = INFER_COMPRESSION) -> dict[str, Any]:
+    with open_file(path, "r", compression) as f:
+        data: dict[str, Any] = json.load(f)
+    return data
+
+
+def iter_lines(
+    path: str, compression: Optional[str] = INFER_COMPRESSION, chunk_size: int = READ_CHUNK_SIZE
+) -> Iterator[str]:
+    """
+    Yields the lines of a text file without line endings ("\\n" or "\\r\\n"), holding at most one chunk of the file
+    in memory. Uncompressed local files are read through mmap, everything else with buffered chunked reads.
+    """
+    for lines in iter_line_batches(path, compression, chunk_size):
+        yield from lines
+
+
+def iter_line_batches(
+    path: str, compression: Optional[str] = INFER_COMPRESSION, chunk_size: int = READ_CHUNK_SIZE
+) -> Iterator[list[str]]:
+    """
+    Yields the lines of a text file a chunk at a time, for callers which handle lines in bulk.
+    """
+    remainder = b""
+    for chunk in _iter_chunks(path, compression, chunk_size):
+        last_line_end = chunk.rfind(b"\n")
+        if last_line_end == -1:
+            remainder += chunk
+            continue
+        # Chunks are decoded and split as a whole, cut at a line end so multi-byte characters are never split
+        yield _split_lines(remainder + chunk[:last_line_end])
+        remainder = chunk[last_line_end + 1 :]
+    if remainder:
+        yield _split_lines(remainder)
+
+
+def iter_jsonl(
+    path: str, compression: Optional[str] = INFER_COMPRESSION, chunk_size: int = READ_CHUNK_SIZE
+) -> Iterator[Any]:
+    for line in iter_lines(path, compression, chunk_size):
+        if line.strip():
+            yield json.loads(line)
+
+
+class LineIndex:
+    """
+    Byte offsets of the lines of an uncompressed text file, for random access by line number. The index is built
+    with one streaming pass over the file and can be saved next to it, so workers only read the lines they need
+    (with ranged reads on remote file systems).
+    """
+
+    def __init__(self, path: str, offsets: "array[int]", file_version: Optional[str] = None) -> None:
+        self.path = path
+        # Start of every line, followed by the end of the last line (i.e. the file size)
+        self.offsets = offsets
+        self.file_version = file_version
+
+    @classmethod
+    def build(cls, path: str, chunk_size: int = READ_CHUNK_SIZE) -> "LineIndex":
+        if _resolve_compression(path, INFER_COMPRESSION) is not None:
+            raise ValueError(f"Lines of compressed files can not be read by offset: {path}")
+
+        # Taken before reading, so a write during the build makes the saved index stale rather than wrong
+        file_version = _get_file_version(choose_file_system(path).info(path))
+        offsets = array("q", [0])
+        chunk_offset = 0
+        for chunk in _iter_chunks(path, None, chunk_size):
+            newline_index = chunk.find(b"\n")
+            while newline_index != -1:
+                offsets.append(chunk_offset + newline_index + 1)
+                newline_index = chunk.find(b"\n", newline_index + 1)
+            chunk_offset += len(chunk)
+        if offsets[-1] != chunk_offset:
+            # The last line has no line ending
+            offsets.append(chunk_offset)
+        return cls(path, offsets, file_version)
+
+    @classmethod
+    def load(cls, path: str, index_path: str) -> "LineIndex":
+        """
+        Loads an index saved with `save`, or rebuilds it if the file changed since.
+        """
+        with open_file(index_path, "rb", compression=None) as f:
+            header, offsets_bytes = f.read().split(b"\n", 1)
+        file_info = json.loads(header)
+        offsets = array("q")
+        offsets.frombytes(offsets_bytes)
+
+        info = choose_file_system(path).info(path)
+        if info["size"] != file_info["size"] or _get_file_version(info) != file_info["version"]:
+            logger = get_logger(Path(__file__).name)
+            logger.warning(f"{path} changed since its line index {index_path} was saved, rebuilding the index")
+            return cls.build(path)
+        return cls(path, offsets, file_info["version"])
+
+    def save(self, index_path: str) -> None:
+        # A one line JSON header with the size and version of the indexed file, followed by the offsets
+        header = json.dumps({"size": self.offsets[-1], "version": self.file_version})
+        with open_file(index_path, "wb", compression=None) as f:
+            f.write(header.encode() + b"\n" + self.offsets.tobytes())
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, line_number: int) -> str:
+        return self.read_lines(line_number, line_number + 1)[0]
+
+    def read_lines(self, start: int, stop: int) -> list[str]:
+        """
+        Reads lines [start, stop) with a single (ranged) read.
+        """
+        if not 0 <= start < stop <= len(self):
+            raise IndexError(f"Line range [{start}, {stop}) is out of range for {len(self)} lines of {self.path}")
+        data = choose_file_system(self.path).cat_file(self.path, start=self.offsets[start], end=self.offsets[stop])
+        return _split_lines(data[:-1] if data.endswith(b"\n") else data)
+
+
+def _get_file_version(info: dict[str, Any]) -> Optional[str]:
+    for key in FILE_VERSION_KEYS:
+        if info.get(key) is not None:
+            return f"{key}:{info[key]}"
+    return None
+
+
+def _iter_chunks(path: str, compression: Optional[str], chunk_size: int) -> Iterator[bytes]:
+    from fsspec.core import strip_protocol
+
+    compression = _resolve_compression(path, compression)
+    file_system = choose_file_system(path)
+    if compression is None and LOCAL_FILE_SYSTEM_NAME in file_system.protocol:
+        # Pages of a mapped file are shared between the processes reading it, instead of being copied into each one
+        with open(strip_protocol(path), "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                for chunk_start in range(0, len(mapped_file), chunk_size):
+                    yield mapped_file[chunk_start : chunk_start + chunk_size]
+        return
+
+    with open_file(path, "rb", compression) as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            yield chunk
+
+
+def _resolve_compression(path: str, compression: Optional[str]) -> Optional[str]:
+    register_compressions()
+    if compression != INFER_COMPRESSION:
+        return compression
+
+    from fsspec.utils import infer_compression
+
+    inferred_compression: Optional[str] = infer_compression(path)
+    return inferred_compression
+
+
+def _split_lines(data: bytes) -> list[str]:
+    """
+    Splits text without its last line ending into lines, dropping "\r" of "\r\n" line endings.
+    """
+    text = data.decode()
+    if "\r" in text:
+        text = text.replace("\r\n", "\n")
+        if text.endswith("\r"):
+            text = text[:-1]
+    return text.split("\n")
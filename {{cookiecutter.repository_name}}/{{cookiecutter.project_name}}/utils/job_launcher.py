@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from {{cookiecutter.project_name}}.config_schemas.config_schema import Config
+
+
+class JobLauncher(ABC):
+    """
+    Execution backend of JobScheduler and SweepController. `launch` returns the id of the launched job, which is
+    passed back to `is_running` and `terminate` together with the job's config.
+    """
+
+    @abstractmethod
+    def launch(self, config: "Config") -> str:
+        ...
+
+    @abstractmethod
+    def is_running(self, config: "Config", job_id: str) -> bool:
+        ...
+
+    @abstractmethod
+    def terminate(self, config: "Config", job_id: str) -> None:
+        ...
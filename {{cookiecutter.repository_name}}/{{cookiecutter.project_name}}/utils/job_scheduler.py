@@ -0,0 +1,329 @@
+import pickle
+import sqlite3
+import time
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, Sequence
+
+from {{cookiecutter.project_name}}.utils.utils import get_logger
+
+if TYPE_CHECKING:
+    from {{cookiecutter.project_name}}.config_schemas.config_schema import Config
+    from {{cookiecutter.project_name}}.utils.job_launcher import JobLauncher
+
+JOB_SCHEDULER_LOGGER = get_logger(__name__)
+
+IN_MEMORY_DATABASE = ":memory:"
+
+
+class JobState(Enum):
+    QUEUED = "QUEUED"
+    LAUNCHING = "LAUNCHING"
+    RUNNING = "RUNNING"
+    FINISHED = "FINISHED"
+    FAILED = "FAILED"
+    CANCELLED = "CANCELLED"
+
+
+# Jobs in these states hold their GPUs and nodes
+IN_FLIGHT_STATES = (JobState.LAUNCHING, JobState.RUNNING)
+
+
+@dataclass
+class Job:
+    job_id: int
+    name: str
+    state: JobState
+    priority: int
+    accelerator_type: str
+    node_count: int
+    gpu_count: int
+    submitted_at: float
+    launch_started_at: Optional[float] = None
+    launched_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    cluster_id: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def queue_wait_s(self) -> Optional[float]:
+        if self.launch_started_at is None:
+            return None
+        return self.launch_started_at - self.submitted_at
+
+    @property
+    def launch_latency_s(self) -> Optional[float]:
+        if self.launch_started_at is None or self.launched_at is None:
+            return None
+        return self.launched_at - self.launch_started_at
+
+
+JOB_COLUMNS = ", ".join(job_field.name for job_field in fields(Job))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    state TEXT NOT NULL,
+    priority INTEGER NOT NULL,
+    accelerator_type TEXT NOT NULL,
+    node_count INTEGER NOT NULL,
+    gpu_count INTEGER NOT NULL,
+    submitted_at REAL NOT NULL,
+    launch_started_at REAL,
+    launched_at REAL,
+    finished_at REAL,
+    cluster_id TEXT,
+    error TEXT,
+    config BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_by_state ON jobs (state, priority DESC, job_id);
+"""
+
+
+class JobScheduler:
+    """
+    Persistent (SQLite) job queue in front of a launcher backend. A queued job is admitted when the GPUs and nodes
+    in flight (launching or running) for its accelerator type stay within the quotas after adding it. Queued jobs are
+    considered by priority, then in submission order. A job which does not fit blocks lower priority jobs of the same
+    accelerator type, so large jobs are not starved by a stream of small ones, but it doesn't block other accelerator
+    types. Jobs can be submitted from any process, but only one process should run the scheduler loop.
+    """
+
+    def __init__(
+        self,
+        database_path: str,
+        gpu_quotas: Optional[dict[str, int]] = None,
+        node_quotas: Optional[dict[str, int]] = None,
+        backend: Optional["JobLauncher"] = None,
+        max_concurrent_launches: int = 4,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.gpu_quotas = dict(gpu_quotas or {})
+        self.node_quotas = dict(node_quotas or {})
+        self.backend = backend
+        self.max_concurrent_launches = max_concurrent_launches
+        self.clock = clock
+
+        if database_path != IN_MEMORY_DATABASE:
+            Path(database_path).parent.mkdir(parents=True, exist_ok=True)
+        # Transactions are managed explicitly in `_transaction`
+        self.connection = sqlite3.connect(database_path, isolation_level=None, timeout=30.0)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(SCHEMA)
+
+    @classmethod
+    def from_config(cls, config: "Config", **kwargs: Any) -> "JobScheduler":
+        scheduler_config = config.infrastructure.scheduler
+        return cls(
+            scheduler_config.database_path,
+            gpu_quotas=scheduler_config.gpu_quotas,
+            node_quotas=scheduler_config.node_quotas,
+            **kwargs,
+        )
+
+    def submit(self, config: "Config", priority: Optional[int] = None) -> Job:
+        vm_config = config.infrastructure.vm_config
+        accelerator_type = vm_config.machine.accelerator_type
+        node_count = vm_config.node_count
+        gpu_count = node_count * vm_config.machine.accelerator_count
+        if not self._fits_quotas(accelerator_type, gpu_count, node_count):
+            raise ValueError(
+                f"Job {config.job_info.job_id} needs {gpu_count} x {accelerator_type} on {node_count} nodes, "
+                f"which exceeds the quotas: {self.gpu_quotas.get(accelerator_type)} GPUs, "
+                f"{self.node_quotas.get(accelerator_type)} nodes"
+            )
+
+        if priority is None:
+            priority = config.infrastructure.scheduler.priority
+        with self._transaction():
+            cursor = self.connection.execute(
+                "INSERT INTO jobs (name, state, priority, accelerator_type, node_count, gpu_count, submitted_at, "
+                "config) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    config.job_info.job_id,
+                    JobState.QUEUED.value,
+                    priority,
+                    accelerator_type,
+                    node_count,
+                    gpu_count,
+                    self.clock(),
+                    pickle.dumps(config),
+                ),
+            )
+        job = self.get_job(cursor.lastrowid)  # type: ignore
+        JOB_SCHEDULER_LOGGER.info(f"Queued job {job.job_id} ({job.name}, {gpu_count} x {accelerator_type})")
+        return job
+
+    def get_job(self, job_id: int) -> Job:
+        row = self.connection.execute(f"SELECT {JOB_COLUMNS} FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        if row is None:
+            raise KeyError(f"Job {job_id} does not exist")
+        return self._to_job(row)
+
+    def list_jobs(self, states: Optional[Sequence[JobState]] = None) -> list[Job]:
+        query = f"SELECT {JOB_COLUMNS} FROM jobs"
+        parameters: tuple[str, ...] = ()
+        if states is not None:
+            query += f" WHERE state IN ({', '.join('?' * len(states))})"
+            parameters = tuple(state.value for state in states)
+        rows = self.connection.execute(query + " ORDER BY job_id", parameters).fetchall()
+        return [self._to_job(row) for row in rows]
+
+    def cancel(self, job_id: int) -> None:
+        with self._transaction():
+            cursor = self.connection.execute(
+                "UPDATE jobs SET state = ?, finished_at = ? WHERE job_id = ? AND state = ?",
+                (JobState.CANCELLED.value, self.clock(), job_id, JobState.QUEUED.value),
+            )
+        if cursor.rowcount == 0:
+            raise ValueError(f"Only queued jobs can be cancelled, job {job_id} is {self.get_job(job_id).state.value}")
+
+    def get_usage(self) -> dict[str, tuple[int, int]]:
+        """
+        Returns {accelerator type: (GPUs, nodes)} held by jobs in flight.
+        """
+        rows = self.connection.execute(
+            "SELECT accelerator_type, SUM(gpu_count), SUM(node_count) FROM jobs WHERE state IN (?, ?) "
+            "GROUP BY accelerator_type",
+            tuple(state.value for state in IN_FLIGHT_STATES),
+        ).fetchall()
+        return {accelerator_type: (gpu_count, node_count) for accelerator_type, gpu_count, node_count in rows}
+
+    def step(self) -> list[Job]:
+        """
+        Releases the capacity of finished jobs, then admits and launches queued jobs. Returns the launched jobs.
+        """
+        self.refresh()
+        return self.launch(self.admit())
+
+    def run(self, poll_interval_s: float, stop_when_idle: bool = True) -> None:
+        self.recover_interrupted_launches()
+        while True:
+            self.step()
+            if stop_when_idle and not self.list_jobs([JobState.QUEUED, *IN_FLIGHT_STATES]):
+                JOB_SCHEDULER_LOGGER.info("No queued or running jobs left")
+                return
+            time.sleep(poll_interval_s)
+
+    def refresh(self) -> list[Job]:
+        finished_jobs = []
+        running_jobs = self.connection.execute(
+            "SELECT job_id, cluster_id FROM jobs WHERE state = ?", (JobState.RUNNING.value,)
+        ).fetchall()
+        for job_id, cluster_id in running_jobs:
+            try:
+                is_running = self._get_backend().is_running(self._load_config(job_id), cluster_id)
+            except Exception:
+                # E.g. a transient API error, the job stays RUNNING until the next poll
+                JOB_SCHEDULER_LOGGER.exception(f"Failed to check whether job {job_id} is running, will retry")
+                continue
+            if is_running:
+                continue
+            self._update(job_id, state=JobState.FINISHED.value, finished_at=self.clock())
+            job = self.get_job(job_id)
+            finished_jobs.append(job)
+            JOB_SCHEDULER_LOGGER.info(f"Job {job_id} ({job.name}) finished, released {job.gpu_count} GPUs")
+        return finished_jobs
+
+    def admit(self) -> list[int]:
+        """
+        Moves the queued jobs which fit into the quotas to LAUNCHING, so their capacity is reserved before launching.
+        """
+        admitted_job_ids = []
+        with self._transaction():
+            usage = self.get_usage()
+            blocked_accelerator_types = set()
+            queued_jobs = self.connection.execute(
+                "SELECT job_id, accelerator_type, gpu_count, node_count FROM jobs WHERE state = ? "
+                "ORDER BY priority DESC, job_id",
+                (JobState.QUEUED.value,),
+            ).fetchall()
+            for job_id, accelerator_type, gpu_count, node_count in queued_jobs:
+                if accelerator_type in blocked_accelerator_types:
+                    continue
+                used_gpus, used_nodes = usage.get(accelerator_type, (0, 0))
+                if not self._fits_quotas(accelerator_type, used_gpus + gpu_count, used_nodes + node_count):
+                    blocked_accelerator_types.add(accelerator_type)
+                    continue
+                usage[accelerator_type] = (used_gpus + gpu_count, used_nodes + node_count)
+                self._update(job_id, state=JobState.LAUNCHING.value, launch_started_at=self.clock())
+                admitted_job_ids.append(job_id)
+        return admitted_job_ids
+
+    def launch(self, job_ids: list[int]) -> list[Job]:
+        if not job_ids:
+            return []
+
+        backend = self._get_backend()
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_launches) as executor:
+            futures = {executor.submit(self._launch, backend, self._load_config(job_id)): job_id for job_id in job_ids}
+            for future in as_completed(futures):
+                job_id = futures[future]
+                try:
+                    cluster_id, launched_at = future.result()
+                except Exception as exception:
+                    JOB_SCHEDULER_LOGGER.exception(f"Failed to launch job {job_id}")
+                    self._update(job_id, state=JobState.FAILED.value, finished_at=self.clock(), error=repr(exception))
+                    continue
+                self._update(job_id, state=JobState.RUNNING.value, cluster_id=cluster_id, launched_at=launched_at)
+                job = self.get_job(job_id)
+                JOB_SCHEDULER_LOGGER.info(
+                    f"Launched job {job_id} ({job.name}) as {cluster_id}: queue wait {job.queue_wait_s:.1f} s, "
+                    f"launch latency {job.launch_latency_s:.1f} s"
+                )
+        return [self.get_job(job_id) for job_id in job_ids]
+
+    def recover_interrupted_launches(self) -> None:
+        # Jobs left in LAUNCHING by a stopped scheduler may or may not have an instance group, so they are not retried
+        for job in self.list_jobs([JobState.LAUNCHING]):
+            JOB_SCHEDULER_LOGGER.warning(f"Job {job.job_id} ({job.name}) was interrupted during launch")
+            self._update(
+                job.job_id, state=JobState.FAILED.value, finished_at=self.clock(), error="Interrupted during launch"
+            )
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def _fits_quotas(self, accelerator_type: str, gpu_count: int, node_count: int) -> bool:
+        gpu_quota = self.gpu_quotas.get(accelerator_type)
+        node_quota = self.node_quotas.get(accelerator_type)
+        return (gpu_quota is None or gpu_count <= gpu_quota) and (node_quota is None or node_count <= node_quota)
+
+    def _launch(self, backend: "JobLauncher", config: "Config") -> tuple[str, float]:
+        cluster_id = backend.launch(config)
+        return cluster_id, self.clock()
+
+    def _get_backend(self) -> "JobLauncher":
+        if self.backend is None:
+            raise RuntimeError("JobScheduler needs a launcher backend to launch and monitor jobs")
+        return self.backend
+
+    def _load_config(self, job_id: int) -> "Config":
+        (config_bytes,) = self.connection.execute("SELECT config FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        config: "Config" = pickle.loads(config_bytes)
+        return config
+
+    def _update(self, job_id: int, **values: Any) -> None:
+        assignments = ", ".join(f"{column} = ?" for column in values)
+        self.connection.execute(f"UPDATE jobs SET {assignments} WHERE job_id = ?", (*values.values(), job_id))
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        # BEGIN IMMEDIATE takes the write lock up front, so concurrent submits can not interleave with admission
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self.connection.execute("ROLLBACK")
+            raise
+        self.connection.execute("COMMIT")
+
+    def _to_job(self, row: tuple[Any, ...]) -> Job:
+        job = Job(*row)
+        job.state = JobState(job.state)
+        return job
@@ -0,0 +1,224 @@
+import inspect
+import multiprocessing
+import os
+import sys
+
+from collections import deque
+from dataclasses import dataclass, field
+from multiprocessing.connection import wait
+from multiprocessing.process import BaseProcess
+from typing import TYPE_CHECKING, Optional
+
+from {{cookiecutter.project_name}}.utils.config_utils import (
+    LOGGING_CONFIG_PATH,
+    load_pickle_config,
+    resolve_target,
+    save_config_as_pickle,
+    setup_logger,
+    stop_logger,
+)
+from {{cookiecutter.project_name}}.utils.job_launcher import JobLauncher
+from {{cookiecutter.project_name}}.utils.profiling import profile_task
+from {{cookiecutter.project_name}}.utils.utils import get_logger
+
+if TYPE_CHECKING:
+    from {{cookiecutter.project_name}}.config_schemas.config_schema import Config
+
+LOCAL_LAUNCHER_LOGGER = get_logger(__name__)
+
+TASK_FUNCTIONS = {
+    "train": "{{cookiecutter.project_name}}.train.train",
+    "evaluate": "{{cookiecutter.project_name}}.evaluate.evaluate",
+}
+DEFAULT_WORKING_DIR_ROOT = "./.local_jobs"
+CONFIG_NAME = "config"
+LOG_FILE_NAME = "job.log"
+# Thread pools of numerical libraries are sized after the CPUs of the job instead of the CPUs of the machine
+THREAD_COUNT_VARIABLES = ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS")
+
+
+@dataclass
+class LocalJobInfo:
+    job_id: str
+    working_dir: str
+    log_path: str
+    # Set once the job is started
+    cpu_ids: list[int] = field(default_factory=list)
+    pid: Optional[int] = None
+    exit_code: Optional[int] = None
+
+    def get_job_info_message(self) -> str:
+        run_description = f"""
+            Working dir: {self.working_dir}
+            Logs: {self.log_path}
+            Pinned to CPUs: {self.cpu_ids}
+        """
+        return inspect.cleandoc(run_description)
+
+    def print_job_info(self) -> None:
+        print(f"============ local job {self.job_id} details ============")
+        print(self.get_job_info_message())
+
+
+class LocalProcessLauncher(JobLauncher):
+    """
+    Runs jobs of compiled configs in local processes, at most `max_workers` at once. Every worker slot is pinned to
+    its own share of the CPUs, and every job gets a working dir `<working_dir_root>/<job id>` with its pickled config
+    and its output (job.log). Every job runs in its own process instead of a ProcessPoolExecutor, because a pool can not
+    terminate a single job without breaking the other ones.
+    """
+
+    def __init__(
+        self,
+        task_function: str = TASK_FUNCTIONS["train"],
+        working_dir_root: str = DEFAULT_WORKING_DIR_ROOT,
+        max_workers: Optional[int] = None,
+        cpu_ids: Optional[list[int]] = None,
+    ) -> None:
+        self.task_function = task_function
+        self.working_dir_root = working_dir_root
+        available_cpu_ids = sorted(cpu_ids) if cpu_ids is not None else get_available_cpu_ids()
+        self.max_workers = max_workers or len(available_cpu_ids)
+        self.slot_cpu_ids = split_cpu_ids(available_cpu_ids, self.max_workers)
+
+        self.jobs: dict[str, LocalJobInfo] = {}
+        self.pending_job_ids: deque[str] = deque()
+        self.processes: dict[str, BaseProcess] = {}
+        self.job_slots: dict[str, int] = {}
+        self.free_slots = list(range(self.max_workers))
+
+    def launch(self, config: "Config") -> str:
+        return self.run_local_job(config).job_id
+
+    def is_running(self, config: "Config", job_id: str) -> bool:
+        self._dispatch()
+        return job_id in self.processes or job_id in self.pending_job_ids
+
+    def terminate(self, config: "Config", job_id: str) -> None:
+        if job_id in self.pending_job_ids:
+            self.pending_job_ids.remove(job_id)
+            LOCAL_LAUNCHER_LOGGER.info(f"Removed pending job {job_id}")
+            return
+
+        if job_id in self.processes:
+            self._stop(job_id)
+            self._dispatch()
+
+    def run_local_job(self, config: "Config") -> LocalJobInfo:
+        job_id = config.job_info.job_id
+        if job_id in self.jobs:
+            raise ValueError(f"Job {job_id} was launched already, jobs need unique job ids")
+
+        working_dir = os.path.join(self.working_dir_root, job_id)
+        os.makedirs(working_dir, exist_ok=True)
+        save_config_as_pickle(config, os.path.join(working_dir, f"{CONFIG_NAME}.pickle"))
+        job_info = LocalJobInfo(job_id, working_dir, os.path.join(working_dir, LOG_FILE_NAME))
+        self.jobs[job_id] = job_info
+        self.pending_job_ids.append(job_id)
+        self._dispatch()
+        return job_info
+
+    def wait(self, job_ids: Optional[list[str]] = None) -> list[LocalJobInfo]:
+        """
+        Blocks until the given jobs (all jobs by default) finished, returns their infos.
+        """
+        job_ids = list(self.jobs) if job_ids is None else job_ids
+        self._dispatch()
+        while any(job_id in self.processes or job_id in self.pending_job_ids for job_id in job_ids):
+            wait([process.sentinel for process in self.processes.values()])
+            self._dispatch()
+        return [self.jobs[job_id] for job_id in job_ids]
+
+    def close(self) -> None:
+        self.pending_job_ids.clear()
+        for job_id in list(self.processes):
+            self._stop(job_id)
+
+    def _dispatch(self) -> None:
+        # `exitcode` polls the process without blocking
+        for job_id, process in list(self.processes.items()):
+            if process.exitcode is not None:
+                self._release(job_id)
+        while self.pending_job_ids and self.free_slots:
+            self._start(self.pending_job_ids.popleft())
+
+    def _start(self, job_id: str) -> None:
+        slot = self.free_slots.pop(0)
+        job_info = self.jobs[job_id]
+        job_info.cpu_ids = self.slot_cpu_ids[slot]
+        process = multiprocessing.get_context().Process(
+            target=run_job, args=(self.task_function, job_info.working_dir, job_info.cpu_ids), name=job_id
+        )
+        process.start()
+        job_info.pid = process.pid
+        self.processes[job_id] = process
+        self.job_slots[job_id] = slot
+        LOCAL_LAUNCHER_LOGGER.info(f"Started job {job_id} (pid {process.pid}) on CPUs {job_info.cpu_ids}")
+
+    def _stop(self, job_id: str) -> None:
+        self.processes[job_id].terminate()
+        self._release(job_id)
+        LOCAL_LAUNCHER_LOGGER.info(f"Terminated job {job_id}")
+
+    def _release(self, job_id: str) -> None:
+        process = self.processes.pop(job_id)
+        process.join()
+        job_info = self.jobs[job_id]
+        job_info.exit_code = process.exitcode
+        process.close()
+        self.free_slots.append(self.job_slots.pop(job_id))
+        LOCAL_LAUNCHER_LOGGER.info(f"Job {job_id} exited with code {job_info.exit_code}, logs: {job_info.log_path}")
+
+
+def run_job(task_function_path: str, working_dir: str, cpu_ids: list[int]) -> None:
+    """
+    Runs in the job's process: pins it to `cpu_ids`, redirects its output to the job's log, changes into the job's
+    working dir and calls the task function (undecorated, see `get_pickle_config`) with the job's config.
+    """
+    working_dir = os.path.abspath(working_dir)
+    logging_config_path = os.path.abspath(LOGGING_CONFIG_PATH)
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cpu_ids)
+    for variable in THREAD_COUNT_VARIABLES:
+        os.environ[variable] = str(len(cpu_ids))
+
+    # Redirected on the file descriptor level, so output of subprocesses and C extensions ends up in the log as well
+    log_fd = os.open(os.path.join(working_dir, LOG_FILE_NAME), os.O_WRONLY | os.O_CREAT | os.O_APPEND)
+    for fd in (1, 2):
+        os.dup2(log_fd, fd)
+    os.close(log_fd)
+    sys.stdout = open(1, "w", buffering=1, closefd=False)
+    sys.stderr = open(2, "w", buffering=1, closefd=False)
+
+    # Relative paths of the job (e.g. logs.log of the logging config) are resolved in its own working dir, and the
+    # handlers inherited from the launching process (which write to its files) are replaced
+    os.chdir(working_dir)
+    setup_logger(logging_config_path, force=True)
+
+    task_function = resolve_target(task_function_path)
+    task_function = getattr(task_function, "__wrapped__", task_function)
+    config = load_pickle_config(working_dir, CONFIG_NAME)
+    try:
+        with profile_task(config):
+            task_function(config)
+    finally:
+        # Processes of multiprocessing exit without running atexit handlers
+        stop_logger()
+
+
+def get_available_cpu_ids() -> list[int]:
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def split_cpu_ids(cpu_ids: list[int], slot_count: int) -> list[list[int]]:
+    """
+    Splits the CPUs into `slot_count` contiguous blocks, slots share CPUs only when there are less CPUs than slots.
+    """
+    if slot_count >= len(cpu_ids):
+        return [[cpu_ids[slot % len(cpu_ids)]] for slot in range(slot_count)]
+    return [
+        cpu_ids[slot * len(cpu_ids) // slot_count : (slot + 1) * len(cpu_ids) // slot_count]
+        for slot in range(slot_count)
+    ]
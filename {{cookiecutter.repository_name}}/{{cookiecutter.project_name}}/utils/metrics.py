@@ -0,0 +1,173 @@
+import json
+import math
+import os
+import socket
+import time
+
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, Type
+
+from {{cookiecutter.project_name}}.utils.io_utils import GCS_PREFIX, iter_jsonl, make_dirs, open_file
+from {{cookiecutter.project_name}}.utils.utils import get_logger
+
+if TYPE_CHECKING:
+    from {{cookiecutter.project_name}}.config_schemas.config_schema import Config
+
+METRICS_LOGGER = get_logger(__name__)
+
+HISTOGRAM_PERCENTILES = (50, 90, 99)
+
+
+class MetricsLogger:
+    """
+    Keeps counters, gauges and histograms in memory, aggregates them every `aggregation_interval_s` seconds into a
+    single record, and writes the records in batches (every `flush_every_n_intervals` intervals) as JSONL files to
+    `output_dir`. Every flush creates a new `<writer_id>-<part>.jsonl` file, because GCS objects can not be appended to.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        tags: Optional[dict[str, str]] = None,
+        aggregation_interval_s: float = 30.0,
+        flush_every_n_intervals: int = 10,
+        writer_id: Optional[str] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.output_dir = output_dir
+        self.tags = tags or {}
+        self.aggregation_interval_s = aggregation_interval_s
+        self.flush_every_n_intervals = flush_every_n_intervals
+        # The start time keeps a restarted job which got the same pid (e.g. in a container) from overwriting its parts
+        self.writer_id = writer_id or f"{socket.gethostname()}-{os.getpid()}-{int(time.time() * 1000)}"
+        self.clock = clock
+
+        self.counters: dict[str, float] = {}
+        self.gauges: dict[str, float] = {}
+        self.histograms: dict[str, list[float]] = {}
+        self.current_step = 0
+
+        self._interval_started_at = clock()
+        self._next_aggregation_at = self._interval_started_at + aggregation_interval_s
+        self._pending_records: list[dict[str, Any]] = []
+        self._part_index = 0
+
+    @classmethod
+    def from_config(cls, config: "Config", **kwargs: Any) -> "MetricsLogger":
+        output_dir = get_metrics_dir(config)
+        tags = {"job_id": config.job_info.job_id, "run_name": config.job_info.run_name}
+        return cls(
+            output_dir,
+            tags=tags,
+            aggregation_interval_s=config.metrics.aggregation_interval_s,
+            flush_every_n_intervals=config.metrics.flush_every_n_intervals,
+            **kwargs,
+        )
+
+    def increment(self, name: str, value: float = 1.0) -> None:
+        counters = self.counters
+        counters[name] = counters.get(name, 0.0) + value
+
+    def set_gauge(self, name: str, value: float) -> None:
+        self.gauges[name] = value
+
+    def observe(self, name: str, value: float) -> None:
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            self.histograms[name] = [value]
+        else:
+            histogram.append(value)
+
+    def step(self, step: Optional[int] = None) -> None:
+        self.current_step = self.current_step + 1 if step is None else step
+        if self.clock() >= self._next_aggregation_at:
+            self.aggregate()
+
+    def aggregate(self) -> None:
+        now = self.clock()
+        if self.counters or self.gauges or self.histograms:
+            record = {
+                **self.tags,
+                "step": self.current_step,
+                "timestamp": time.time(),
+                "interval_s": now - self._interval_started_at,
+                "counters": self.counters,
+                "gauges": dict(self.gauges),
+                "histograms": {name: summarize_histogram(values) for name, values in self.histograms.items() if values},
+            }
+            self._pending_records.append(record)
+            self.counters = {}
+            self.histograms = {}
+
+        self._interval_started_at = now
+        self._next_aggregation_at = now + self.aggregation_interval_s
+        if len(self._pending_records) >= self.flush_every_n_intervals:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending_records:
+            return
+
+        if not self.output_dir.startswith(GCS_PREFIX):
+            make_dirs(self.output_dir)
+        part_path = os.path.join(self.output_dir, f"{self.writer_id}-{self._part_index:06d}.jsonl")
+        lines = [json.dumps(record) + "\n" for record in self._pending_records]
+        with open_file(part_path, "w") as f:
+            f.write("".join(lines))
+
+        METRICS_LOGGER.debug(f"Flushed {len(lines)} metric records to {part_path}")
+        self._pending_records = []
+        self._part_index += 1
+
+    def close(self) -> None:
+        self.aggregate()
+        self.flush()
+
+    def __enter__(self) -> "MetricsLogger":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+def summarize_histogram(values: list[float]) -> dict[str, float]:
+    sorted_values = sorted(values)
+    count = len(sorted_values)
+    summary = {
+        "count": count,
+        "sum": sum(sorted_values),
+        "min": sorted_values[0],
+        "max": sorted_values[-1],
+    }
+    summary["mean"] = summary["sum"] / count
+    for percentile in HISTOGRAM_PERCENTILES:
+        # Nearest rank: the smallest value which is greater or equal to `percentile` percent of the values
+        summary[f"p{percentile}"] = sorted_values[max(0, math.ceil(count * percentile / 100) - 1)]
+    return summary
+
+
+def get_metrics_dir(config: "Config") -> str:
+    return os.path.join(config.infrastructure.base_path(), config.metrics.output_dir_name)
+
+
+def iter_metric_records(path: str) -> Iterator[dict[str, Any]]:
+    yield from iter_jsonl(path)
+
+
+def get_metric_value(record: dict[str, Any], name: str) -> Optional[float]:
+    """
+    Returns the gauge `name` of a record, or the mean of the histogram `name` if there is no such gauge.
+    """
+    if name in record["gauges"]:
+        value: float = record["gauges"][name]
+        return value
+    histogram = record["histograms"].get(name)
+    if histogram is None:
+        return None
+    mean: float = histogram["mean"]
+    return mean
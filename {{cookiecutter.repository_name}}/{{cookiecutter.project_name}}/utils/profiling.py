@@ -0,0 +1,235 @@
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import tracemalloc
+
+from abc import ABC, abstractmethod
+from collections import Counter
+from contextlib import contextmanager
+from io import StringIO
+from typing import TYPE_CHECKING, Iterator, Optional
+
+from {{cookiecutter.project_name}}.utils.io_utils import GCS_PREFIX, make_dirs, open_file, write_file
+from {{cookiecutter.project_name}}.utils.utils import get_logger
+
+if TYPE_CHECKING:
+    from {{cookiecutter.project_name}}.config_schemas.config_schema import Config
+    from {{cookiecutter.project_name}}.config_schemas.profiling_schema import ProfilingConfig
+
+PROFILING_LOGGER = get_logger(__name__)
+
+_ACTIVE_SESSION: Optional["ProfilingSession"] = None
+
+
+class Profiler(ABC):
+    @abstractmethod
+    def start(self) -> None:
+        ...
+
+    @abstractmethod
+    def stop(self) -> None:
+        ...
+
+    @abstractmethod
+    def save(self, output_dir: str) -> None:
+        ...
+
+    @abstractmethod
+    def summary(self, top_k: int) -> str:
+        ...
+
+
+class CProfileProfiler(Profiler):
+    def __init__(self) -> None:
+        self.profile = cProfile.Profile()
+
+    def start(self) -> None:
+        self.profile.enable()
+
+    def stop(self) -> None:
+        self.profile.disable()
+
+    def save(self, output_dir: str) -> None:
+        write_file(os.path.join(output_dir, "profile.prof"), "wb", self.profile.dump_stats)  # type: ignore
+
+    def summary(self, top_k: int) -> str:
+        stream = StringIO()
+        pstats.Stats(self.profile, stream=stream).sort_stats(pstats.SortKey.TIME).print_stats(top_k)
+        return stream.getvalue()
+
+
+class SamplingProfiler(Profiler):
+    """
+    Captures the stack of the profiled thread every `sampling_interval_s` seconds from a background thread.
+    Stacks are saved in the collapsed format ("frame;frame;frame count") understood by flame graph tools.
+    """
+
+    def __init__(self, sampling_interval_s: float) -> None:
+        self.sampling_interval_s = sampling_interval_s
+        self.stacks: Counter[str] = Counter()
+        self._thread_id = threading.get_ident()
+        self._stop_event = threading.Event()
+        self._sampling_thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread_id = threading.get_ident()
+        self._stop_event.clear()
+        self._sampling_thread = threading.Thread(target=self._sample, name="sampling-profiler", daemon=True)
+        self._sampling_thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._sampling_thread is not None:
+            self._sampling_thread.join()
+            self._sampling_thread = None
+
+    def save(self, output_dir: str) -> None:
+        lines = [f"{stack} {count}\n" for stack, count in self.stacks.most_common()]
+        with open_file(os.path.join(output_dir, "stacks.collapsed"), "w") as f:
+            f.write("".join(lines))
+
+    def summary(self, top_k: int) -> str:
+        total_samples = sum(self.stacks.values())
+        self_samples: Counter[str] = Counter()
+        for stack, count in self.stacks.items():
+            self_samples[stack.rsplit(";", 1)[-1]] += count
+
+        lines = [f"{total_samples} samples, top {top_k} frames by self samples:"]
+        for frame, count in self_samples.most_common(top_k):
+            lines.append(f"{count:>8} ({count / total_samples:6.1%})  {frame}")
+        return "\n".join(lines)
+
+    def _sample(self) -> None:
+        while not self._stop_event.wait(self.sampling_interval_s):
+            frame = sys._current_frames().get(self._thread_id)
+            frames = []
+            while frame is not None:
+                frames.append(f"{frame.f_code.co_name} ({frame.f_code.co_filename}:{frame.f_code.co_firstlineno})")
+                frame = frame.f_back
+            if frames:
+                self.stacks[";".join(reversed(frames))] += 1
+
+
+class TracemallocProfiler(Profiler):
+    def __init__(self, frame_count: int) -> None:
+        self.frame_count = frame_count
+        self.start_snapshot: Optional[tracemalloc.Snapshot] = None
+        self.stop_snapshot: Optional[tracemalloc.Snapshot] = None
+
+    def start(self) -> None:
+        tracemalloc.start(self.frame_count)
+        self.start_snapshot = tracemalloc.take_snapshot()
+
+    def stop(self) -> None:
+        self.stop_snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+    def save(self, output_dir: str) -> None:
+        if self.stop_snapshot is not None:
+            write_file(os.path.join(output_dir, "tracemalloc.snapshot"), "wb", self.stop_snapshot.dump)  # type: ignore
+
+    def summary(self, top_k: int) -> str:
+        if self.start_snapshot is None or self.stop_snapshot is None:
+            return "No tracemalloc snapshots were taken"
+
+        lines = [f"Top {top_k} allocation differences since the start of profiling:"]
+        for statistic in self.stop_snapshot.compare_to(self.start_snapshot, "lineno")[:top_k]:
+            lines.append(str(statistic))
+        return "\n".join(lines)
+
+
+class ProfilingSession:
+    """
+    Runs a profiler for steps [start_step, start_step + num_steps). Steps are counted with calls to `step()`;
+    with start_step=0 profiling starts right away, and with num_steps=None it lasts until the session is closed.
+    """
+
+    def __init__(self, config: "ProfilingConfig", output_dir: str) -> None:
+        self.config = config
+        self.output_dir = output_dir
+        self.profiler = create_profiler(config)
+        self.current_step = 0
+        self.is_running = False
+        self.has_run = False
+
+    def __enter__(self) -> "ProfilingSession":
+        if self.config.start_step == 0:
+            self.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.stop()
+        self.save()
+
+    def step(self) -> None:
+        self.current_step += 1
+        if self.current_step == self.config.start_step:
+            self.start()
+        elif self.config.num_steps is not None and self.current_step == self.config.start_step + self.config.num_steps:
+            self.stop()
+
+    def start(self) -> None:
+        if self.is_running or self.has_run:
+            return
+        PROFILING_LOGGER.info(f"Starting {self.config.mode.value} profiler at step {self.current_step}")
+        self.profiler.start()
+        self.is_running = True
+        self.has_run = True
+
+    def stop(self) -> None:
+        if not self.is_running:
+            return
+        self.profiler.stop()
+        self.is_running = False
+        PROFILING_LOGGER.info(f"Stopped {self.config.mode.value} profiler at step {self.current_step}")
+
+    def save(self) -> None:
+        if not self.has_run:
+            PROFILING_LOGGER.warning(f"Profiler never started (start_step={self.config.start_step})")
+            return
+
+        if not self.output_dir.startswith(GCS_PREFIX):
+            make_dirs(self.output_dir)
+        self.profiler.save(self.output_dir)
+
+        summary = self.profiler.summary(self.config.top_k)
+        with open_file(os.path.join(self.output_dir, "summary.txt"), "w") as f:
+            f.write(summary)
+        PROFILING_LOGGER.info(f"Profiling results saved to {self.output_dir}, hotspots:\n{summary}")
+
+
+def create_profiler(config: "ProfilingConfig") -> Profiler:
+    # Imported here, the schemas pull in pydantic which is too slow to import with every entry point
+    from {{cookiecutter.project_name}}.config_schemas.profiling_schema import ProfilerMode
+
+    if config.mode == ProfilerMode.CPROFILE:
+        return CProfileProfiler()
+    elif config.mode == ProfilerMode.SAMPLING:
+        return SamplingProfiler(config.sampling_interval_s)
+    elif config.mode == ProfilerMode.TRACEMALLOC:
+        return TracemallocProfiler(config.tracemalloc_frames)
+    raise RuntimeError(f"Unsupported profiler mode={config.mode}")
+
+
+@contextmanager
+def profile_task(config: "Config") -> Iterator[Optional[ProfilingSession]]:
+    global _ACTIVE_SESSION
+    if not config.profiling.enabled:
+        yield None
+        return
+
+    output_dir = os.path.join(config.infrastructure.base_path(), config.profiling.output_dir_name)
+    with ProfilingSession(config.profiling, output_dir) as session:
+        _ACTIVE_SESSION = session
+        try:
+            yield session
+        finally:
+            _ACTIVE_SESSION = None
+
+
+def step() -> None:
+    # Called from training/evaluation loops; a no-op unless the task runs under an enabled profiling section
+    if _ACTIVE_SESSION is not None:
+        _ACTIVE_SESSION.step()
@@ -0,0 +1,253 @@
+import time
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import TYPE_CHECKING, Optional
+
+from {{cookiecutter.project_name}}.config_schemas.sweep_schema import SweepMode
+from {{cookiecutter.project_name}}.utils.io_utils import list_paths
+from {{cookiecutter.project_name}}.utils.metrics import get_metric_value, get_metrics_dir, iter_metric_records
+from {{cookiecutter.project_name}}.utils.utils import get_logger
+
+if TYPE_CHECKING:
+    from {{cookiecutter.project_name}}.config_schemas.config_schema import Config
+    from {{cookiecutter.project_name}}.utils.job_launcher import JobLauncher
+
+SWEEP_CONTROLLER_LOGGER = get_logger(__name__)
+
+METRICS_FILE_SUFFIX = ".jsonl"
+
+
+class TrialState(Enum):
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    # Lost at a rung, its instance group is being deleted
+    STOPPING = "STOPPING"
+    STOPPED = "STOPPED"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+
+
+FINAL_TRIAL_STATES = (TrialState.STOPPED, TrialState.COMPLETED, TrialState.FAILED)
+
+
+@dataclass
+class Trial:
+    name: str
+    config: "Config"
+    state: TrialState = TrialState.PENDING
+    # Set once the trial is launched
+    cluster_id: str = ""
+    # (step, metric value) reported by the trial so far, sorted by step
+    observations: list[tuple[int, float]] = field(default_factory=list)
+    # rung index -> metric value of the trial when it reached the rung
+    rung_values: dict[int, float] = field(default_factory=dict)
+    error: Optional[str] = None
+    read_paths: set[str] = field(default_factory=set)
+
+    @property
+    def last_step(self) -> Optional[int]:
+        return self.observations[-1][0] if self.observations else None
+
+    @property
+    def last_value(self) -> Optional[float]:
+        return self.observations[-1][1] if self.observations else None
+
+    def get_value_at(self, step: int) -> Optional[float]:
+        """
+        Returns the first value reported at or after `step`.
+        """
+        for observation_step, value in self.observations:
+            if observation_step >= step:
+                return value
+        return None
+
+
+class SweepController:
+    """
+    Runs trials with asynchronous successive halving (ASHA). Rungs are at `min_resource * reduction_factor^k` steps.
+    A trial reaching a rung continues only if its metric is among the best `1 / reduction_factor` of all values
+    recorded at that rung so far, otherwise its instance group is deleted. Decisions are taken as soon as a trial
+    reaches a rung, so trials never wait for each other (the first `reduction_factor - 1` trials to reach a rung always
+    continue). Progress is read from the files written by MetricsLogger under the `base_path()` of every trial.
+    """
+
+    def __init__(
+        self,
+        trial_configs: list["Config"],
+        backend: "JobLauncher",
+        metric_name: str,
+        mode: SweepMode = SweepMode.MIN,
+        min_resource: int = 1,
+        max_resource: int = 81,
+        reduction_factor: int = 3,
+        max_concurrent_trials: int = 4,
+    ) -> None:
+        if reduction_factor < 2:
+            raise ValueError(f"reduction_factor has to be at least 2, got {reduction_factor}")
+        if not 0 < min_resource <= max_resource:
+            raise ValueError(f"Expected 0 < min_resource <= max_resource, got {min_resource} and {max_resource}")
+        trial_names = [config.job_info.job_id for config in trial_configs]
+        if len(set(trial_names)) != len(trial_names):
+            raise ValueError(f"Trials need unique job ids, their instance groups are named after them: {trial_names}")
+
+        self.trials = [Trial(name, config) for name, config in zip(trial_names, trial_configs)]
+        self.backend = backend
+        self.metric_name = metric_name
+        self.mode = mode
+        self.max_resource = max_resource
+        self.reduction_factor = reduction_factor
+        self.max_concurrent_trials = max_concurrent_trials
+
+        self.rung_milestones: list[int] = []
+        milestone = min_resource
+        while milestone < max_resource:
+            self.rung_milestones.append(milestone)
+            milestone *= reduction_factor
+        self.rung_values: list[list[float]] = [[] for _ in self.rung_milestones]
+
+    @classmethod
+    def from_config(cls, config: "Config", trial_configs: list["Config"], backend: "JobLauncher") -> "SweepController":
+        sweep_config = config.sweep
+        return cls(
+            trial_configs,
+            backend,
+            sweep_config.metric_name,
+            mode=sweep_config.mode,
+            min_resource=sweep_config.min_resource,
+            max_resource=sweep_config.max_resource,
+            reduction_factor=sweep_config.reduction_factor,
+            max_concurrent_trials=sweep_config.max_concurrent_trials,
+        )
+
+    def get_trials(self, *states: TrialState) -> list[Trial]:
+        return [trial for trial in self.trials if trial.state in states]
+
+    def is_finished(self) -> bool:
+        return all(trial.state in FINAL_TRIAL_STATES for trial in self.trials)
+
+    def get_best_trial(self) -> Optional[Trial]:
+        """
+        Returns the completed trial with the best value at `max_resource`.
+        """
+        values = {
+            trial.name: value
+            for trial in self.get_trials(TrialState.COMPLETED)
+            if (value := trial.get_value_at(self.max_resource)) is not None
+        }
+        if not values:
+            return None
+        best_trial_name = (min if self.mode == SweepMode.MIN else max)(values, key=values.__getitem__)
+        return next(trial for trial in self.trials if trial.name == best_trial_name)
+
+    def step(self) -> None:
+        """
+        Reads new metrics of the running trials, stops the ones which lost at a rung, then launches pending trials
+        into the free slots.
+        """
+        for trial in self.get_trials(TrialState.RUNNING):
+            self._update_trial(trial)
+        for trial in self.get_trials(TrialState.STOPPING):
+            self._terminate(trial)
+        self.launch_trials()
+
+    def run(self, poll_interval_s: float) -> Optional[Trial]:
+        while True:
+            self.step()
+            if self.is_finished():
+                break
+            time.sleep(poll_interval_s)
+
+        for trial in self.trials:
+            SWEEP_CONTROLLER_LOGGER.info(
+                f"Trial {trial.name}: {trial.state.value}, last step {trial.last_step}, "
+                f"{self.metric_name} {trial.last_value}"
+            )
+        return self.get_best_trial()
+
+    def launch_trials(self) -> list[Trial]:
+        free_slots = self.max_concurrent_trials - len(self.get_trials(TrialState.RUNNING, TrialState.STOPPING))
+        trials = self.get_trials(TrialState.PENDING)[: max(free_slots, 0)]
+        if not trials:
+            return []
+
+        with ThreadPoolExecutor(max_workers=len(trials)) as executor:
+            futures = {executor.submit(self.backend.launch, trial.config): trial for trial in trials}
+            for future in as_completed(futures):
+                trial = futures[future]
+                try:
+                    trial.cluster_id = future.result()
+                except Exception as exception:
+                    SWEEP_CONTROLLER_LOGGER.exception(f"Failed to launch trial {trial.name}")
+                    trial.state = TrialState.FAILED
+                    trial.error = repr(exception)
+                    continue
+                trial.state = TrialState.RUNNING
+                SWEEP_CONTROLLER_LOGGER.info(f"Launched trial {trial.name} as {trial.cluster_id}")
+        return trials
+
+    def _update_trial(self, trial: Trial) -> None:
+        # Checked before reading the metrics, so the last metrics of a finished trial are not missed
+        is_running = self.backend.is_running(trial.config, trial.cluster_id)
+        self._read_new_observations(trial)
+        promoted = self._evaluate_rungs(trial)
+        if not is_running:
+            # The startup script deletes the instance group whether the training succeeded or not
+            if trial.last_step is not None and trial.last_step >= self.max_resource:
+                trial.state = TrialState.COMPLETED
+                SWEEP_CONTROLLER_LOGGER.info(f"Trial {trial.name} completed, {self.metric_name} {trial.last_value}")
+            else:
+                trial.state = TrialState.FAILED
+                trial.error = f"Finished at step {trial.last_step}, before reaching step {self.max_resource}"
+                SWEEP_CONTROLLER_LOGGER.warning(f"Trial {trial.name} failed: {trial.error}")
+        elif not promoted:
+            trial.state = TrialState.STOPPING
+
+    def _read_new_observations(self, trial: Trial) -> None:
+        # Every flush of MetricsLogger creates a new file, so files which were read already are skipped
+        metrics_paths = list_paths(
+            get_metrics_dir(trial.config), check_path_suffix=True, path_suffix=METRICS_FILE_SUFFIX
+        )
+        for path in sorted(set(metrics_paths) - trial.read_paths):
+            for record in iter_metric_records(path):
+                value = get_metric_value(record, self.metric_name)
+                if value is not None:
+                    trial.observations.append((record["step"], value))
+            trial.read_paths.add(path)
+        trial.observations.sort(key=lambda observation: observation[0])
+
+    def _evaluate_rungs(self, trial: Trial) -> bool:
+        """
+        Records the values of the rungs the trial reached since the last update, returns False if it lost at one.
+        """
+        for rung_index, milestone in enumerate(self.rung_milestones):
+            if rung_index in trial.rung_values:
+                continue
+            value = trial.get_value_at(milestone)
+            if value is None:
+                return True
+
+            rung_values = self.rung_values[rung_index]
+            rung_values.append(value)
+            trial.rung_values[rung_index] = value
+            # The top 1 / reduction_factor is empty until the rung has `reduction_factor` values, every trial continues
+            if len(rung_values) < self.reduction_factor:
+                continue
+            kept_count = len(rung_values) // self.reduction_factor
+            cutoff = sorted(rung_values, reverse=self.mode == SweepMode.MAX)[kept_count - 1]
+            if (value > cutoff) if self.mode == SweepMode.MIN else (value < cutoff):
+                SWEEP_CONTROLLER_LOGGER.info(
+                    f"Stopping trial {trial.name} at step {milestone}: {self.metric_name} {value} is not among "
+                    f"the best {kept_count} of {len(rung_values)} trials (cutoff {cutoff})"
+                )
+                return False
+        return True
+
+    def _terminate(self, trial: Trial) -> None:
+        try:
+            self.backend.terminate(trial.config, trial.cluster_id)
+        except Exception:
+            SWEEP_CONTROLLER_LOGGER.exception(f"Failed to delete the instance group of trial {trial.name}, will retry")
+            return
+        trial.state = TrialState.STOPPED
@@ -1,31 +1,74 @@
 import logging
+import os
+import queue
 import re
 import socket
 import subprocess
 import sys
 
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Union
 
+NUMBER_PATTERN = re.compile(r"\d+")
+
 
 def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(f"[{socket.gethostname()}] {name}")
 
 
+class ForkSafeQueueHandler(QueueHandler):
+    """
+    QueueHandler that hands records directly to the listener's handlers in forked child processes,
+    because the listener's thread only exists in the process that started it.
+    """
+
+    def __init__(self, queue: "queue.SimpleQueue[logging.LogRecord]", listener: QueueListener) -> None:
+        super().__init__(queue)
+        self.listener = listener
+        self.pid = os.getpid()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if os.getpid() != self.pid:
+            self.listener.handle(record)
+        else:
+            super().emit(record)
+
+
+def start_log_queue_listener(logger: logging.Logger) -> QueueListener:
+    """
+    Moves all handlers of the given logger behind a QueueHandler, so that emitting a record only enqueues it,
+    and the actual I/O happens on the QueueListener's thread.
+    """
+    handlers = logger.handlers[:]
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+
+    for handler in handlers:
+        logger.removeHandler(handler)
+    logger.addHandler(ForkSafeQueueHandler(log_queue, listener))
+    listener.start()
+
+    return listener
+
+
 def run_shell_command(cmd: str) -> str:
     return subprocess.run(cmd, text=True, shell=True, stdout=sys.stdout, check=True).stdout
 
 
 def get_latest_filename(file_names: list[str]) -> str:
-    file_names.sort(key=lambda x: int(re.sub(r"\D", "", x)))
-    return file_names[-1]
+    # Numeric groups are compared one by one, so e.g. "epoch_10-step_1" is later than "epoch_2-step_30"
+    return max(file_names, key=lambda file_name: tuple(map(int, NUMBER_PATTERN.findall(file_name))))
 
 
 def read_lines(text_path: Union[str, Path]) -> list[str]:
-    text_path = Path(text_path)
-    lines = text_path.read_text().split("\n")
-
-    if not lines[-1]:
-        lines = lines[:-1]
+    """
+    Reads all lines of a (local or remote) text file. Use io_utils.iter_lines to process large files line by line.
+    """
+    # io_utils logs with get_logger of this module
+    from {{cookiecutter.project_name}}.utils.io_utils import iter_line_batches
 
+    lines: list[str] = []
+    for line_batch in iter_line_batches(str(text_path)):
+        lines.extend(line_batch)
     return lines